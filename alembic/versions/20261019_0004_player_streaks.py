@@ -0,0 +1,50 @@
+"""incremental player streaks and personal records
+
+Revision ID: 20261019_0004
+Revises: 20260404_0003
+Create Date: 2026-10-19 10:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20260404_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "player_streaks",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("last_game_id", sa.Integer(), nullable=True),
+        sa.Column("current_win_streak", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("longest_win_streak", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("current_loss_streak", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("longest_loss_streak", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("best_profit", sa.Integer(), nullable=True),
+        sa.Column("best_profit_game_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "current_attendance_streak", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "longest_attendance_streak", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_player_streaks_user_id", "player_streaks", ["user_id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_player_streaks_user_id", table_name="player_streaks")
+    op.drop_table("player_streaks")
@@ -0,0 +1,39 @@
+"""pre-rendered game reports
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 14:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "game_reports",
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("group_report", sa.Text(), nullable=False),
+        sa.Column("players_report", sa.Text(), nullable=False),
+        sa.Column("settlement_report", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ux_game_reports_game_id", "game_reports", ["game_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ux_game_reports_game_id", table_name="game_reports")
+    op.drop_table("game_reports")
@@ -0,0 +1,65 @@
+"""monthly rollups for date-range stats
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 16:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0007"
+down_revision = "20261019_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_player_rollups",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("games_played", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_buy_in", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("total_buy_out", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("mvp_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("games_hosted", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("best_roi", sa.Numeric(7, 2), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_monthly_player_rollups_month_user",
+        "monthly_player_rollups",
+        ["month", "user_id"],
+        unique=True,
+    )
+    op.create_table(
+        "monthly_game_rollups",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("games_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_duration", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("biggest_pot", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("biggest_pot_game_id", sa.Integer(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_monthly_game_rollups_month", "monthly_game_rollups", ["month"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_monthly_game_rollups_month", table_name="monthly_game_rollups")
+    op.drop_table("monthly_game_rollups")
+    op.drop_index(
+        "ux_monthly_player_rollups_month_user", table_name="monthly_player_rollups"
+    )
+    op.drop_table("monthly_player_rollups")
@@ -0,0 +1,48 @@
+"""bankroll running totals
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 17:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bankroll_points",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False),
+        sa.Column("played_at", sa.DateTime(), nullable=False),
+        sa.Column("net", sa.BigInteger(), nullable=False),
+        sa.Column("cumulative_net", sa.BigInteger(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_bankroll_points_user_sequence",
+        "bankroll_points",
+        ["user_id", "sequence"],
+        unique=True,
+    )
+    op.create_index("ix_bankroll_points_game_id", "bankroll_points", ["game_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bankroll_points_game_id", table_name="bankroll_points")
+    op.drop_index("ux_bankroll_points_user_sequence", table_name="bankroll_points")
+    op.drop_table("bankroll_points")
@@ -0,0 +1,70 @@
+"""year review delivery queue
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 18:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    delivery_status = postgresql.ENUM(
+        "PENDING",
+        "SENDING",
+        "SENT",
+        "FAILED",
+        name="deliverystatus",
+        create_type=False,
+    )
+    delivery_status.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "year_review_deliveries",
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("status", delivery_status, nullable=False),
+        sa.Column("message_id", sa.Integer(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_year_review_deliveries_year_user",
+        "year_review_deliveries",
+        ["year", "user_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_year_review_deliveries_status", "year_review_deliveries", ["status"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_year_review_deliveries_status", table_name="year_review_deliveries")
+    op.drop_index("ux_year_review_deliveries_year_user", table_name="year_review_deliveries")
+    op.drop_table("year_review_deliveries")
+
+    delivery_status = postgresql.ENUM(
+        "PENDING",
+        "SENDING",
+        "SENT",
+        "FAILED",
+        name="deliverystatus",
+        create_type=False,
+    )
+    delivery_status.drop(op.get_bind(), checkfirst=True)
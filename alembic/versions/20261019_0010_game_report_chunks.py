@@ -0,0 +1,26 @@
+"""message-sized chunks of stored game reports
+
+Revision ID: 20261019_0010
+Revises: 20261019_0009
+Create Date: 2026-10-19 19:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0010"
+down_revision = "20261019_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("game_reports", sa.Column("chunks", sa.ARRAY(sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("game_reports", "chunks")
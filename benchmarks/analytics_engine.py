@@ -0,0 +1,73 @@
+"""Measure analytics engine memory and query latency on synthetic history.
+
+Usage: uv run --extra analytics python benchmarks/analytics_engine.py [records]
+"""
+
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+from bot.controllers.game.analytics import build_snapshot
+
+PLAYERS_PER_GAME = 8
+YEARS = range(2016, 2026)
+
+
+def synthetic_rows(record_count: int, player_count: int = 300):
+    rng = random.Random(42)
+    game_count = record_count // PLAYERS_PER_GAME
+    record_rows = []
+    game_rows = []
+    for game_id in range(1, game_count + 1):
+        created_at = datetime(rng.choice(YEARS), rng.randint(1, 12), rng.randint(1, 28))
+        players = rng.sample(range(1, player_count + 1), PLAYERS_PER_GAME)
+        pot = 0
+        for user_id in players:
+            buy_in = rng.choice((1000, 2000, 3000, 5000))
+            buy_out = rng.randint(0, buy_in * 3)
+            roi = (Decimal(buy_out - buy_in) * 100 / Decimal(buy_in)).quantize(Decimal("0.01"))
+            record_rows.append((user_id, game_id, buy_in, buy_out, roi, created_at))
+            pot += buy_in
+        game_rows.append(
+            (game_id, created_at, players[0], players[1], pot, rng.randint(3600, 6 * 3600))
+        )
+    names = {user_id: f"Player {user_id:03d}" for user_id in range(1, player_count + 1)}
+    return record_rows, game_rows, names
+
+
+def _timed(func, repeat: int = 20) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    record_rows, game_rows, names = synthetic_rows(record_count)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    engine = build_snapshot(record_rows, game_rows)
+    build_ms = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    all_time_ms = _timed(lambda: engine.compute_stats(None, names))
+    yearly_ms = _timed(lambda: engine.compute_stats(2020, names))
+
+    print(f"records={engine.record_count} games={engine.game_count}")
+    print(f"snapshot arrays: {engine.nbytes / 1024 / 1024:.2f} MiB")
+    print(f"build from rows: {build_ms:.0f} ms (peak {peak / 1024 / 1024:.1f} MiB while building)")
+    print(f"all-time stats: {all_time_ms:.2f} ms (median)")
+    print(f"yearly stats: {yearly_ms:.2f} ms (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Measure percentile and result-spread latency on a synthetic 10-year history.
+
+Usage: uv run --extra analytics python benchmarks/stats_distribution.py [records]
+"""
+
+import sys
+
+from analytics_engine import YEARS, _timed, synthetic_rows
+
+from bot.controllers.game.analytics import build_snapshot
+
+
+def main() -> None:
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    record_rows, game_rows, names = synthetic_rows(record_count)
+    engine = build_snapshot(record_rows, game_rows)
+
+    all_time_ms = _timed(lambda: engine.compute_distribution(None, names))
+    yearly_ms = _timed(lambda: engine.compute_distribution(2020, names))
+    every_year_ms = _timed(
+        lambda: [engine.compute_distribution(year, names) for year in YEARS], repeat=5
+    )
+
+    print(f"records={engine.record_count} games={engine.game_count} years={len(YEARS)}")
+    print(f"all-time distribution with per-year pots: {all_time_ms:.2f} ms (median)")
+    print(f"yearly distribution: {yearly_ms:.2f} ms (median)")
+    print(f"every yearly distribution: {every_year_ms:.2f} ms (median)")
+
+
+if __name__ == "__main__":
+    main()
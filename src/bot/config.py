@@ -14,6 +14,20 @@ class BotConfig(BaseSettings):
     ADMIN_NAME: str
     GROUP_ID: int
     TIMEZONE: ZoneInfo = ZoneInfo("Asia/Tbilisi")
+    ANALYTICS_ENGINE: bool = False
+    REPORT_WORKER: bool = False
+    DUMP_UPDATES: bool = False
+    DUMP_SAMPLE_RATE: float = 1.0
+    DUMP_UPDATE_TYPES: str = ""
+    JOURNAL: bool = False
+    SQL_INSPECT: bool = False
+    SQL_MAX_QUERIES: int = 20
+    SQL_REPEAT_THRESHOLD: int = 3
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = 0
+    LOOP_MONITOR: bool = False
+    LOOP_LAG_THRESHOLD: float = 0.25
+    THROTTLE: str = ""
 
     model_config = assign_config_dict(prefix="BOT_")
 
@@ -21,6 +35,13 @@ class BotConfig(BaseSettings):
 class DBConfig(BaseSettings):
     URL: SecretStr
     echo: bool = False
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_RECYCLE: int = -1
+    POOL_PRE_PING: bool = False
+    STATEMENT_CACHE_SIZE: int = 100
+    WARMUP: bool = False
 
     model_config = assign_config_dict(prefix="DB_")
 
@@ -1,3 +1,8 @@
+from bot.controllers.game.bankroll import (
+    apply_game_to_bankroll,
+    get_bankroll_history,
+    rebuild_bankroll,
+)
 from bot.controllers.game.crud import (
     abort_game,
     commit_game_results_to_db,
@@ -5,6 +10,16 @@ from bot.controllers.game.crud import (
     get_active_game,
     get_game_by_id,
 )
+from bot.controllers.game.game_reports import (
+    backfill_game_reports,
+    get_game_report,
+    render_and_store_game_report,
+)
+from bot.controllers.game.leaderboard import (
+    LEADERBOARD_PAGE_SIZE,
+    get_leaderboard_page,
+    refresh_leaderboard,
+)
 from bot.controllers.game.next_game_settings import (
     NextGameSettingsSnapshot,
     consume_next_game_settings_for_new_game,
@@ -13,11 +28,38 @@ from bot.controllers.game.next_game_settings import (
     update_next_game_yearly_stats,
 )
 from bot.controllers.game.reports import (
+    SPARKLINE_WIDTH,
     format_duration,
     format_duration_with_days,
+    format_game_report,
+    format_player_bankroll,
+    format_player_streaks,
     generate_all_time_stats_report,
+    generate_leaderboard_report,
+    generate_range_stats_report,
+    generate_streak_records_report,
     generate_yearly_stats_report,
-    get_group_game_report,
+    render_group_game_report,
+    render_players_report,
+    render_settlement_report,
+    render_sparkline,
+    render_stat_card,
+    render_stat_card_description,
+    render_year_review,
+)
+from bot.controllers.game.rollups import (
+    get_range_stats,
+    parse_date_range,
+    rebuild_monthly_rollups,
+    refresh_game_month_rollups,
+    refresh_month_rollups,
+)
+from bot.controllers.game.stat_cards import (
+    INLINE_RESULTS_LIMIT,
+    StatCardCache,
+    get_stat_card_cache,
+    invalidate_stat_cards,
+    load_stat_cards,
 )
 from bot.controllers.game.stats import (
     games_hosting_count,
@@ -26,33 +68,104 @@ from bot.controllers.game.stats import (
     get_mvp_count,
     get_player_total_buy_in,
     get_player_total_buy_out,
+    get_stats_distribution,
     get_yearly_stats,
 )
-from bot.controllers.game.types import YearlyPlayerStats, YearlySummary
+from bot.controllers.game.streaks import (
+    apply_game_to_streaks,
+    get_group_streak_records,
+    get_player_streaks,
+    rebuild_streaks,
+)
+from bot.controllers.game.types import (
+    BankrollSample,
+    GroupStreakRecords,
+    LeaderboardPage,
+    LeaderboardRow,
+    PlayerResultSpread,
+    PlayerStreakStats,
+    StatCard,
+    StatsDistribution,
+    StreakRecord,
+    YearlyPlayerStats,
+    YearlySummary,
+    YearPotPercentiles,
+    YearReview,
+)
+from bot.controllers.game.year_review import build_year_reviews
 
 __all__ = [
+    "INLINE_RESULTS_LIMIT",
+    "LEADERBOARD_PAGE_SIZE",
+    "SPARKLINE_WIDTH",
+    "BankrollSample",
+    "GroupStreakRecords",
+    "LeaderboardPage",
+    "LeaderboardRow",
+    "PlayerResultSpread",
+    "PlayerStreakStats",
+    "StatCard",
+    "StatCardCache",
+    "StatsDistribution",
+    "StreakRecord",
     "YearlyPlayerStats",
     "YearlySummary",
+    "YearPotPercentiles",
+    "YearReview",
     "NextGameSettingsSnapshot",
     "abort_game",
+    "apply_game_to_bankroll",
+    "apply_game_to_streaks",
+    "backfill_game_reports",
+    "build_year_reviews",
     "commit_game_results_to_db",
     "consume_next_game_settings_for_new_game",
     "create_game",
     "format_duration",
     "format_duration_with_days",
+    "format_game_report",
+    "format_player_bankroll",
+    "format_player_streaks",
     "games_hosting_count",
     "games_playing_count",
     "generate_all_time_stats_report",
+    "generate_leaderboard_report",
+    "generate_range_stats_report",
+    "generate_streak_records_report",
     "generate_yearly_stats_report",
     "get_active_game",
     "get_all_time_stats",
+    "get_bankroll_history",
     "get_game_by_id",
+    "get_game_report",
+    "get_group_streak_records",
+    "get_leaderboard_page",
     "get_next_game_settings",
-    "get_group_game_report",
     "get_mvp_count",
     "get_player_total_buy_in",
+    "get_player_streaks",
     "get_player_total_buy_out",
+    "get_range_stats",
+    "get_stat_card_cache",
+    "get_stats_distribution",
     "get_yearly_stats",
+    "invalidate_stat_cards",
+    "load_stat_cards",
+    "parse_date_range",
+    "rebuild_bankroll",
+    "rebuild_monthly_rollups",
+    "rebuild_streaks",
+    "refresh_game_month_rollups",
+    "refresh_leaderboard",
+    "refresh_month_rollups",
+    "render_and_store_game_report",
+    "render_group_game_report",
+    "render_players_report",
+    "render_settlement_report",
+    "render_sparkline",
+    "render_stat_card",
+    "render_stat_card_description",
+    "render_year_review",
     "update_next_game_ratio",
     "update_next_game_yearly_stats",
 ]
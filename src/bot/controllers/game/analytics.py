@@ -0,0 +1,391 @@
+"""Optional columnar snapshot of finished games for vectorized stats.
+
+Enabled with BOT_ANALYTICS_ENGINE=true and the `analytics` extra (numpy). Without it,
+stats fall back to the per-request SQL in `stats._get_stats`.
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import (
+    PlayerResultSpread,
+    StatsDistribution,
+    YearlyPlayerStats,
+    YearlySummary,
+    YearPotPercentiles,
+)
+from bot.internal.context import GameStatus
+from database.models import Game, Record, User
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger(__name__)
+
+ROI_MISSING = -(2**31)
+
+RecordRow = tuple[int, int, int | None, int | None, Decimal | None, datetime]
+GameRow = tuple[int, datetime, int, int | None, int | None, int | None]
+
+_RECORD_DTYPES = {
+    "user_id": "int64",
+    "game_id": "int32",
+    "buy_in": "int32",
+    "buy_out": "int32",
+    "roi_bp": "int32",
+    "year": "int16",
+}
+_GAME_DTYPES = {
+    "game_id": "int32",
+    "year": "int16",
+    "host_id": "int64",
+    "mvp_id": "int64",
+    "total_pot": "int64",
+    "duration": "int64",
+}
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _roi_bp(roi: Decimal | None) -> int:
+    if roi is None:
+        return ROI_MISSING
+    return int((roi * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _record_columns(rows: Iterable[RecordRow]) -> dict[str, list[int]]:
+    columns: dict[str, list[int]] = {name: [] for name in _RECORD_DTYPES}
+    for user_id, game_id, buy_in, buy_out, roi, created_at in rows:
+        columns["user_id"].append(user_id)
+        columns["game_id"].append(game_id)
+        columns["buy_in"].append(buy_in or 0)
+        columns["buy_out"].append(buy_out or 0)
+        columns["roi_bp"].append(_roi_bp(roi))
+        columns["year"].append(created_at.year)
+    return columns
+
+
+def _game_columns(rows: Iterable[GameRow]) -> dict[str, list[int]]:
+    columns: dict[str, list[int]] = {name: [] for name in _GAME_DTYPES}
+    for game_id, created_at, host_id, mvp_id, total_pot, duration in rows:
+        columns["game_id"].append(game_id)
+        columns["year"].append(created_at.year)
+        columns["host_id"].append(host_id)
+        columns["mvp_id"].append(mvp_id or 0)
+        columns["total_pot"].append(total_pot or 0)
+        columns["duration"].append(duration or 0)
+    return columns
+
+
+def _to_arrays(columns: dict[str, list[int]], dtypes: dict[str, str]) -> dict[str, Any]:
+    return {name: np.asarray(columns[name], dtype=dtype) for name, dtype in dtypes.items()}
+
+
+def _stat_decimal(value) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(float(value))).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _percentiles(values, quantiles: tuple[float, ...]) -> list[Decimal | None]:
+    if values.size == 0:
+        return [None] * len(quantiles)
+    # numpy's default linear method matches SQL percentile_cont
+    return [_stat_decimal(value) for value in np.percentile(values, [q * 100 for q in quantiles])]
+
+
+def _top_ids(ids) -> tuple[list[int], int]:
+    if ids.size == 0:
+        return [], 0
+    unique_ids, counts = np.unique(ids, return_counts=True)
+    top = int(counts.max())
+    return [int(user_id) for user_id in unique_ids[counts == top]], top
+
+
+class AnalyticsEngine:
+    def __init__(self) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for the analytics engine (install the extra)")
+        self._records = _to_arrays(_record_columns([]), _RECORD_DTYPES)
+        self._games = _to_arrays(_game_columns([]), _GAME_DTYPES)
+        self.stale = True
+
+    @property
+    def record_count(self) -> int:
+        return int(self._records["user_id"].size)
+
+    @property
+    def game_count(self) -> int:
+        return int(self._games["game_id"].size)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in (*self._records.values(), *self._games.values()))
+
+    def replace(self, record_rows: Iterable[RecordRow], game_rows: Iterable[GameRow]) -> None:
+        self._records = _to_arrays(_record_columns(record_rows), _RECORD_DTYPES)
+        self._games = _to_arrays(_game_columns(game_rows), _GAME_DTYPES)
+        self.stale = False
+
+    def extend(self, record_rows: Iterable[RecordRow], game_rows: Iterable[GameRow]) -> None:
+        records = _to_arrays(_record_columns(record_rows), _RECORD_DTYPES)
+        games = _to_arrays(_game_columns(game_rows), _GAME_DTYPES)
+        self._records = {
+            name: np.concatenate((self._records[name], records[name])) for name in _RECORD_DTYPES
+        }
+        self._games = {
+            name: np.concatenate((self._games[name], games[name])) for name in _GAME_DTYPES
+        }
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; it is reloaded on the next stats request."""
+        self.stale = True
+
+    @staticmethod
+    def _records_query():
+        return (
+            select(
+                Record.user_id,
+                Record.game_id,
+                Record.buy_in,
+                Record.buy_out,
+                Record.ROI,
+                Game.created_at,
+            )
+            .join(Game, Game.id == Record.game_id)
+            .where(Game.status == GameStatus.FINISHED)
+        )
+
+    @staticmethod
+    def _games_query():
+        return select(
+            Game.id,
+            Game.created_at,
+            Game.host_id,
+            Game.mvp_id,
+            Game.total_pot,
+            Game.duration,
+        ).where(Game.status == GameStatus.FINISHED)
+
+    async def load(self, db_session: AsyncSession) -> None:
+        records_result = await db_session.execute(self._records_query())
+        games_result = await db_session.execute(self._games_query())
+        self.replace(records_result.all(), games_result.all())
+        logger.info(
+            "Analytics snapshot loaded: records=%s games=%s bytes=%s",
+            self.record_count,
+            self.game_count,
+            self.nbytes,
+        )
+
+    async def append_game(self, game_id: int, db_session: AsyncSession) -> None:
+        """Add one committed finished game to the snapshot."""
+        if self.stale or bool((self._games["game_id"] == game_id).any()):
+            return
+        records_result = await db_session.execute(
+            self._records_query().where(Record.game_id == game_id)
+        )
+        games_result = await db_session.execute(self._games_query().where(Game.id == game_id))
+        self.extend(records_result.all(), games_result.all())
+        logger.info("Analytics snapshot appended game %s: records=%s", game_id, self.record_count)
+
+    async def get_stats(
+        self, year: int | None, db_session: AsyncSession
+    ) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
+        if self.stale:
+            await self.load(db_session)
+        names_result = await db_session.execute(select(User.id, User.fullname))
+        return self.compute_stats(year, dict(names_result.all()))
+
+    def compute_stats(
+        self, year: int | None, names: dict[int, str]
+    ) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
+        records = self._records
+        games = self._games
+        if year is None:
+            record_mask = np.ones(records["year"].size, dtype=bool)
+            game_mask = np.ones(games["year"].size, dtype=bool)
+        else:
+            record_mask = records["year"] == year
+            game_mask = games["year"] == year
+
+        user_ids = records["user_id"][record_mask]
+        buy_in = records["buy_in"][record_mask]
+        buy_out = records["buy_out"][record_mask]
+        roi_bp = records["roi_bp"][record_mask]
+
+        game_ids = games["game_id"][game_mask]
+        pots = games["total_pot"][game_mask]
+        if game_ids.size:
+            biggest = np.lexsort((game_ids, -pots))[0]
+            biggest_pot, biggest_pot_game_id = int(pots[biggest]), int(game_ids[biggest])
+        else:
+            biggest_pot, biggest_pot_game_id = 0, None
+
+        players = self._player_stats(user_ids, buy_in, buy_out, names)
+
+        valid_roi = roi_bp != ROI_MISSING
+        if valid_roi.any():
+            best_bp = int(roi_bp[valid_roi].max())
+            best_single_game_roi = (Decimal(best_bp) / Decimal(100)).quantize(Decimal("0.01"))
+            best_ids = np.unique(user_ids[roi_bp == best_bp])
+            best_single_game_roi_names = sorted(
+                {names.get(int(user_id), str(user_id)) for user_id in best_ids}
+            )
+        else:
+            best_single_game_roi, best_single_game_roi_names = None, []
+
+        mvp_ids = games["mvp_id"][game_mask]
+        top_mvp_ids, top_mvp_count = _top_ids(mvp_ids[mvp_ids != 0])
+        top_host_ids, top_host_games = _top_ids(games["host_id"][game_mask])
+
+        summary = YearlySummary(
+            total_games=int(np.unique(records["game_id"][record_mask]).size),
+            total_players=int(np.unique(user_ids).size),
+            biggest_pot=biggest_pot,
+            biggest_pot_game_id=biggest_pot_game_id,
+            total_buy_in=int(buy_in.sum(dtype=np.int64)),
+            total_duration_seconds=int(games["duration"][game_mask].sum()),
+            best_single_game_roi=best_single_game_roi,
+            best_single_game_roi_names=best_single_game_roi_names,
+            top_mvp_names=[names.get(user_id, str(user_id)) for user_id in top_mvp_ids],
+            top_mvp_count=top_mvp_count,
+            top_host_names=[names.get(user_id, str(user_id)) for user_id in top_host_ids],
+            top_host_games=top_host_games,
+        )
+        return summary, players
+
+    async def get_distribution(
+        self, year: int | None, db_session: AsyncSession
+    ) -> StatsDistribution:
+        if self.stale:
+            await self.load(db_session)
+        names_result = await db_session.execute(select(User.id, User.fullname))
+        return self.compute_distribution(year, dict(names_result.all()))
+
+    def compute_distribution(self, year: int | None, names: dict[int, str]) -> StatsDistribution:
+        records = self._records
+        games = self._games
+        if year is None:
+            record_mask = np.ones(records["year"].size, dtype=bool)
+            game_mask = np.ones(games["year"].size, dtype=bool)
+        else:
+            record_mask = records["year"] == year
+            game_mask = games["year"] == year
+
+        buy_in = records["buy_in"][record_mask]
+        buy_in_median, buy_in_p90 = _percentiles(buy_in, (0.5, 0.9))
+        pot_p25, pot_median, pot_p75, pot_p90 = _percentiles(
+            games["total_pot"][game_mask], (0.25, 0.5, 0.75, 0.9)
+        )
+        pots_by_year: list[YearPotPercentiles] = []
+        if year is None:
+            for game_year in np.unique(games["year"]).tolist():
+                pots = games["total_pot"][games["year"] == game_year]
+                pots_by_year.append(
+                    YearPotPercentiles(game_year, *_percentiles(pots, (0.25, 0.5, 0.75, 0.9)))
+                )
+
+        result_spreads: list[PlayerResultSpread] = []
+        user_ids = records["user_id"][record_mask]
+        if user_ids.size:
+            net = (records["buy_out"][record_mask] - buy_in).astype(np.float64)
+            unique_ids, inverse = np.unique(user_ids, return_inverse=True)
+            counts = np.bincount(inverse)
+            sums = np.bincount(inverse, weights=net)
+            squares = np.bincount(inverse, weights=net * net)
+            for index in np.flatnonzero(counts > 1).tolist():
+                count = int(counts[index])
+                variance = (squares[index] - sums[index] ** 2 / count) / (count - 1)
+                user_id = int(unique_ids[index])
+                result_spreads.append(
+                    PlayerResultSpread(
+                        user_id=user_id,
+                        fullname=names.get(user_id, str(user_id)),
+                        games_played=count,
+                        net_stddev=_stat_decimal(np.sqrt(max(variance, 0.0))),
+                    )
+                )
+            result_spreads.sort(key=lambda spread: (-spread.net_stddev, spread.fullname))
+
+        return StatsDistribution(
+            buy_in_median=buy_in_median,
+            buy_in_p90=buy_in_p90,
+            pot_p25=pot_p25,
+            pot_median=pot_median,
+            pot_p75=pot_p75,
+            pot_p90=pot_p90,
+            result_spreads=result_spreads,
+            pots_by_year=pots_by_year,
+        )
+
+    @staticmethod
+    def _player_stats(user_ids, buy_in, buy_out, names: dict[int, str]) -> list[YearlyPlayerStats]:
+        if user_ids.size == 0:
+            return []
+        unique_ids, inverse = np.unique(user_ids, return_inverse=True)
+        games_played = np.bincount(inverse, minlength=unique_ids.size)
+        # float64 sums are exact for integer totals below 2**53
+        buy_in_totals = np.bincount(inverse, weights=buy_in).astype(np.int64)
+        buy_out_totals = np.bincount(inverse, weights=buy_out).astype(np.int64)
+
+        players: list[YearlyPlayerStats] = []
+        for index, user_id in enumerate(unique_ids.tolist()):
+            total_buy_in = int(buy_in_totals[index])
+            total_buy_out = int(buy_out_totals[index])
+            net = total_buy_out - total_buy_in
+            roi = None
+            if total_buy_in:
+                roi = ((Decimal(net) * Decimal(100)) / Decimal(total_buy_in)).quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                )
+            players.append(
+                YearlyPlayerStats(
+                    user_id=user_id,
+                    fullname=names.get(user_id, str(user_id)),
+                    games_played=int(games_played[index]),
+                    total_buy_in=total_buy_in,
+                    total_buy_out=total_buy_out,
+                    net=net,
+                    roi=roi,
+                )
+            )
+        players.sort(key=lambda player: player.fullname)
+        return players
+
+
+_engine: AnalyticsEngine | None = None
+
+
+def get_analytics_engine() -> AnalyticsEngine | None:
+    return _engine
+
+
+def enable_analytics_engine() -> AnalyticsEngine:
+    global _engine
+    if _engine is None:
+        _engine = AnalyticsEngine()
+    return _engine
+
+
+def disable_analytics_engine() -> None:
+    global _engine
+    _engine = None
+
+
+def build_snapshot(
+    record_rows: Sequence[RecordRow], game_rows: Sequence[GameRow]
+) -> AnalyticsEngine:
+    engine = AnalyticsEngine()
+    engine.replace(record_rows, game_rows)
+    return engine
@@ -0,0 +1,141 @@
+import logging
+import math
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import BankrollSample
+from bot.internal.context import GameStatus
+from database.models import BankrollPoint, Game, Record
+
+logger = logging.getLogger(__name__)
+
+
+def _sample(point: BankrollPoint) -> BankrollSample:
+    return BankrollSample(
+        sequence=point.sequence,
+        game_id=point.game_id,
+        played_at=point.played_at,
+        net=point.net,
+        cumulative_net=point.cumulative_net,
+    )
+
+
+async def apply_game_to_bankroll(game_id: int, db_session: AsyncSession) -> None:
+    """Append one running-total point per player of a finished game."""
+    played_at = await db_session.scalar(
+        select(Game.created_at).where(Game.id == game_id, Game.status == GameStatus.FINISHED)
+    )
+    if played_at is None:
+        return
+    already_applied = await db_session.scalar(
+        select(BankrollPoint.id).where(BankrollPoint.game_id == game_id).limit(1)
+    )
+    if already_applied is not None:
+        logger.warning("Bankroll already includes game %s, skipping", game_id)
+        return
+    records_result = await db_session.execute(
+        select(Record.user_id, func.coalesce(Record.net_profit, 0)).where(
+            Record.game_id == game_id
+        )
+    )
+    results = records_result.all()
+    if not results:
+        return
+    user_ids = [user_id for user_id, _ in results]
+
+    ranked = (
+        select(
+            BankrollPoint.user_id,
+            BankrollPoint.sequence,
+            BankrollPoint.cumulative_net,
+            func.row_number()
+            .over(partition_by=BankrollPoint.user_id, order_by=BankrollPoint.sequence.desc())
+            .label("position"),
+        )
+        .where(BankrollPoint.user_id.in_(user_ids))
+        .subquery()
+    )
+    latest_result = await db_session.execute(
+        select(ranked.c.user_id, ranked.c.sequence, ranked.c.cumulative_net).where(
+            ranked.c.position == 1
+        )
+    )
+    latest = {user_id: (sequence, total) for user_id, sequence, total in latest_result.all()}
+
+    for user_id, net in results:
+        sequence, total = latest.get(user_id, (0, 0))
+        db_session.add(
+            BankrollPoint(
+                user_id=user_id,
+                game_id=game_id,
+                sequence=sequence + 1,
+                played_at=played_at,
+                net=net,
+                cumulative_net=total + net,
+            )
+        )
+    await db_session.flush()
+    logger.info("Bankroll updated for game %s: players=%s", game_id, len(results))
+
+
+async def rebuild_bankroll(db_session: AsyncSession) -> int:
+    """Recompute all running totals from finished game history in one statement."""
+    await db_session.execute(delete(BankrollPoint))
+    net = func.coalesce(Record.net_profit, 0)
+    window = {"partition_by": Record.user_id, "order_by": Record.game_id}
+    source = (
+        select(
+            Record.user_id,
+            Record.game_id,
+            func.row_number().over(**window),
+            Game.created_at,
+            net,
+            func.sum(net).over(**window),
+            literal(datetime.now(UTC).replace(tzinfo=None)),
+        )
+        .join(Game, Game.id == Record.game_id)
+        .where(Game.status == GameStatus.FINISHED)
+    )
+    result = await db_session.execute(
+        insert(BankrollPoint).from_select(
+            [
+                "user_id",
+                "game_id",
+                "sequence",
+                "played_at",
+                "net",
+                "cumulative_net",
+                "created_at",
+            ],
+            source,
+        )
+    )
+    logger.info("Bankroll rebuilt: points=%s", result.rowcount)
+    return result.rowcount
+
+
+async def get_bankroll_history(
+    user_id: int, db_session: AsyncSession, max_points: int | None = None
+) -> list[BankrollSample]:
+    """Read a player's running totals; with max_points, every Nth game plus the latest."""
+    query = (
+        select(BankrollPoint)
+        .where(BankrollPoint.user_id == user_id)
+        .order_by(BankrollPoint.sequence)
+    )
+    if max_points is not None:
+        games_played = await db_session.scalar(
+            select(func.max(BankrollPoint.sequence)).where(BankrollPoint.user_id == user_id)
+        )
+        if not games_played:
+            return []
+        step = math.ceil(games_played / max_points)
+        if step > 1:
+            query = query.where(
+                (BankrollPoint.sequence % step == 0) | (BankrollPoint.sequence == games_played)
+            )
+    result = await db_session.execute(query)
+    return [_sample(point) for point in result.scalars().all()]
+
@@ -0,0 +1,108 @@
+import logging
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from bot.controllers.debt import calculate_debt_amount
+from bot.controllers.game.reports import (
+    format_game_report,
+    render_group_game_report,
+    render_players_report,
+    render_settlement_report,
+)
+from bot.internal.context import GameStatus
+from bot.internal.report_builder import split_report
+from database.models import Debt, Game, GameReport, Record, User
+
+logger = logging.getLogger(__name__)
+
+
+async def render_and_store_game_report(
+    game_id: int, db_session: AsyncSession
+) -> GameReport | None:
+    """Render all report sections for a finished game and upsert them into game_reports."""
+    game = await db_session.get(Game, game_id)
+    if game is None or game.status != GameStatus.FINISHED:
+        return None
+
+    net = func.coalesce(Record.buy_out, 0) - func.coalesce(Record.buy_in, 0)
+    players_result = await db_session.execute(
+        select(Record.user_id, User.fullname, Record.buy_in, Record.buy_out, Record.ROI)
+        .join(User, User.id == Record.user_id)
+        .where(Record.game_id == game_id)
+        .order_by(net.desc(), User.fullname)
+    )
+    players = players_result.all()
+
+    mvp_name, mvp_roi = "—", Decimal(0)
+    for user_id, fullname, _, _, roi in players:
+        if user_id == game.mvp_id:
+            mvp_name, mvp_roi = fullname, roi or Decimal(0)
+            break
+
+    debtor = aliased(User)
+    creditor = aliased(User)
+    debts_result = await db_session.execute(
+        select(debtor.fullname, creditor.fullname, Debt.amount)
+        .join(debtor, debtor.id == Debt.debtor_id)
+        .join(creditor, creditor.id == Debt.creditor_id)
+        .where(Debt.game_id == game_id)
+        .order_by(Debt.id)
+    )
+    transfers = [
+        (debtor_name, creditor_name, calculate_debt_amount(amount, game.ratio))
+        for debtor_name, creditor_name, amount in debts_result.all()
+    ]
+
+    group_report = render_group_game_report(
+        game_id, game.duration or 0, game.total_pot or 0, mvp_name, mvp_roi
+    )
+    players_report = render_players_report(
+        [(fullname, buy_in or 0, buy_out or 0) for _, fullname, buy_in, buy_out, _ in players]
+    )
+    settlement_report = render_settlement_report(transfers)
+
+    report_result = await db_session.execute(
+        select(GameReport).where(GameReport.game_id == game_id)
+    )
+    report = report_result.scalar_one_or_none()
+    if report is None:
+        report = GameReport(game_id=game_id)
+        db_session.add(report)
+    report.group_report = group_report
+    report.players_report = players_report
+    report.settlement_report = settlement_report
+    report.chunks = split_report(
+        format_game_report(group_report, players_report, settlement_report)
+    )
+    report.updated_at = datetime.now(UTC).replace(tzinfo=None)
+    await db_session.flush()
+    logger.info("Game %s report rendered and stored", game_id)
+    return report
+
+
+async def get_game_report(game_id: int, db_session: AsyncSession) -> GameReport | None:
+    """Serve a stored report; games finished before reports were stored are rendered once."""
+    result = await db_session.execute(select(GameReport).where(GameReport.game_id == game_id))
+    report = result.scalar_one_or_none()
+    if report is not None:
+        return report
+    return await render_and_store_game_report(game_id, db_session)
+
+
+async def backfill_game_reports(db_session: AsyncSession) -> int:
+    missing_result = await db_session.execute(
+        select(Game.id)
+        .outerjoin(GameReport, GameReport.game_id == Game.id)
+        .where(Game.status == GameStatus.FINISHED)
+        .where(GameReport.id.is_(None))
+        .order_by(Game.id)
+    )
+    game_ids = list(missing_result.scalars().all())
+    for game_id in game_ids:
+        await render_and_store_game_report(game_id, db_session)
+    logger.info("Game reports backfilled: %s", len(game_ids))
+    return len(game_ids)
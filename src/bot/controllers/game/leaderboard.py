@@ -0,0 +1,117 @@
+import logging
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import LeaderboardPage, LeaderboardRow
+from bot.internal.context import GameStatus, LeaderboardCategory
+from database.models import Game, LeaderboardEntry, Record, User
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_PAGE_SIZE = 20
+
+
+def _ranked(values: dict[int, Decimal]) -> list[tuple[int, int, int, Decimal]]:
+    ordered = sorted(values.items(), key=lambda item: (-item[1], item[0]))
+    ranked: list[tuple[int, int, int, Decimal]] = []
+    previous_value = None
+    rank = 0
+    for position, (user_id, value) in enumerate(ordered, start=1):
+        if value != previous_value:
+            rank = position
+            previous_value = value
+        ranked.append((position, rank, user_id, value))
+    return ranked
+
+
+async def refresh_leaderboard(db_session: AsyncSession) -> int:
+    """Recompute all leaderboard categories from finished games."""
+    players_result = await db_session.execute(
+        select(
+            Record.user_id,
+            func.count(Record.id),
+            func.coalesce(func.sum(Record.buy_in), 0),
+            func.coalesce(func.sum(Record.buy_out), 0),
+        )
+        .join(Game, Game.id == Record.game_id)
+        .where(Game.status == GameStatus.FINISHED)
+        .group_by(Record.user_id)
+    )
+    mvp_result = await db_session.execute(
+        select(Game.mvp_id, func.count(Game.id))
+        .where(Game.status == GameStatus.FINISHED)
+        .where(Game.mvp_id.isnot(None))
+        .group_by(Game.mvp_id)
+    )
+
+    values: dict[LeaderboardCategory, dict[int, Decimal]] = {
+        category: {} for category in LeaderboardCategory
+    }
+    for user_id, games_played, buy_in, buy_out in players_result.all():
+        net = buy_out - buy_in
+        values[LeaderboardCategory.NET][user_id] = Decimal(net)
+        values[LeaderboardCategory.ATTENDANCE][user_id] = Decimal(games_played)
+        if buy_in:
+            roi = (Decimal(net) * Decimal(100)) / Decimal(buy_in)
+            values[LeaderboardCategory.ROI][user_id] = roi.quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+    for user_id, mvp_count in mvp_result.all():
+        values[LeaderboardCategory.MVP][user_id] = Decimal(mvp_count)
+
+    entries = [
+        {
+            "category": category,
+            "position": position,
+            "rank": rank,
+            "user_id": user_id,
+            "value": value,
+        }
+        for category, category_values in values.items()
+        for position, rank, user_id, value in _ranked(category_values)
+    ]
+    await db_session.execute(delete(LeaderboardEntry))
+    if entries:
+        await db_session.execute(insert(LeaderboardEntry), entries)
+    logger.info("Leaderboard refreshed: entries=%s", len(entries))
+    return len(entries)
+
+
+async def get_leaderboard_page(
+    category: LeaderboardCategory,
+    db_session: AsyncSession,
+    after: int | None = None,
+    before: int | None = None,
+    page_size: int = LEADERBOARD_PAGE_SIZE,
+) -> LeaderboardPage:
+    """Fetch one page by position keyset, backwards when `before` is given."""
+    query = (
+        select(
+            LeaderboardEntry.position,
+            LeaderboardEntry.rank,
+            User.fullname,
+            LeaderboardEntry.value,
+        )
+        .join(User, User.id == LeaderboardEntry.user_id)
+        .where(LeaderboardEntry.category == category)
+        .limit(page_size + 1)
+    )
+    if before is not None:
+        query = query.where(LeaderboardEntry.position < before).order_by(
+            LeaderboardEntry.position.desc()
+        )
+    else:
+        query = query.where(LeaderboardEntry.position > (after or 0)).order_by(
+            LeaderboardEntry.position.asc()
+        )
+    result = await db_session.execute(query)
+    rows = [LeaderboardRow(*row) for row in result.all()]
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if before is not None:
+        rows.reverse()
+        return LeaderboardPage(rows=rows, has_prev=has_more, has_next=True)
+    return LeaderboardPage(rows=rows, has_prev=bool(after), has_next=has_more)
@@ -1,12 +1,32 @@
 import html
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from bot.controllers.game.crud import get_game_by_id
-from bot.controllers.game.types import YearlyPlayerStats, YearlySummary
+from bot.controllers.game.types import (
+    BankrollSample,
+    GroupStreakRecords,
+    LeaderboardPage,
+    PlayerStreakStats,
+    StatCard,
+    StatsDistribution,
+    StreakRecord,
+    YearlyPlayerStats,
+    YearlySummary,
+    YearReview,
+)
+from bot.internal.context import LeaderboardCategory
 from bot.internal.lexicon import texts
 
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+SPARKLINE_WIDTH = 24
+
+LEADERBOARD_TITLES = {
+    LeaderboardCategory.NET: "Net profit",
+    LeaderboardCategory.ROI: "ROI",
+    LeaderboardCategory.ATTENDANCE: "Games played",
+    LeaderboardCategory.MVP: "MVP awards",
+}
+
 
 def format_duration(seconds: int) -> str:
     hours, remainder = divmod(seconds, 3600)
@@ -27,8 +47,39 @@ def format_duration_with_days(seconds: int) -> str:
     return " ".join(parts)
 
 
+def _format_distribution(distribution: StatsDistribution) -> list[str]:
+    lines = []
+    if distribution.buy_in_median is not None:
+        lines.append(
+            f"Buy-in per player: median <b>{distribution.buy_in_median:.0f}</b>, "
+            f"p90 <b>{distribution.buy_in_p90:.0f}</b>"
+        )
+    if distribution.pot_median is not None:
+        lines.append(
+            f"Pot size: p25 {distribution.pot_p25:.0f} · median <b>{distribution.pot_median:.0f}</b>"
+            f" · p75 {distribution.pot_p75:.0f} · p90 {distribution.pot_p90:.0f}"
+        )
+    for pots in distribution.pots_by_year:
+        lines.append(
+            f"  {pots.year}: p25 {pots.p25:.0f} · median <b>{pots.median:.0f}</b>"
+            f" · p75 {pots.p75:.0f} · p90 {pots.p90:.0f}"
+        )
+    if distribution.result_spreads:
+        spreads = " · ".join(
+            f"{html.escape(spread.fullname)} {spread.net_stddev:.0f}"
+            for spread in distribution.result_spreads
+        )
+        lines.append(f"Result spread (σ, most volatile first): {spreads}")
+    if not lines:
+        return []
+    return ["", "<b>Distribution</b>", *lines]
+
+
 def _generate_stats_report(
-    title: str, summary: YearlySummary, players: list[YearlyPlayerStats]
+    title: str,
+    summary: YearlySummary,
+    players: list[YearlyPlayerStats],
+    distribution: StatsDistribution | None = None,
 ) -> str:
     lines = [
         f"<b>{title}</b>",
@@ -98,34 +149,193 @@ def _generate_stats_report(
         lines.append(
             f"Top host: <b>{top_host_label}</b> ({summary.top_host_games} games, {host_share:.1f}%)"
         )
+    if distribution is not None:
+        lines.extend(_format_distribution(distribution))
 
     return "\n".join(lines)
 
 
 def generate_yearly_stats_report(
-    year: int, summary: YearlySummary, players: list[YearlyPlayerStats]
+    year: int,
+    summary: YearlySummary,
+    players: list[YearlyPlayerStats],
+    distribution: StatsDistribution | None = None,
 ) -> str:
-    return _generate_stats_report(f"Year {year} summary", summary, players)
+    return _generate_stats_report(f"Year {year} summary", summary, players, distribution)
+
+
+def generate_range_stats_report(
+    start: date, end: date, summary: YearlySummary, players: list[YearlyPlayerStats]
+) -> str:
+    return _generate_stats_report(
+        f"{start.isoformat()} — {end.isoformat()} summary", summary, players
+    )
+
+
+def _format_streak_record(label: str, record: StreakRecord | None) -> str | None:
+    if record is None:
+        return None
+    names_label = html.escape(", ".join(record.names))
+    return f"{label}: <b>{names_label}</b> ({record.value})"
+
+
+def generate_streak_records_report(records: GroupStreakRecords) -> str:
+    lines = [
+        line
+        for line in (
+            _format_streak_record("Longest win streak", records.longest_win_streak),
+            _format_streak_record("Longest losing streak", records.longest_loss_streak),
+            _format_streak_record("Best single game", records.best_profit),
+            _format_streak_record("Most games in a row", records.longest_attendance_streak),
+        )
+        if line is not None
+    ]
+    if not lines:
+        return ""
+    return "\n".join(["<b>Streaks</b>", *lines])
+
+
+def format_player_streaks(streaks: PlayerStreakStats | None) -> str:
+    if streaks is None:
+        return ""
+    return texts["player_stats_streaks"].format(
+        streaks.current_win_streak,
+        streaks.longest_win_streak,
+        streaks.current_loss_streak,
+        streaks.longest_loss_streak,
+        streaks.best_profit if streaks.best_profit is not None else 0,
+        streaks.current_attendance_streak,
+        streaks.longest_attendance_streak,
+    )
+
+
+def render_sparkline(values: list[int]) -> str:
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if low == high:
+        return SPARKLINE_BLOCKS[len(SPARKLINE_BLOCKS) // 2] * len(values)
+    scale = (len(SPARKLINE_BLOCKS) - 1) / (high - low)
+    return "".join(SPARKLINE_BLOCKS[round((value - low) * scale)] for value in values)
+
+
+def format_player_bankroll(samples: list[BankrollSample]) -> str:
+    if not samples:
+        return ""
+    latest = samples[-1]
+    return texts["player_stats_bankroll"].format(
+        render_sparkline([sample.cumulative_net for sample in samples]),
+        latest.cumulative_net,
+        latest.sequence,
+    )
 
 
 def generate_all_time_stats_report(
-    summary: YearlySummary, players: list[YearlyPlayerStats]
+    summary: YearlySummary,
+    players: list[YearlyPlayerStats],
+    streaks: GroupStreakRecords | None = None,
+    distribution: StatsDistribution | None = None,
 ) -> str:
-    return _generate_stats_report("All-time summary", summary, players)
+    report = _generate_stats_report("All-time summary", summary, players, distribution)
+    if streaks is not None:
+        streaks_report = generate_streak_records_report(streaks)
+        if streaks_report:
+            report = f"{report}\n\n{streaks_report}"
+    return report
+
 
+def _format_leaderboard_value(category: LeaderboardCategory, value: Decimal) -> str:
+    if category == LeaderboardCategory.ROI:
+        return f"{value:.2f}%"
+    return f"{value:.0f}"
 
-async def get_group_game_report(
-    game_id: int, name: str, roi: Decimal, db_session: AsyncSession
+
+def generate_leaderboard_report(category: LeaderboardCategory, page: LeaderboardPage) -> str:
+    lines = [texts["leaderboard_header"].format(LEADERBOARD_TITLES[category])]
+    if not page.rows:
+        lines.append(texts["leaderboard_empty"])
+    for row in page.rows:
+        lines.append(
+            texts["leaderboard_line"].format(
+                row.rank,
+                html.escape(row.fullname),
+                _format_leaderboard_value(category, row.value),
+            )
+        )
+    return "\n".join(lines)
+
+
+def render_stat_card(card: StatCard) -> str:
+    roi = f"{card.roi:.2f}%" if card.roi is not None else "—"
+    return texts["stat_card"].format(
+        html.escape(card.fullname),
+        card.games_played,
+        card.net,
+        card.net_rank,
+        card.total_ranked,
+        roi,
+        card.mvp_count,
+    )
+
+
+def render_stat_card_description(card: StatCard) -> str:
+    return texts["stat_card_description"].format(card.net, card.games_played, card.net_rank)
+
+
+def render_group_game_report(
+    game_id: int, duration_seconds: int, total_pot: int, mvp_name: str, mvp_roi: Decimal
 ) -> str:
-    game = await get_game_by_id(game_id, db_session)
-    if game is None:
-        return texts["game_not_found"].format(game_id)
-    duration = format_duration(game.duration or 0)
-    safe_name = html.escape(name)
     return texts["global_game_report"].format(
         game_id,
-        duration,
-        game.total_pot or 0,
-        safe_name,
+        format_duration(duration_seconds),
+        total_pot,
+        html.escape(mvp_name),
+        mvp_roi,
+    )
+
+
+def render_players_report(players: list[tuple[str, int, int]]) -> str:
+    lines = [texts["game_report_players_header"]]
+    for fullname, buy_in, buy_out in players:
+        lines.append(
+            texts["game_report_player_line"].format(
+                html.escape(fullname), buy_in, buy_out, buy_out - buy_in
+            )
+        )
+    return "\n".join(lines)
+
+
+def render_settlement_report(transfers: list[tuple[str, str, Decimal]]) -> str:
+    lines = [texts["game_report_settlement_header"]]
+    if not transfers:
+        lines.append(texts["game_report_no_settlement"])
+    for debtor_name, creditor_name, amount in transfers:
+        lines.append(
+            texts["game_report_settlement_line"].format(
+                html.escape(debtor_name), html.escape(creditor_name), amount
+            )
+        )
+    return "\n".join(lines)
+
+
+def format_game_report(group_report: str, players_report: str, settlement_report: str) -> str:
+    return "\n\n".join((group_report, players_report, settlement_report))
+
+
+def render_year_review(review: YearReview) -> str:
+    roi = f"{review.roi:.2f}%" if review.roi is not None else "—"
+    text = texts["year_review"].format(
+        review.year,
+        review.games_played,
+        review.net,
         roi,
+        review.rank,
+        review.total_players,
     )
+    if review.best_game_id is not None:
+        text += texts["year_review_best_game"].format(review.best_game_net, review.best_game_id)
+    if review.rival_name is not None:
+        text += texts["year_review_rival"].format(
+            html.escape(review.rival_name), review.rival_games
+        )
+    return text
@@ -0,0 +1,403 @@
+import logging
+import re
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import (
+    MonthlyGameBucket,
+    MonthlyPlayerBucket,
+    YearlyPlayerStats,
+    YearlySummary,
+)
+from bot.internal.context import GameStatus
+from bot.internal.single_flight import single_flight
+from database.models import Game, MonthlyGameRollup, MonthlyPlayerRollup, Record, User
+
+logger = logging.getLogger(__name__)
+
+_DATE_RANGE_RE = re.compile(
+    r"^\s*(\d{4}-\d{2}-\d{2})\s*(?:\s|–|—|-|\.\.)\s*(\d{4}-\d{2}-\d{2})\s*$"
+)
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def next_month(month: date) -> date:
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+def parse_date_range(text: str | None) -> tuple[date, date] | None:
+    match = _DATE_RANGE_RE.match(text or "")
+    if match is None:
+        return None
+    try:
+        start, end = (date.fromisoformat(value) for value in match.groups())
+    except ValueError:
+        return None
+    if start > end:
+        return None
+    return start, end
+
+
+def _as_datetime(value: date) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+async def _aggregate_buckets(
+    db_session: AsyncSession,
+    start: date | None = None,
+    end: date | None = None,
+) -> tuple[list[MonthlyPlayerBucket], list[MonthlyGameBucket]]:
+    """Aggregate finished games created in [start, end) into per-month buckets."""
+    month = func.date_trunc("month", Game.created_at)
+
+    def in_range(query):
+        query = query.where(Game.status == GameStatus.FINISHED)
+        if start is not None:
+            query = query.where(Game.created_at >= _as_datetime(start))
+        if end is not None:
+            query = query.where(Game.created_at < _as_datetime(end))
+        return query
+
+    records_result = await db_session.execute(
+        in_range(
+            select(
+                month,
+                Record.user_id,
+                func.count(Record.id),
+                func.coalesce(func.sum(Record.buy_in), 0),
+                func.coalesce(func.sum(Record.buy_out), 0),
+                func.max(Record.ROI),
+            )
+            .join(Game, Game.id == Record.game_id)
+            .group_by(month, Record.user_id)
+        )
+    )
+    mvp_result = await db_session.execute(
+        in_range(
+            select(month, Game.mvp_id, func.count(Game.id))
+            .where(Game.mvp_id.isnot(None))
+            .group_by(month, Game.mvp_id)
+        )
+    )
+    host_result = await db_session.execute(
+        in_range(select(month, Game.host_id, func.count(Game.id)).group_by(month, Game.host_id))
+    )
+    games_with_records_result = await db_session.execute(
+        in_range(
+            select(month, func.count(func.distinct(Record.game_id)))
+            .join(Game, Game.id == Record.game_id)
+            .group_by(month)
+        )
+    )
+    duration_result = await db_session.execute(
+        in_range(select(month, func.coalesce(func.sum(Game.duration), 0)).group_by(month))
+    )
+    pot = func.coalesce(Game.total_pot, 0)
+    ranked_pots = in_range(
+        select(
+            month.label("month"),
+            Game.id.label("game_id"),
+            pot.label("pot"),
+            func.row_number()
+            .over(partition_by=month, order_by=(pot.desc(), Game.id.asc()))
+            .label("position"),
+        )
+    ).subquery()
+    biggest_pot_result = await db_session.execute(
+        select(ranked_pots.c.month, ranked_pots.c.game_id, ranked_pots.c.pot).where(
+            ranked_pots.c.position == 1
+        )
+    )
+
+    players: dict[tuple[date, int], MonthlyPlayerBucket] = {}
+
+    def player_bucket(bucket_month: datetime, user_id: int) -> MonthlyPlayerBucket:
+        key = (bucket_month.date(), user_id)
+        if key not in players:
+            players[key] = MonthlyPlayerBucket(month=key[0], user_id=user_id)
+        return players[key]
+
+    for bucket_month, user_id, games_played, buy_in, buy_out, best_roi in records_result.all():
+        bucket = player_bucket(bucket_month, user_id)
+        bucket.games_played = games_played
+        bucket.total_buy_in = buy_in
+        bucket.total_buy_out = buy_out
+        bucket.best_roi = best_roi
+    for bucket_month, user_id, mvp_count in mvp_result.all():
+        player_bucket(bucket_month, user_id).mvp_count = mvp_count
+    for bucket_month, user_id, games_hosted in host_result.all():
+        player_bucket(bucket_month, user_id).games_hosted = games_hosted
+
+    games: dict[date, MonthlyGameBucket] = {}
+    for bucket_month, duration in duration_result.all():
+        games[bucket_month.date()] = MonthlyGameBucket(
+            month=bucket_month.date(), total_duration=duration
+        )
+    for bucket_month, games_count in games_with_records_result.all():
+        games[bucket_month.date()].games_count = games_count
+    for bucket_month, game_id, total_pot in biggest_pot_result.all():
+        bucket = games[bucket_month.date()]
+        bucket.biggest_pot = total_pot
+        bucket.biggest_pot_game_id = game_id
+
+    return list(players.values()), list(games.values())
+
+
+def _merge_biggest_pot(bucket: MonthlyGameBucket, pot: int, game_id: int | None) -> None:
+    if game_id is None:
+        return
+    current_id = bucket.biggest_pot_game_id
+    if (
+        current_id is None
+        or pot > bucket.biggest_pot
+        or (pot == bucket.biggest_pot and game_id < current_id)
+    ):
+        bucket.biggest_pot = pot
+        bucket.biggest_pot_game_id = game_id
+
+
+def _player_values(bucket: MonthlyPlayerBucket) -> dict:
+    return {
+        "month": bucket.month,
+        "user_id": bucket.user_id,
+        "games_played": bucket.games_played,
+        "total_buy_in": bucket.total_buy_in,
+        "total_buy_out": bucket.total_buy_out,
+        "mvp_count": bucket.mvp_count,
+        "games_hosted": bucket.games_hosted,
+        "best_roi": bucket.best_roi,
+    }
+
+
+def _game_values(bucket: MonthlyGameBucket) -> dict:
+    return {
+        "month": bucket.month,
+        "games_count": bucket.games_count,
+        "total_duration": bucket.total_duration,
+        "biggest_pot": bucket.biggest_pot,
+        "biggest_pot_game_id": bucket.biggest_pot_game_id,
+    }
+
+
+async def _store_buckets(
+    players: list[MonthlyPlayerBucket],
+    games: list[MonthlyGameBucket],
+    db_session: AsyncSession,
+) -> None:
+    if players:
+        await db_session.execute(
+            insert(MonthlyPlayerRollup), [_player_values(bucket) for bucket in players]
+        )
+    if games:
+        await db_session.execute(
+            insert(MonthlyGameRollup), [_game_values(bucket) for bucket in games]
+        )
+
+
+async def refresh_month_rollups(month: date, db_session: AsyncSession) -> None:
+    """Recompute the rollup rows of one calendar month from raw records."""
+    month = month_start(month)
+    await db_session.execute(delete(MonthlyPlayerRollup).where(MonthlyPlayerRollup.month == month))
+    await db_session.execute(delete(MonthlyGameRollup).where(MonthlyGameRollup.month == month))
+    players, games = await _aggregate_buckets(db_session, month, next_month(month))
+    await _store_buckets(players, games, db_session)
+    logger.info("Monthly rollups refreshed for %s: players=%s", month, len(players))
+
+
+async def refresh_game_month_rollups(game_id: int, db_session: AsyncSession) -> None:
+    created_at = await db_session.scalar(select(Game.created_at).where(Game.id == game_id))
+    if created_at is not None:
+        await refresh_month_rollups(created_at.date(), db_session)
+
+
+async def rebuild_monthly_rollups(db_session: AsyncSession) -> int:
+    await db_session.execute(delete(MonthlyPlayerRollup))
+    await db_session.execute(delete(MonthlyGameRollup))
+    players, games = await _aggregate_buckets(db_session)
+    await _store_buckets(players, games, db_session)
+    logger.info("Monthly rollups rebuilt: months=%s players=%s", len(games), len(players))
+    return len(games)
+
+
+async def _load_rollups(
+    first_month: date, end_month: date, db_session: AsyncSession
+) -> tuple[list[MonthlyPlayerBucket], list[MonthlyGameBucket]]:
+    players_result = await db_session.execute(
+        select(MonthlyPlayerRollup).where(
+            MonthlyPlayerRollup.month >= first_month, MonthlyPlayerRollup.month < end_month
+        )
+    )
+    games_result = await db_session.execute(
+        select(MonthlyGameRollup).where(
+            MonthlyGameRollup.month >= first_month, MonthlyGameRollup.month < end_month
+        )
+    )
+    players = [
+        MonthlyPlayerBucket(
+            month=row.month,
+            user_id=row.user_id,
+            games_played=row.games_played,
+            total_buy_in=row.total_buy_in,
+            total_buy_out=row.total_buy_out,
+            mvp_count=row.mvp_count,
+            games_hosted=row.games_hosted,
+            best_roi=row.best_roi,
+        )
+        for row in players_result.scalars().all()
+    ]
+    games = [
+        MonthlyGameBucket(
+            month=row.month,
+            games_count=row.games_count,
+            total_duration=row.total_duration,
+            biggest_pot=row.biggest_pot,
+            biggest_pot_game_id=row.biggest_pot_game_id,
+        )
+        for row in games_result.scalars().all()
+    ]
+    return players, games
+
+
+def _top_names(totals: dict[int, int], names: dict[int, str]) -> tuple[list[str], int]:
+    if not totals:
+        return [], 0
+    top = max(totals.values())
+    if top <= 0:
+        return [], 0
+    top_names = [
+        names.get(user_id, str(user_id)) for user_id, value in totals.items() if value == top
+    ]
+    return top_names, top
+
+
+def compose_buckets(
+    players: list[MonthlyPlayerBucket],
+    games: list[MonthlyGameBucket],
+    names: dict[int, str],
+) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
+    """Sum month buckets into the same summary the yearly report uses."""
+    totals: dict[int, MonthlyPlayerBucket] = {}
+    for bucket in players:
+        total = totals.setdefault(
+            bucket.user_id, MonthlyPlayerBucket(month=bucket.month, user_id=bucket.user_id)
+        )
+        total.games_played += bucket.games_played
+        total.total_buy_in += bucket.total_buy_in
+        total.total_buy_out += bucket.total_buy_out
+        total.mvp_count += bucket.mvp_count
+        total.games_hosted += bucket.games_hosted
+        if bucket.best_roi is not None and (
+            total.best_roi is None or bucket.best_roi > total.best_roi
+        ):
+            total.best_roi = bucket.best_roi
+
+    biggest = MonthlyGameBucket(month=date.min)
+    games_count = 0
+    total_duration = 0
+    for bucket in games:
+        games_count += bucket.games_count
+        total_duration += bucket.total_duration
+        _merge_biggest_pot(biggest, bucket.biggest_pot, bucket.biggest_pot_game_id)
+
+    player_stats: list[YearlyPlayerStats] = []
+    for user_id, total in totals.items():
+        if total.games_played == 0:
+            continue
+        net = total.total_buy_out - total.total_buy_in
+        roi = None
+        if total.total_buy_in:
+            roi = ((Decimal(net) * Decimal(100)) / Decimal(total.total_buy_in)).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+        player_stats.append(
+            YearlyPlayerStats(
+                user_id=user_id,
+                fullname=names.get(user_id, str(user_id)),
+                games_played=total.games_played,
+                total_buy_in=total.total_buy_in,
+                total_buy_out=total.total_buy_out,
+                net=net,
+                roi=roi,
+            )
+        )
+    player_stats.sort(key=lambda player: player.fullname)
+
+    best_rois = [total.best_roi for total in totals.values() if total.best_roi is not None]
+    best_single_game_roi = max(best_rois) if best_rois else None
+    best_single_game_roi_names = sorted(
+        {
+            names.get(user_id, str(user_id))
+            for user_id, total in totals.items()
+            if best_single_game_roi is not None and total.best_roi == best_single_game_roi
+        }
+    )
+    top_mvp_names, top_mvp_count = _top_names(
+        {user_id: total.mvp_count for user_id, total in totals.items()}, names
+    )
+    top_host_names, top_host_games = _top_names(
+        {user_id: total.games_hosted for user_id, total in totals.items()}, names
+    )
+
+    summary = YearlySummary(
+        total_games=games_count,
+        total_players=len(player_stats),
+        biggest_pot=biggest.biggest_pot,
+        biggest_pot_game_id=biggest.biggest_pot_game_id,
+        total_buy_in=sum(player.total_buy_in for player in player_stats),
+        total_duration_seconds=total_duration,
+        best_single_game_roi=best_single_game_roi,
+        best_single_game_roi_names=best_single_game_roi_names,
+        top_mvp_names=top_mvp_names,
+        top_mvp_count=top_mvp_count,
+        top_host_names=top_host_names,
+        top_host_games=top_host_games,
+    )
+    return summary, player_stats
+
+
+@single_flight
+async def get_range_stats(
+    start: date, end: date, db_session: AsyncSession
+) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
+    """Stats for games created between start and end (inclusive dates).
+
+    Whole months come from the rollup tables; partial boundary months are aggregated
+    exactly from records for just the uncovered days.
+    """
+    end_exclusive = end + timedelta(days=1)
+    first_full_month = start if start.day == 1 else next_month(start)
+    full_months_end = month_start(end_exclusive)
+
+    players: list[MonthlyPlayerBucket] = []
+    games: list[MonthlyGameBucket] = []
+    spans: list[tuple[date, date]] = []
+    if first_full_month < full_months_end:
+        players, games = await _load_rollups(first_full_month, full_months_end, db_session)
+        if start < first_full_month:
+            spans.append((start, first_full_month))
+        if full_months_end < end_exclusive:
+            spans.append((full_months_end, end_exclusive))
+    else:
+        spans.append((start, end_exclusive))
+
+    for span_start, span_end in spans:
+        span_players, span_games = await _aggregate_buckets(db_session, span_start, span_end)
+        players.extend(span_players)
+        games.extend(span_games)
+
+    user_ids = {bucket.user_id for bucket in players}
+    names: dict[int, str] = {}
+    if user_ids:
+        names_result = await db_session.execute(
+            select(User.id, User.fullname).where(User.id.in_(user_ids))
+        )
+        names = dict(names_result.all())
+    return compose_buckets(players, games, names)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import StatCard
+from bot.controllers.user_directory import get_user_directory
+from bot.internal.context import LeaderboardCategory
+from database.models import LeaderboardEntry, User
+
+logger = logging.getLogger(__name__)
+
+INLINE_RESULTS_LIMIT = 50  # Telegram accepts at most 50 results per inline answer
+
+
+async def load_stat_cards(db_session: AsyncSession) -> list[StatCard]:
+    """Build a card for every ranked player from the precomputed leaderboard."""
+    result = await db_session.execute(
+        select(
+            LeaderboardEntry.category,
+            LeaderboardEntry.rank,
+            LeaderboardEntry.value,
+            User.id,
+            User.fullname,
+            User.username,
+        )
+        .join(User, User.id == LeaderboardEntry.user_id)
+        .order_by(LeaderboardEntry.category, LeaderboardEntry.position)
+    )
+    cards: dict[int, StatCard] = {}
+    for category, rank, value, user_id, fullname, username in result.all():
+        card = cards.get(user_id)
+        if card is None:
+            card = cards[user_id] = StatCard(
+                user_id=user_id,
+                fullname=fullname,
+                username=username,
+                games_played=0,
+                net=0,
+                roi=None,
+                mvp_count=0,
+                net_rank=0,
+                total_ranked=0,
+            )
+        match category:
+            case LeaderboardCategory.NET:
+                card.net = int(value)
+                card.net_rank = rank
+            case LeaderboardCategory.ROI:
+                card.roi = value
+            case LeaderboardCategory.ATTENDANCE:
+                card.games_played = int(value)
+            case LeaderboardCategory.MVP:
+                card.mvp_count = int(value)
+    ranked = [card for card in cards.values() if card.net_rank]
+    for card in ranked:
+        card.total_ranked = len(ranked)
+    return sorted(ranked, key=lambda card: (card.net_rank, card.fullname))
+
+
+class StatCardCache:
+    """In-memory stat cards, reloaded only after the stats data version changes."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._loaded_version: int | None = None
+        self._cards: list[StatCard] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return self._loaded_version != self.version
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    async def get_cards(self, session_factory: Callable[[], AsyncSession]) -> list[StatCard]:
+        if not self.stale:
+            return self._cards
+        async with self._lock:
+            if self.stale:
+                version = self.version
+                async with session_factory() as db_session:
+                    cards = await load_stat_cards(db_session)
+                self._cards, self._loaded_version = cards, version
+                logger.info("Stat cards loaded: cards=%s version=%s", len(cards), version)
+        return self._cards
+
+    async def is_member(self, user_id: int, session_factory: Callable[[], AsyncSession]) -> bool:
+        """Registered users may look up cards.
+
+        Answered from the user directory snapshot, which is reloaded only after a user
+        write, so repeat lookups by members and non-members alike cost no queries.
+        """
+        return await get_user_directory().contains(user_id, session_factory)
+
+    async def search(
+        self,
+        query: str,
+        session_factory: Callable[[], AsyncSession],
+        limit: int = INLINE_RESULTS_LIMIT,
+    ) -> list[StatCard]:
+        cards = await self.get_cards(session_factory)
+        needle = query.strip().lstrip("@").casefold()
+        if needle:
+            cards = [
+                card
+                for card in cards
+                if needle in card.fullname.casefold()
+                or (card.username and needle in card.username.casefold())
+            ]
+        return cards[:limit]
+
+
+_cache = StatCardCache()
+
+
+def get_stat_card_cache() -> StatCardCache:
+    return _cache
+
+
+def invalidate_stat_cards() -> None:
+    _cache.invalidate()
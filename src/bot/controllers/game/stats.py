@@ -1,15 +1,26 @@
 import logging
 from decimal import ROUND_HALF_UP, Decimal
 
-from sqlalchemy import extract, func, select
+from sqlalchemy import extract, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.controllers.game.types import YearlyPlayerStats, YearlySummary
+from bot.controllers.game.analytics import get_analytics_engine
+from bot.controllers.game.types import (
+    PlayerResultSpread,
+    StatsDistribution,
+    YearlyPlayerStats,
+    YearlySummary,
+    YearPotPercentiles,
+)
 from bot.internal.context import GameStatus
+from bot.internal.single_flight import single_flight
 from database.models import Game, Record, User
 
 logger = logging.getLogger(__name__)
 
+_QUANTILES = (0.25, 0.5, 0.75, 0.9)
+
 
 async def _get_stats(
     year: int | None, db_session: AsyncSession
@@ -163,16 +174,115 @@ async def _get_stats(
     return summary, players_stats
 
 
+def _stat_decimal(value: float | None) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+async def _get_distribution(year: int | None, db_session: AsyncSession) -> StatsDistribution:
+    def with_year_filter(query):
+        query = query.where(Game.status == GameStatus.FINISHED)
+        if year is None:
+            return query
+        return query.where(extract("year", Game.created_at) == year)
+
+    # one grouped pass over buy-ins (per record) and pots (per game), overall and per year
+    game_year = extract("year", Game.created_at)
+    values = union_all(
+        with_year_filter(
+            select(
+                literal("buy_in").label("kind"),
+                game_year.label("year"),
+                Record.buy_in.label("value"),
+            ).join(Game, Game.id == Record.game_id)
+        ),
+        with_year_filter(select(literal("pot"), game_year, func.coalesce(Game.total_pot, 0))),
+    ).subquery()
+    percentile_result = await db_session.execute(
+        select(
+            values.c.kind,
+            values.c.year,
+            func.percentile_cont(array(_QUANTILES)).within_group(values.c.value),
+        ).group_by(func.grouping_sets(tuple_(values.c.kind, values.c.year), tuple_(values.c.kind)))
+    )
+    overall: dict[str, list[Decimal | None]] = {}
+    pots_by_year: list[YearPotPercentiles] = []
+    for kind, row_year, percentiles in percentile_result.all():
+        quantiles = [_stat_decimal(value) for value in percentiles]
+        if row_year is None:
+            overall[kind] = quantiles
+        elif kind == "pot" and year is None:
+            pots_by_year.append(YearPotPercentiles(int(row_year), *quantiles))
+    pots_by_year.sort(key=lambda pots: pots.year)
+    _, buy_in_median, _, buy_in_p90 = overall.get("buy_in", [None] * len(_QUANTILES))
+    pot_p25, pot_median, pot_p75, pot_p90 = overall.get("pot", [None] * len(_QUANTILES))
+
+    net = func.coalesce(Record.buy_out, 0) - func.coalesce(Record.buy_in, 0)
+    spread_result = await db_session.execute(
+        with_year_filter(
+            select(User.id, User.fullname, func.count(Record.id), func.stddev_samp(net))
+            .join(Record, Record.user_id == User.id)
+            .join(Game, Game.id == Record.game_id)
+            .group_by(User.id, User.fullname)
+            .having(func.count(Record.id) > 1)
+        )
+    )
+    result_spreads = [
+        PlayerResultSpread(
+            user_id=user_id,
+            fullname=fullname,
+            games_played=games_played,
+            net_stddev=_stat_decimal(float(stddev)),
+        )
+        for user_id, fullname, games_played, stddev in spread_result.all()
+    ]
+    result_spreads.sort(key=lambda spread: (-spread.net_stddev, spread.fullname))
+
+    return StatsDistribution(
+        buy_in_median=buy_in_median,
+        buy_in_p90=buy_in_p90,
+        pot_p25=pot_p25,
+        pot_median=pot_median,
+        pot_p75=pot_p75,
+        pot_p90=pot_p90,
+        result_spreads=result_spreads,
+        pots_by_year=pots_by_year,
+    )
+
+
+async def _get_stats_with_engine(
+    year: int | None, db_session: AsyncSession
+) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
+    engine = get_analytics_engine()
+    if engine is not None:
+        return await engine.get_stats(year, db_session)
+    return await _get_stats(year, db_session)
+
+
+@single_flight
 async def get_yearly_stats(
     year: int, db_session: AsyncSession
 ) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
-    return await _get_stats(year, db_session)
+    return await _get_stats_with_engine(year, db_session)
+
+
+@single_flight
+async def get_stats_distribution(
+    year: int | None, db_session: AsyncSession
+) -> StatsDistribution:
+    """Percentiles of buy-ins and pots and per-player result spread; None year is all-time."""
+    engine = get_analytics_engine()
+    if engine is not None:
+        return await engine.get_distribution(year, db_session)
+    return await _get_distribution(year, db_session)
 
 
+@single_flight
 async def get_all_time_stats(
     db_session: AsyncSession,
 ) -> tuple[YearlySummary, list[YearlyPlayerStats]]:
-    return await _get_stats(None, db_session)
+    return await _get_stats_with_engine(None, db_session)
 
 
 async def games_hosting_count(user_id: int, db_session: AsyncSession) -> int:
@@ -0,0 +1,173 @@
+import logging
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.types import GroupStreakRecords, PlayerStreakStats, StreakRecord
+from bot.internal.context import GameStatus
+from bot.internal.single_flight import single_flight
+from database.models import Game, PlayerStreak, Record, User
+
+logger = logging.getLogger(__name__)
+
+
+def _new_streak(user_id: int) -> PlayerStreak:
+    return PlayerStreak(
+        user_id=user_id,
+        current_win_streak=0,
+        longest_win_streak=0,
+        current_loss_streak=0,
+        longest_loss_streak=0,
+        current_attendance_streak=0,
+        longest_attendance_streak=0,
+    )
+
+
+def _apply_result(streak: PlayerStreak, game_id: int, net_profit: int | None) -> None:
+    net = net_profit or 0
+    if net > 0:
+        streak.current_win_streak += 1
+        streak.current_loss_streak = 0
+    elif net < 0:
+        streak.current_loss_streak += 1
+        streak.current_win_streak = 0
+    else:
+        streak.current_win_streak = 0
+        streak.current_loss_streak = 0
+    streak.longest_win_streak = max(streak.longest_win_streak, streak.current_win_streak)
+    streak.longest_loss_streak = max(streak.longest_loss_streak, streak.current_loss_streak)
+    if streak.best_profit is None or net > streak.best_profit:
+        streak.best_profit = net
+        streak.best_profit_game_id = game_id
+    streak.last_game_id = game_id
+
+
+def _snapshot(streak: PlayerStreak) -> PlayerStreakStats:
+    return PlayerStreakStats(
+        user_id=streak.user_id,
+        current_win_streak=streak.current_win_streak,
+        longest_win_streak=streak.longest_win_streak,
+        current_loss_streak=streak.current_loss_streak,
+        longest_loss_streak=streak.longest_loss_streak,
+        best_profit=streak.best_profit,
+        best_profit_game_id=streak.best_profit_game_id,
+        current_attendance_streak=streak.current_attendance_streak,
+        longest_attendance_streak=streak.longest_attendance_streak,
+    )
+
+
+async def apply_game_to_streaks(game_id: int, db_session: AsyncSession) -> None:
+    """Advance streak state by one finished game; games must be applied in id order."""
+    records_result = await db_session.execute(
+        select(Record.user_id, Record.net_profit).where(Record.game_id == game_id)
+    )
+    results = records_result.all()
+    if not results:
+        return
+    user_ids = [user_id for user_id, _ in results]
+
+    streaks_result = await db_session.execute(
+        select(PlayerStreak).where(PlayerStreak.user_id.in_(user_ids))
+    )
+    streaks = {streak.user_id: streak for streak in streaks_result.scalars().all()}
+
+    for user_id, net_profit in results:
+        streak = streaks.get(user_id)
+        if streak is None:
+            streak = _new_streak(user_id)
+            db_session.add(streak)
+        elif streak.last_game_id is not None and streak.last_game_id >= game_id:
+            logger.warning(
+                "Streaks for user %s already include game %s, skipping", user_id, game_id
+            )
+            continue
+        _apply_result(streak, game_id, net_profit)
+        streak.current_attendance_streak += 1
+        streak.longest_attendance_streak = max(
+            streak.longest_attendance_streak, streak.current_attendance_streak
+        )
+
+    await db_session.execute(
+        update(PlayerStreak)
+        .where(PlayerStreak.user_id.not_in(user_ids))
+        .values(current_attendance_streak=0)
+    )
+    await db_session.flush()
+    logger.info("Streaks updated for game %s: players=%s", game_id, len(user_ids))
+
+
+async def rebuild_streaks(db_session: AsyncSession) -> int:
+    """Recompute all streaks from finished game history.
+
+    Longest streaks and best results cannot be decremented, so abort, deletion and
+    corrections roll back by replaying the remaining history.
+    """
+    await db_session.execute(delete(PlayerStreak))
+    records_result = await db_session.execute(
+        select(Record.game_id, Record.user_id, Record.net_profit)
+        .join(Game, Game.id == Record.game_id)
+        .where(Game.status == GameStatus.FINISHED)
+        .order_by(Record.game_id.asc(), Record.user_id.asc())
+    )
+
+    streaks: dict[int, PlayerStreak] = {}
+    last_attended: dict[int, int] = {}
+    game_index = -1
+    previous_game_id = None
+    for game_id, user_id, net_profit in records_result.all():
+        if game_id != previous_game_id:
+            game_index += 1
+            previous_game_id = game_id
+        streak = streaks.get(user_id)
+        if streak is None:
+            streak = streaks[user_id] = _new_streak(user_id)
+        _apply_result(streak, game_id, net_profit)
+        if last_attended.get(user_id) == game_index - 1:
+            streak.current_attendance_streak += 1
+        else:
+            streak.current_attendance_streak = 1
+        streak.longest_attendance_streak = max(
+            streak.longest_attendance_streak, streak.current_attendance_streak
+        )
+        last_attended[user_id] = game_index
+
+    for user_id, streak in streaks.items():
+        if last_attended[user_id] != game_index:
+            streak.current_attendance_streak = 0
+    db_session.add_all(streaks.values())
+    await db_session.flush()
+    logger.info("Streaks rebuilt: players=%s games=%s", len(streaks), game_index + 1)
+    return len(streaks)
+
+
+async def get_player_streaks(user_id: int, db_session: AsyncSession) -> PlayerStreakStats | None:
+    result = await db_session.execute(select(PlayerStreak).where(PlayerStreak.user_id == user_id))
+    streak = result.scalar_one_or_none()
+    if streak is None:
+        return None
+    return _snapshot(streak)
+
+
+def _top_record(rows: list[tuple[PlayerStreakStats, str]], field: str) -> StreakRecord | None:
+    values = [getattr(stats, field) for stats, _ in rows if getattr(stats, field) is not None]
+    if not values:
+        return None
+    best = max(values)
+    if field != "best_profit" and best <= 0:
+        return None
+    names = sorted(name for stats, name in rows if getattr(stats, field) == best)
+    return StreakRecord(value=best, names=names)
+
+
+@single_flight
+async def get_group_streak_records(db_session: AsyncSession) -> GroupStreakRecords:
+    result = await db_session.execute(
+        select(PlayerStreak, User.fullname).join(User, User.id == PlayerStreak.user_id)
+    )
+    rows = [(_snapshot(streak), fullname) for streak, fullname in result.all()]
+    return GroupStreakRecords(
+        longest_win_streak=_top_record(rows, "longest_win_streak"),
+        longest_loss_streak=_top_record(rows, "longest_loss_streak"),
+        best_profit=_top_record(rows, "best_profit"),
+        longest_attendance_streak=_top_record(rows, "longest_attendance_streak"),
+    )
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from datetime import date, datetime
 from decimal import Decimal
 
+from bot.internal.context import ReportKind
+
 
 @dataclass(slots=True)
 class YearlySummary:
@@ -27,3 +30,141 @@ class YearlyPlayerStats:
     total_buy_out: int
     net: int
     roi: Decimal | None
+
+
+@dataclass(slots=True)
+class PlayerResultSpread:
+    user_id: int
+    fullname: str
+    games_played: int
+    net_stddev: Decimal
+
+
+@dataclass(slots=True)
+class YearPotPercentiles:
+    year: int
+    p25: Decimal
+    median: Decimal
+    p75: Decimal
+    p90: Decimal
+
+
+@dataclass(slots=True)
+class StatsDistribution:
+    buy_in_median: Decimal | None
+    buy_in_p90: Decimal | None
+    pot_p25: Decimal | None
+    pot_median: Decimal | None
+    pot_p75: Decimal | None
+    pot_p90: Decimal | None
+    result_spreads: list[PlayerResultSpread]
+    pots_by_year: list[YearPotPercentiles]  # filled for all-time stats only, oldest first
+
+
+@dataclass(slots=True)
+class PlayerStreakStats:
+    user_id: int
+    current_win_streak: int
+    longest_win_streak: int
+    current_loss_streak: int
+    longest_loss_streak: int
+    best_profit: int | None
+    best_profit_game_id: int | None
+    current_attendance_streak: int
+    longest_attendance_streak: int
+
+
+@dataclass(slots=True)
+class StreakRecord:
+    value: int
+    names: list[str]
+
+
+@dataclass(slots=True)
+class GroupStreakRecords:
+    longest_win_streak: StreakRecord | None
+    longest_loss_streak: StreakRecord | None
+    best_profit: StreakRecord | None
+    longest_attendance_streak: StreakRecord | None
+
+
+@dataclass(slots=True)
+class LeaderboardRow:
+    position: int
+    rank: int
+    fullname: str
+    value: Decimal
+
+
+@dataclass(slots=True)
+class LeaderboardPage:
+    rows: list[LeaderboardRow]
+    has_prev: bool
+    has_next: bool
+
+
+@dataclass(slots=True)
+class MonthlyPlayerBucket:
+    month: date
+    user_id: int
+    games_played: int = 0
+    total_buy_in: int = 0
+    total_buy_out: int = 0
+    mvp_count: int = 0
+    games_hosted: int = 0
+    best_roi: Decimal | None = None
+
+
+@dataclass(slots=True)
+class MonthlyGameBucket:
+    month: date
+    games_count: int = 0
+    total_duration: int = 0
+    biggest_pot: int = 0
+    biggest_pot_game_id: int | None = None
+
+
+@dataclass(slots=True)
+class BankrollSample:
+    sequence: int
+    game_id: int
+    played_at: datetime
+    net: int
+    cumulative_net: int
+
+
+@dataclass(slots=True)
+class YearReview:
+    user_id: int
+    fullname: str
+    year: int
+    games_played: int
+    net: int
+    roi: Decimal | None
+    rank: int
+    total_players: int
+    best_game_id: int | None
+    best_game_net: int | None
+    rival_name: str | None
+    rival_games: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReportJob:
+    kind: ReportKind
+    year: int | None = None
+    start: date | None = None
+    end: date | None = None
+
+
+@dataclass(slots=True)
+class StatCard:
+    user_id: int
+    fullname: str
+    username: str | None
+    games_played: int
+    net: int
+    roi: Decimal | None
+    mvp_count: int
+    net_rank: int
+    total_ranked: int
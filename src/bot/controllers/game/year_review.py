@@ -0,0 +1,124 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from bot.controllers.game.leaderboard import _ranked
+from bot.controllers.game.types import YearReview
+from bot.internal.context import GameStatus
+from database.models import Game, MonthlyPlayerRollup, Record, User
+
+logger = logging.getLogger(__name__)
+
+
+async def build_year_reviews(year: int, db_session: AsyncSession) -> list[YearReview]:
+    """Compute every player's year in review with a fixed number of set-based queries.
+
+    Totals come from the monthly rollups; best game and rival are ranked in SQL over
+    the year's records.
+    """
+    start = datetime(year, 1, 1)
+    end = datetime(year + 1, 1, 1)
+
+    totals_result = await db_session.execute(
+        select(
+            MonthlyPlayerRollup.user_id,
+            User.fullname,
+            func.sum(MonthlyPlayerRollup.games_played),
+            func.sum(MonthlyPlayerRollup.total_buy_in),
+            func.sum(MonthlyPlayerRollup.total_buy_out),
+        )
+        .join(User, User.id == MonthlyPlayerRollup.user_id)
+        .where(MonthlyPlayerRollup.month >= date(year, 1, 1))
+        .where(MonthlyPlayerRollup.month < date(year + 1, 1, 1))
+        .group_by(MonthlyPlayerRollup.user_id, User.fullname)
+        .having(func.sum(MonthlyPlayerRollup.games_played) > 0)
+    )
+    totals = {
+        user_id: (fullname, int(games_played), int(buy_in), int(buy_out))
+        for user_id, fullname, games_played, buy_in, buy_out in totals_result.all()
+    }
+    if not totals:
+        return []
+
+    in_year = (
+        Game.status == GameStatus.FINISHED,
+        Game.created_at >= start,
+        Game.created_at < end,
+    )
+    net = func.coalesce(Record.net_profit, 0)
+    ranked_games = (
+        select(
+            Record.user_id.label("user_id"),
+            Record.game_id.label("game_id"),
+            net.label("net"),
+            func.row_number()
+            .over(partition_by=Record.user_id, order_by=(net.desc(), Record.game_id.asc()))
+            .label("position"),
+        )
+        .join(Game, Game.id == Record.game_id)
+        .where(*in_year)
+        .subquery()
+    )
+    best_result = await db_session.execute(
+        select(ranked_games.c.user_id, ranked_games.c.game_id, ranked_games.c.net).where(
+            ranked_games.c.position == 1
+        )
+    )
+    best_games = {user_id: (game_id, best_net) for user_id, game_id, best_net in best_result.all()}
+
+    opponent = aliased(Record)
+    pairs_result = await db_session.execute(
+        select(Record.user_id, opponent.user_id, func.count())
+        .join(opponent, opponent.game_id == Record.game_id)
+        .join(Game, Game.id == Record.game_id)
+        .where(Record.user_id != opponent.user_id)
+        .where(*in_year)
+        .group_by(Record.user_id, opponent.user_id)
+    )
+    shared_games: dict[int, list[tuple[int, str]]] = defaultdict(list)
+    for user_id, opponent_id, games in pairs_result.all():
+        opponent_name = totals[opponent_id][0] if opponent_id in totals else str(opponent_id)
+        shared_games[user_id].append((games, opponent_name))
+    # rival: the opponent met most often, ties broken by name
+    rivals = {
+        user_id: min(candidates, key=lambda item: (-item[0], item[1]))
+        for user_id, candidates in shared_games.items()
+    }
+
+    nets = {
+        user_id: Decimal(buy_out - buy_in) for user_id, (_, _, buy_in, buy_out) in totals.items()
+    }
+    reviews: list[YearReview] = []
+    for _, rank, user_id, _ in _ranked(nets):
+        fullname, games_played, buy_in, buy_out = totals[user_id]
+        player_net = buy_out - buy_in
+        roi = None
+        if buy_in:
+            roi = ((Decimal(player_net) * Decimal(100)) / Decimal(buy_in)).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+        best_game_id, best_game_net = best_games.get(user_id, (None, None))
+        rival_games, rival_name = rivals.get(user_id, (0, None))
+        reviews.append(
+            YearReview(
+                user_id=user_id,
+                fullname=fullname,
+                year=year,
+                games_played=games_played,
+                net=player_net,
+                roi=roi,
+                rank=rank,
+                total_players=len(totals),
+                best_game_id=best_game_id,
+                best_game_net=best_game_net,
+                rival_name=rival_name,
+                rival_games=rival_games,
+            )
+        )
+    logger.info("Year %s reviews built: players=%s", year, len(reviews))
+    return reviews
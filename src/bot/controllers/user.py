@@ -2,8 +2,10 @@ import logging
 
 from aiogram.types import User as AiogramUser
 from sqlalchemy import Result, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.controllers.user_directory import mark_users_changed
 from bot.internal.lexicon import ORDER, SETTINGS_QUESTIONS
 from database.models import Record, User
 
@@ -13,11 +15,18 @@ logger = logging.getLogger(__name__)
 async def add_user_to_db(
     user: AiogramUser, db_session: AsyncSession, is_admin: bool = False
 ) -> User:
-    new_user = User(
-        id=user.id, fullname=user.full_name, username=user.username, is_admin=is_admin
+    """Insert a user; if a concurrent update inserted it first, refresh its profile instead."""
+    query = (
+        insert(User)
+        .values(id=user.id, fullname=user.full_name, username=user.username, is_admin=is_admin)
+        .on_conflict_do_update(
+            index_elements=[User.id],
+            set_={"fullname": user.full_name, "username": user.username},
+        )
+        .returning(User)
     )
-    db_session.add(new_user)
-    await db_session.flush()
+    new_user = await db_session.scalar(query, execution_options={"populate_existing": True})
+    mark_users_changed(db_session)
     logger.info(f"New user created: {new_user}")
     return new_user
 
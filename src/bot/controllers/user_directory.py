@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import Row, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database.models import User
+
+logger = logging.getLogger(__name__)
+
+_USERS_CHANGED = "users_changed"
+
+
+@dataclass(frozen=True, slots=True)
+class UserEntry:
+    id: int
+    fullname: str
+    username: str | None
+    is_admin: bool
+    IBAN: str | None
+    bank: str | None
+    name_surname: str | None
+    games_played: int
+    last_time_played: bool
+
+
+_ENTRY_COLUMNS = tuple(getattr(User, name) for name in UserEntry.__dataclass_fields__)
+
+
+def entry_from_user(user: User | Row) -> UserEntry:
+    return UserEntry(
+        id=user.id,
+        fullname=user.fullname,
+        username=user.username,
+        is_admin=user.is_admin,
+        IBAN=user.IBAN,
+        bank=user.bank,
+        name_surname=user.name_surname,
+        games_played=user.games_played or 0,
+        last_time_played=bool(user.last_time_played),
+    )
+
+
+class UserDirectory:
+    """Read-only snapshot of the whole users table, reloaded after any user write."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, UserEntry] | None = None
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self._entries = None
+
+    async def _load(self, db_session: AsyncSession) -> dict[int, UserEntry]:
+        entries = self._entries
+        if entries is not None:
+            return entries
+        async with self._lock:
+            if self._entries is None:
+                # plain column rows bypass the identity map: no stale User objects are
+                # returned and none of the caller's unflushed edits are overwritten
+                result = await db_session.execute(select(*_ENTRY_COLUMNS).order_by(User.id))
+                self._entries = {row.id: entry_from_user(row) for row in result}
+                logger.info("User directory loaded: users=%s", len(self._entries))
+            return self._entries
+
+    async def contains(self, user_id: int, session_factory: Callable[[], AsyncSession]) -> bool:
+        """Membership check that opens a session only when the snapshot must be loaded."""
+        entries = self._entries
+        if entries is None:
+            async with session_factory() as db_session:
+                entries = await self._load(db_session)
+        return user_id in entries
+
+    async def get(self, user_id: int, db_session: AsyncSession) -> UserEntry | None:
+        return (await self._load(db_session)).get(user_id)
+
+    async def all_users(self, db_session: AsyncSession) -> list[UserEntry]:
+        return list((await self._load(db_session)).values())
+
+    async def non_admin_users(
+        self, db_session: AsyncSession, exclude_ids: set[int] | None = None
+    ) -> list[UserEntry]:
+        exclude_ids = exclude_ids or set()
+        users = [
+            user
+            for user in (await self._load(db_session)).values()
+            if not user.is_admin and user.id not in exclude_ids
+        ]
+        return sorted(users, key=lambda user: user.fullname)
+
+    async def unplayed_users(self, db_session: AsyncSession) -> list[UserEntry]:
+        return [
+            user for user in (await self._load(db_session)).values() if not user.last_time_played
+        ]
+
+    async def fullname(self, user_id: int, db_session: AsyncSession) -> str | None:
+        entry = await self.get(user_id, db_session)
+        return entry.fullname if entry else None
+
+
+_directory = UserDirectory()
+
+
+def get_user_directory() -> UserDirectory:
+    return _directory
+
+
+def mark_users_changed(db_session: AsyncSession) -> None:
+    """Drop the snapshot now and again when this session's transaction ends."""
+    db_session.info[_USERS_CHANGED] = True
+    _directory.invalidate()
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_after_transaction(session: Session) -> None:
+    if session.info.pop(_USERS_CHANGED, False):
+        _directory.invalidate()
@@ -8,13 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.controllers.game import get_active_game
 from bot.controllers.record import get_record, increase_player_buy_in
-from bot.controllers.user import get_players_from_game, get_user_from_db_by_tg_id
+from bot.controllers.user import get_players_from_game
+from bot.controllers.user_directory import UserEntry, get_user_directory
 from bot.handlers.callbacks.common import _edit_or_answer, _filter_users, _get_bot_id
 from bot.internal.callbacks import AddFundsOperationType, CustomFundsConfirmCbData
 from bot.internal.context import KeyboardMode, OperationType, SinglePlayerActionType, States
 from bot.internal.keyboards import choose_single_player_kb, users_multiselect_kb
 from bot.internal.lexicon import texts
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -24,7 +24,7 @@ logger = getLogger(__name__)
 async def add_funds_handler(
     callback: CallbackQuery,
     callback_data: AddFundsOperationType,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -73,7 +73,7 @@ async def add_funds_handler(
 async def custom_funds_confirm_handler(
     callback: CallbackQuery,
     callback_data: CustomFundsConfirmCbData,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -109,7 +109,7 @@ async def custom_funds_confirm_handler(
         await state.set_state()
         await callback.message.answer(text=texts["custom_funds_not_ready"])
         return
-    player = await get_user_from_db_by_tg_id(player_id, db_session)
+    player = await get_user_directory().get(player_id, db_session)
     if player is None:
         await callback.message.answer(text=texts["custom_funds_not_ready"])
         return
@@ -9,7 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.config import settings
 from bot.controllers.debt import get_unpaid_debts_as_creditor, get_unpaid_debts_as_debtor
 from bot.controllers.game import get_active_game
-from bot.controllers.user import get_non_admin_users, get_user_from_db_by_tg_id
+from bot.controllers.user import get_user_from_db_by_tg_id
+from bot.controllers.user_directory import UserEntry, get_user_directory
 from bot.handlers.callbacks.common import (
     _edit_or_answer,
     _edit_reply_markup_or_answer,
@@ -31,12 +32,12 @@ from bot.internal.keyboards import (
 )
 from bot.internal.lexicon import texts
 from bot.internal.notify_admin import send_message_to_player
+from bot.internal.report_builder import send_chunks, send_report_text, split_report
 from bot.services.player_deletion import (
     build_delete_summary,
     delete_player_from_db,
     player_in_active_game,
 )
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -71,7 +72,7 @@ async def _kick_from_group(bot, user_id: int) -> str:
 async def delete_player_page_handler(
     callback: CallbackQuery,
     callback_data: DeletePlayerPageCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -79,7 +80,7 @@ async def delete_player_page_handler(
         await callback.message.answer(text=texts["insufficient_privileges"])
         return
     bot_id = await _get_bot_id(callback.bot)
-    players = await get_non_admin_users(
+    players = await get_user_directory().non_admin_users(
         db_session,
         exclude_ids={callback.from_user.id, bot_id},
     )
@@ -103,7 +104,7 @@ async def delete_player_page_handler(
 async def delete_player_cancel_handler(
     callback: CallbackQuery,
     callback_data: DeletePlayerCancelCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -111,7 +112,7 @@ async def delete_player_cancel_handler(
         await callback.message.answer(text=texts["insufficient_privileges"])
         return
     bot_id = await _get_bot_id(callback.bot)
-    players = await get_non_admin_users(
+    players = await get_user_directory().non_admin_users(
         db_session,
         exclude_ids={callback.from_user.id, bot_id},
     )
@@ -135,7 +136,7 @@ async def delete_player_cancel_handler(
 async def delete_player_select_handler(
     callback: CallbackQuery,
     callback_data: DeletePlayerSelectCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -170,22 +171,24 @@ async def delete_player_select_handler(
         debts_as_debtor,
         debts_as_creditor,
     )
-    await _edit_or_answer(
-        callback.message,
-        text=summary_text,
-        reply_markup=delete_player_summary_kb(
-            user_id=player.id,
-            page=callback_data.page,
-            has_debts=has_debts,
-        ),
+    keyboard = delete_player_summary_kb(
+        user_id=player.id,
+        page=callback_data.page,
+        has_debts=has_debts,
     )
+    chunks = split_report(summary_text)
+    if len(chunks) == 1:
+        await _edit_or_answer(callback.message, text=summary_text, reply_markup=keyboard)
+        return
+    await _edit_reply_markup_or_ignore(callback.message, reply_markup=None)
+    await send_chunks(callback.bot, callback.message.chat.id, chunks, reply_markup=keyboard)
 
 
 @router.callback_query(DeletePlayerProceedCbData.filter())
 async def delete_player_proceed_handler(
     callback: CallbackQuery,
     callback_data: DeletePlayerProceedCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -193,7 +196,7 @@ async def delete_player_proceed_handler(
         await callback.message.answer(text=texts["insufficient_privileges"])
         return
     bot_id = await _get_bot_id(callback.bot)
-    player = await get_user_from_db_by_tg_id(callback_data.user_id, db_session)
+    player = await get_user_directory().get(callback_data.user_id, db_session)
     if player is None:
         await callback.message.answer(text=texts["admin_delete_player_no_players"])
         return
@@ -216,7 +219,7 @@ async def delete_player_proceed_handler(
 async def delete_player_confirm_handler(
     callback: CallbackQuery,
     callback_data: DeletePlayerConfirmCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -305,12 +308,8 @@ async def delete_player_confirm_handler(
         )
     report_lines.append(texts["admin_delete_player_group_result"].format(html.escape(group_result)))
     try:
-        await send_message_to_player(
-            callback.bot,
-            user_id=admin_id,
-            fullname=user.fullname,
-            text="\n".join(report_lines),
-            disable_web_page_preview=True,
+        await send_report_text(
+            callback.bot, admin_id, "\n".join(report_lines), disable_web_page_preview=True
         )
     except Exception:
         logger.exception("Failed to send admin report for deleted user %s", result.player_id)
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.controllers.game import get_active_game
 from bot.controllers.record import get_remained_players_in_game
 from bot.controllers.user import get_players_from_game
+from bot.controllers.user_directory import UserEntry
 from bot.handlers.callbacks.common import _edit_or_answer, _filter_users, _get_bot_id
 from bot.internal.callbacks import AbortDialogCbData, FinishGameCbData
 from bot.internal.context import FinalGameAction, KeyboardMode, SinglePlayerActionType
@@ -20,7 +21,6 @@ from bot.services.photo_reminder import (
     game_has_photo,
     set_photo_warning,
 )
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -30,7 +30,7 @@ logger = getLogger(__name__)
 async def abort_game_handler(
     callback: CallbackQuery,
     callback_data: AbortDialogCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -94,7 +94,7 @@ async def _do_finalize(
 async def finish_game_handler(
     callback: CallbackQuery,
     callback_data: FinishGameCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -6,25 +6,28 @@ from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.controllers.game import (
-    generate_all_time_stats_report,
     get_active_game,
-    get_all_time_stats,
     get_next_game_settings,
 )
-from bot.controllers.user import (
-    get_all_users,
-    get_non_admin_users,
-    get_unplayed_users,
-)
+from bot.controllers.game.types import ReportJob
+from bot.controllers.user_directory import UserEntry, get_user_directory
 from bot.handlers.callbacks.common import (
     _edit_or_answer,
     _filter_users,
     _get_bot_id,
     _paginate_players,
 )
+from bot.handlers.callbacks.leaderboard import show_leaderboard
 from bot.internal.admin_menu import build_admin_menu
 from bot.internal.callbacks import CancelCbData, GameMenuCbData
-from bot.internal.context import GameAction, KeyboardMode, SinglePlayerActionType
+from bot.internal.context import (
+    GameAction,
+    KeyboardMode,
+    LeaderboardCategory,
+    ReportKind,
+    SinglePlayerActionType,
+    States,
+)
 from bot.internal.keyboards import (
     choose_single_player_kb,
     confirmation_dialog_kb,
@@ -38,7 +41,7 @@ from bot.internal.keyboards import (
     yearly_stats_confirm_kb,
 )
 from bot.internal.lexicon import buttons, texts
-from database.models import User
+from bot.services.report_worker import send_report
 
 router = Router()
 logger = getLogger(__name__)
@@ -48,7 +51,7 @@ logger = getLogger(__name__)
 async def game_menu_handler(
     callback: CallbackQuery,
     callback_data: GameMenuCbData,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -59,9 +62,10 @@ async def game_menu_handler(
 
     logger.debug("GameMenu: action=%s user_id=%s", callback_data.action, callback.from_user.id)
     bot_id = await _get_bot_id(callback.bot)
-    all_users = _filter_users(await get_all_users(db_session), {bot_id})
+    directory = get_user_directory()
     match callback_data.action:
         case GameAction.START_GAME:
+            all_users = _filter_users(await directory.all_users(db_session), {bot_id})
             await _edit_or_answer(
                 callback.message,
                 text=texts["choose_host"],
@@ -75,7 +79,7 @@ async def game_menu_handler(
                 await callback.message.answer(text=texts["no_active_game"])
                 return
             await state.update_data(chosen_for_add_players=list())
-            players_not_in_game = _filter_users(await get_unplayed_users(db_session), {bot_id})
+            players_not_in_game = _filter_users(await directory.unplayed_users(db_session), {bot_id})
             await _edit_or_answer(
                 callback.message,
                 text=buttons["add_players"],
@@ -121,9 +125,17 @@ async def game_menu_handler(
                 reply_markup=mode_selector_kb(active_game.id),
             )
         case GameAction.STATISTICS:
-            summary, players = await get_all_time_stats(db_session)
-            report = generate_all_time_stats_report(summary, players)
-            await callback.message.answer(text=report)
+            await send_report(
+                callback.bot,
+                callback.message.chat.id,
+                ReportJob(kind=ReportKind.ALL_TIME),
+                db_session,
+            )
+        case GameAction.LEADERBOARD:
+            await show_leaderboard(callback.message, LeaderboardCategory.NET, db_session)
+        case GameAction.STATS_RANGE:
+            await state.set_state(States.ENTER_STATS_RANGE)
+            await callback.message.answer(text=texts["stats_range_prompt"])
         case GameAction.NEXT_GAME_SETTINGS:
             await _edit_or_answer(
                 callback.message,
@@ -145,7 +157,7 @@ async def game_menu_handler(
                 reply_markup=yearly_stats_confirm_kb(next_game_settings.version),
             )
         case GameAction.DELETE_PLAYER:
-            players = await get_non_admin_users(
+            players = await directory.non_admin_users(
                 db_session,
                 exclude_ids={callback.from_user.id, bot_id},
             )
@@ -168,7 +180,7 @@ async def game_menu_handler(
 @router.callback_query(CancelCbData.filter())
 async def admin_cancel_handler(
     callback: CallbackQuery,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -0,0 +1,66 @@
+from logging import getLogger
+
+from aiogram import Router
+from aiogram.types import CallbackQuery
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import generate_leaderboard_report, get_leaderboard_page
+from bot.controllers.user_directory import UserEntry
+from bot.handlers.callbacks.common import _edit_or_answer
+from bot.internal.callbacks import LeaderboardCbData
+from bot.internal.context import LeaderboardCategory
+from bot.internal.keyboards import leaderboard_kb
+from bot.internal.lexicon import texts
+
+router = Router()
+logger = getLogger(__name__)
+
+
+async def show_leaderboard(
+    message,
+    category: LeaderboardCategory,
+    db_session: AsyncSession,
+    after: int | None = None,
+    before: int | None = None,
+) -> None:
+    page = await get_leaderboard_page(category, db_session, after=after, before=before)
+    first_position = page.rows[0].position if page.rows else None
+    last_position = page.rows[-1].position if page.rows else None
+    await _edit_or_answer(
+        message,
+        text=generate_leaderboard_report(category, page),
+        reply_markup=leaderboard_kb(
+            category=category,
+            first_position=first_position,
+            last_position=last_position,
+            has_prev=page.has_prev,
+            has_next=page.has_next,
+        ),
+    )
+
+
+@router.callback_query(LeaderboardCbData.filter())
+async def leaderboard_handler(
+    callback: CallbackQuery,
+    callback_data: LeaderboardCbData,
+    user: UserEntry,
+    db_session: AsyncSession,
+) -> None:
+    await callback.answer()
+    if not user.is_admin:
+        await callback.message.answer(text=texts["insufficient_privileges"])
+        return
+    logger.debug(
+        "Leaderboard: category=%s after=%s before=%s user_id=%s",
+        callback_data.category,
+        callback_data.after,
+        callback_data.before,
+        user.id,
+    )
+    await show_leaderboard(
+        callback.message,
+        callback_data.category,
+        db_session,
+        after=callback_data.after,
+        before=callback_data.before,
+    )
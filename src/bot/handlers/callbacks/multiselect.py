@@ -14,11 +14,8 @@ from bot.controllers.record import (
     increase_player_buy_in,
     update_record,
 )
-from bot.controllers.user import (
-    get_all_users,
-    get_players_from_game,
-    get_unplayed_users,
-)
+from bot.controllers.user import get_all_users, get_players_from_game
+from bot.controllers.user_directory import UserEntry, get_user_directory, mark_users_changed
 from bot.handlers.callbacks.common import (
     _edit_reply_markup_or_ignore,
     _filter_ids,
@@ -30,7 +27,6 @@ from bot.internal.context import Amount, KeyboardMode, RecordUpdateMode
 from bot.internal.keyboards import users_multiselect_kb
 from bot.internal.lexicon import texts
 from bot.services.photo_reminder import schedule_photo_reminder
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -40,7 +36,7 @@ logger = getLogger(__name__)
 async def players_multiselect_handler(
     callback: CallbackQuery,
     callback_data: PlayerCbData,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -62,10 +58,10 @@ async def players_multiselect_handler(
     data = await state.get_data()
     match callback_data.mode:
         case KeyboardMode.NEW_GAME:
-            users = await get_all_users(db_session)
+            users = await get_user_directory().all_users(db_session)
             chosen_users = _filter_ids(data.get("chosen_for_new_game", list()), bot_id)
         case KeyboardMode.ADD_PLAYERS:
-            users = await get_unplayed_users(db_session)
+            users = await get_user_directory().unplayed_users(db_session)
             chosen_users = _filter_ids(data.get("chosen_for_add_players", list()), bot_id)
         case KeyboardMode.PLAYERS_ADD_1000:
             users = await get_players_from_game(callback_data.game_id, db_session)
@@ -109,7 +105,7 @@ async def players_multiselect_handler(
 async def multiselect_further_handler(
     callback: CallbackQuery,
     callback_data: MultiselectFurtherCbData,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -187,6 +183,7 @@ async def multiselect_further_handler(
                 if user.id not in chosen_users:
                     user.last_time_played = False
             await db_session.flush()
+            mark_users_changed(db_session)
             text = texts["admin_game_created"].format(game.id)
             logger.info(
                 "Game %s: %d players added to new game with ratio=%s yearly_stats=%s",
@@ -217,6 +214,7 @@ async def multiselect_further_handler(
                     selected_user.games_played += 1
                 db_session.add(record)
             await db_session.flush()
+            mark_users_changed(db_session)
             text = texts["admin_players_added"].format(len(chosen_users), callback_data.game_id)
             logger.info(
                 "Game %s: %d players added mid-game",
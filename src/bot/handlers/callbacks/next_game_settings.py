@@ -11,6 +11,7 @@ from bot.controllers.game import (
     update_next_game_ratio,
     update_next_game_yearly_stats,
 )
+from bot.controllers.user_directory import UserEntry
 from bot.handlers.callbacks.common import _edit_or_answer
 from bot.internal.callbacks import (
     GameModeCbData,
@@ -19,7 +20,6 @@ from bot.internal.callbacks import (
 )
 from bot.internal.keyboards import next_game_menu_kb, ratio_confirm_kb, select_ratio_kb
 from bot.internal.lexicon import texts
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -29,7 +29,7 @@ logger = getLogger(__name__)
 async def game_mode_handler(
     callback: CallbackQuery,
     callback_data: GameModeCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -55,7 +55,7 @@ async def game_mode_handler(
 async def next_game_ratio_confirm_handler(
     callback: CallbackQuery,
     callback_data: NextGameRatioConfirmCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -122,7 +122,7 @@ async def next_game_ratio_confirm_handler(
 async def next_game_yearly_stats_confirm_handler(
     callback: CallbackQuery,
     callback_data: NextGameYearlyStatsConfirmCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -7,11 +7,7 @@ from aiogram.types import CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.controllers.game import get_active_game
-from bot.controllers.user import (
-    get_all_users,
-    get_last_played_users,
-    get_user_from_db_by_tg_id,
-)
+from bot.controllers.user_directory import UserEntry, get_user_directory
 from bot.handlers.callbacks.common import (
     _edit_or_answer,
     _filter_ids,
@@ -22,7 +18,6 @@ from bot.internal.callbacks import SinglePlayerActionCbData
 from bot.internal.context import KeyboardMode, SinglePlayerActionType, States
 from bot.internal.keyboards import users_multiselect_kb
 from bot.internal.lexicon import buttons, texts
-from database.models import User
 
 router = Router()
 logger = getLogger(__name__)
@@ -32,7 +27,7 @@ logger = getLogger(__name__)
 async def single_player_handler(
     callback: CallbackQuery,
     callback_data: SinglePlayerActionCbData,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ) -> None:
@@ -57,8 +52,10 @@ async def single_player_handler(
                 return
 
             await state.update_data(next_game_host_id=callback_data.player_id)
-            all_users = _filter_users(await get_all_users(db_session), {bot_id})
-            last_played_users = _filter_ids(await get_last_played_users(db_session), bot_id)
+            all_users = _filter_users(await get_user_directory().all_users(db_session), {bot_id})
+            last_played_users = _filter_ids(
+                [player.id for player in all_users if player.last_time_played], bot_id
+            )
             await state.update_data(chosen_for_new_game=last_played_users)
             await _edit_or_answer(
                 callback.message,
@@ -81,7 +78,7 @@ async def single_player_handler(
                 custom_funds_player_id=callback_data.player_id,
                 custom_funds_game_id=callback_data.game_id,
             )
-            player = await get_user_from_db_by_tg_id(callback_data.player_id, db_session)
+            player = await get_user_directory().get(callback_data.player_id, db_session)
             if player is None:
                 await callback.message.answer(text=texts["custom_funds_not_ready"])
                 return
@@ -107,7 +104,7 @@ async def single_player_handler(
                 player_id=callback_data.player_id,
                 game_id=callback_data.game_id,
             )
-            player = await get_user_from_db_by_tg_id(callback_data.player_id, db_session)
+            player = await get_user_directory().get(callback_data.player_id, db_session)
             player_name = html.escape(player.fullname) if player else "Unknown"
             await _edit_or_answer(
                 callback.message,
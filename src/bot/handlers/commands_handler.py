@@ -2,7 +2,7 @@ import html
 from decimal import ROUND_HALF_UP, Decimal
 
 from aiogram import F, Router
-from aiogram.filters import Command, CommandStart
+from aiogram.filters import Command, CommandObject, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,19 +14,34 @@ from bot.controllers.debt import (
     get_unpaid_debts_as_debtor,
 )
 from bot.controllers.game import (
+    SPARKLINE_WIDTH,
+    format_game_report,
+    format_player_bankroll,
+    format_player_streaks,
     games_hosting_count,
     games_playing_count,
     get_active_game,
+    get_bankroll_history,
+    get_game_report,
     get_mvp_count,
+    get_player_streaks,
     get_player_total_buy_in,
     get_player_total_buy_out,
+    parse_date_range,
 )
+from bot.controllers.game.types import ReportJob
 from bot.controllers.record import get_record
+from bot.controllers.user import get_user_from_db_by_tg_id
+from bot.controllers.user_directory import UserEntry, mark_users_changed
 from bot.internal.admin_menu import build_admin_menu
-from bot.internal.context import SettingsForm
+from bot.internal.context import ReportKind, SettingsForm
 from bot.internal.keyboards import debt_stats_kb, game_menu_kb
 from bot.internal.lexicon import ORDER, SETTINGS_QUESTIONS, texts
-from database.models import User
+from bot.internal.log_context import get_query_inspection
+from bot.internal.report_builder import send_chunks, split_report
+from bot.services.report_worker import send_report
+from bot.services.year_review import enqueue_year_reviews, start_year_review_delivery
+from database.database_connector import DatabaseConnector
 
 router = Router()
 
@@ -34,7 +49,7 @@ router = Router()
 @router.message(CommandStart(), F.chat.type == "private")
 async def command_handler(
     message: Message,
-    user: User,
+    user: UserEntry,
 ) -> None:
     await message.answer(
         text=texts["start_greeting"].format(html.escape(user.fullname)),
@@ -44,7 +59,7 @@ async def command_handler(
 @router.message(Command("admin"), F.chat.type == "private")
 async def admin_command(
     message: Message,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     if not user.is_admin:
@@ -60,12 +75,15 @@ async def admin_command(
 async def settings_start(
     message: Message,
     state: FSMContext,
-    user: User,
+    user: UserEntry,
+    db_session: AsyncSession,
 ):
     await state.clear()
-    user.IBAN = None
-    user.bank = None
-    user.name_surname = None
+    db_user = await get_user_from_db_by_tg_id(user.id, db_session)
+    db_user.IBAN = None
+    db_user.bank = None
+    db_user.name_surname = None
+    mark_users_changed(db_session)
     first_field = ORDER[0]
     await state.set_state(getattr(SettingsForm, first_field))
     question = SETTINGS_QUESTIONS[first_field]
@@ -82,8 +100,95 @@ async def info_command(message: Message, settings: Settings) -> None:
     )
 
 
+@router.message(Command("game"), F.chat.type == "private")
+async def game_report_command(
+    message: Message,
+    command: CommandObject,
+    db_session: AsyncSession,
+) -> None:
+    args = (command.args or "").strip()
+    if not args.isdigit():
+        await message.answer(text=texts["game_report_usage"])
+        return
+    game_id = int(args)
+    report = await get_game_report(game_id, db_session)
+    if report is None:
+        await message.answer(text=texts["game_not_found"].format(game_id))
+        return
+    chunks = report.chunks or split_report(
+        format_game_report(report.group_report, report.players_report, report.settlement_report)
+    )
+    await send_chunks(message.bot, message.chat.id, chunks)
+
+
+@router.message(Command("stats_range"), F.chat.type == "private")
+async def stats_range_command(
+    message: Message,
+    command: CommandObject,
+    user: UserEntry,
+    db_session: AsyncSession,
+) -> None:
+    if not user.is_admin:
+        await message.answer(text=texts["insufficient_privileges"])
+        return
+    date_range = parse_date_range(command.args)
+    if date_range is None:
+        await message.answer(text=texts["stats_range_invalid"])
+        return
+    start, end = date_range
+    job = ReportJob(kind=ReportKind.RANGE, start=start, end=end)
+    await send_report(message.bot, message.chat.id, job, db_session)
+
+
+@router.message(Command("year_review"), F.chat.type == "private")
+async def year_review_command(
+    message: Message,
+    command: CommandObject,
+    user: UserEntry,
+    db_session: AsyncSession,
+    db: DatabaseConnector,
+) -> None:
+    if not user.is_admin:
+        await message.answer(text=texts["insufficient_privileges"])
+        return
+    args = (command.args or "").strip()
+    if not args.isdigit():
+        await message.answer(text=texts["year_review_usage"])
+        return
+    year = int(args)
+    queued = await enqueue_year_reviews(year, db_session)
+    await db_session.commit()
+    start_year_review_delivery(message.bot, db.session_factory)
+    await message.answer(text=texts["year_review_queued"].format(year, queued))
+
+
+@router.message(Command("sql_inspect"), F.chat.type == "private")
+async def sql_inspect_command(message: Message, command: CommandObject, user: UserEntry) -> None:
+    if not user.is_admin:
+        await message.answer(text=texts["insufficient_privileges"])
+        return
+    inspection = get_query_inspection()
+    match (command.args or "").strip().lower():
+        case "on":
+            inspection.enabled = True
+        case "off":
+            inspection.enabled = False
+        case "":
+            pass
+        case _:
+            await message.answer(text=texts["sql_inspect_usage"])
+            return
+    await message.answer(
+        text=texts["sql_inspect_status"].format(
+            "on" if inspection.enabled else "off",
+            inspection.max_queries,
+            inspection.repeat_threshold,
+        )
+    )
+
+
 @router.message(Command("stats"), F.chat.type == "private")
-async def stats_command(message: Message, user: User, db_session: AsyncSession):
+async def stats_command(message: Message, user: UserEntry, db_session: AsyncSession):
     games_hosted = await games_hosting_count(user.id, db_session)
     games_played = await games_playing_count(user.id, db_session)
     mvp_count = await get_mvp_count(user.id, db_session)
@@ -125,6 +230,11 @@ async def stats_command(message: Message, user: User, db_session: AsyncSession):
             total_roi_str,
         )
 
+    streaks = await get_player_streaks(user.id, db_session)
+    stats_text += format_player_streaks(streaks)
+    bankroll = await get_bankroll_history(user.id, db_session, max_points=SPARKLINE_WIDTH)
+    stats_text += format_player_bankroll(bankroll)
+
     # Build debts section (aggregated by player)
     debts_as_debtor = await get_unpaid_debts_as_debtor(user.id, db_session)
     debts_as_creditor = await get_unpaid_debts_as_creditor(user.id, db_session)
@@ -17,6 +17,7 @@ from bot.controllers.debt import (
 )
 from bot.controllers.game import get_game_by_id
 from bot.controllers.user import get_user_from_db_by_tg_id
+from bot.controllers.user_directory import UserEntry
 from bot.handlers.callbacks.common import _edit_reply_markup_or_ignore
 from bot.internal.callbacks import DebtActionCbData, DebtStatsCbData
 from bot.internal.context import DebtAction, DebtStatsView
@@ -27,8 +28,9 @@ from bot.internal.keyboards import (
 )
 from bot.internal.lexicon import texts
 from bot.internal.notify_admin import send_message_to_player
+from bot.internal.report_builder import send_report_text
 from bot.services.debt_notification import format_username, send_debtor_notification
-from database.models import Debt, User
+from database.models import Debt
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -202,7 +204,7 @@ async def debt_handler(
 async def debt_stats_handler(
     callback: CallbackQuery,
     callback_data: DebtStatsCbData,
-    user: User,
+    user: UserEntry,
     db_session: AsyncSession,
 ) -> None:
     await callback.answer()
@@ -245,4 +247,6 @@ async def debt_stats_handler(
             )
         keyboard = debt_details_owe_me_kb(debts, user.id)
 
-    await callback.message.answer(response, reply_markup=keyboard)
+    await send_report_text(
+        callback.bot, callback.message.chat.id, response, reply_markup=keyboard
+    )
@@ -6,13 +6,13 @@ import aiogram
 from aiogram import Router
 from aiogram.types import ErrorEvent
 
-from bot.config import Settings
+from bot.internal.notify_admin import send_admin_alert
 
 router = Router()
 
 
 @router.errors()
-async def error_handler(error_event: ErrorEvent, bot: aiogram.Bot, settings: Settings):
+async def error_handler(error_event: ErrorEvent, bot: aiogram.Bot):
     exc_info = error_event.exception
     exc_traceback = "".join(
         traceback.format_exception(None, exc_info, exc_info.__traceback__),
@@ -30,7 +30,4 @@ async def error_handler(error_event: ErrorEvent, bot: aiogram.Bot, settings: Set
     )
     logging.exception("Exception: ", exc_info=exc_info)
 
-    try:
-        await bot.send_message(settings.bot.ADMIN, error_message)
-    except Exception:
-        logging.exception("Failed to send error message to admin")
+    await send_admin_alert(bot, error_message)
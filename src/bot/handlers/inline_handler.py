@@ -0,0 +1,36 @@
+import logging
+
+from aiogram import Router
+from aiogram.types import InlineQuery, InlineQueryResultArticle, InputTextMessageContent
+
+from bot.controllers.game import (
+    get_stat_card_cache,
+    render_stat_card,
+    render_stat_card_description,
+)
+from database.database_connector import DatabaseConnector
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+INLINE_CACHE_TIME = 300  # seconds Telegram may reuse an answer for the same user and query
+
+
+@router.inline_query()
+async def stats_inline_query(inline_query: InlineQuery, db: DatabaseConnector) -> None:
+    cache = get_stat_card_cache()
+    cards = []
+    if await cache.is_member(inline_query.from_user.id, db.session_factory):
+        cards = await cache.search(inline_query.query, db.session_factory)
+    results = [
+        InlineQueryResultArticle(
+            id=str(card.user_id),
+            title=card.fullname,
+            description=render_stat_card_description(card),
+            input_message_content=InputTextMessageContent(message_text=render_stat_card(card)),
+        )
+        for card in cards
+    ]
+    # Answers depend on whether the caller is a registered player, so Telegram must not
+    # share them between users.
+    await inline_query.answer(results, cache_time=INLINE_CACHE_TIME, is_personal=True)
@@ -13,6 +13,7 @@ from bot.services.photo_reminder import (
     cancel_photo_reminder,
     clear_photo_warning,
     get_reminder_info,
+    has_image,
     save_game_photo,
 )
 
@@ -101,13 +102,7 @@ async def handle_photo_reply(message: Message, db_session: AsyncSession) -> None
     if info is None:
         return
 
-    has_photo = bool(message.photo)
-    has_image_doc = (
-        message.document is not None
-        and message.document.mime_type is not None
-        and message.document.mime_type.startswith("image/")
-    )
-    if not has_photo and not has_image_doc:
+    if not has_image(message):
         return
     if await get_record(info.game_id, message.from_user.id, db_session) is None:
         await message.answer(texts["photo_upload_forbidden"].format(game_id=info.game_id))
@@ -8,13 +8,18 @@ from aiogram.types import Message
 from aiogram.utils.chat_action import ChatActionSender
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.controllers.game import get_active_game
+from bot.controllers.game import (
+    get_active_game,
+    parse_date_range,
+)
+from bot.controllers.game.types import ReportJob
 from bot.controllers.record import get_record, update_record
 from bot.controllers.user import ask_next_question, get_user_from_db_by_tg_id
-from bot.internal.context import RecordUpdateMode, SettingsForm, States
+from bot.controllers.user_directory import UserEntry, get_user_directory, mark_users_changed
+from bot.internal.context import RecordUpdateMode, ReportKind, SettingsForm, States
 from bot.internal.keyboards import custom_funds_confirm_kb
 from bot.internal.lexicon import ORDER, texts
-from database.models import User
+from bot.services.report_worker import send_report
 
 router = Router()
 logger = logging.getLogger(__name__)
@@ -52,7 +57,7 @@ async def enter_buy_out(
         await state.set_state()
         await message.answer(text=texts["game_no_longer_active"].format(game_id))
         return
-    player = await get_user_from_db_by_tg_id(player_id, db_session)
+    player = await get_user_directory().get(player_id, db_session)
     player_name = html.escape(player.fullname) if player else "Unknown"
     await update_record(
         game_id=game_id,
@@ -130,7 +135,7 @@ async def enter_custom_funds(
         )
         await message.answer(text=texts["custom_funds_invalid"])
         return
-    player = await get_user_from_db_by_tg_id(player_id, db_session)
+    player = await get_user_directory().get(player_id, db_session)
     if player is None:
         logger.warning(
             "Custom funds blocked: player missing. admin_id=%s player_id=%s game_id=%s",
@@ -157,7 +162,7 @@ async def enter_custom_funds(
 @router.message(StateFilter(SettingsForm), F.text)
 async def form_handler(
     message: Message,
-    user: User,
+    user: UserEntry,
     state: FSMContext,
     db_session: AsyncSession,
 ):
@@ -171,9 +176,10 @@ async def form_handler(
     if not user_answer:
         return
 
+    user = await get_user_from_db_by_tg_id(user.id, db_session)
     setattr(user, field, user_answer)
-    db_session.add(user)
     await db_session.flush()
+    mark_users_changed(db_session)
 
     async with ChatActionSender.typing(bot=message.bot, chat_id=message.chat.id):
         if all(getattr(user, f) for f in ORDER):
@@ -183,3 +189,20 @@ async def form_handler(
             next_field, next_question = await ask_next_question(user)
             await state.set_state(getattr(SettingsForm, next_field))
             await message.answer(next_question)
+
+
+@router.message(States.ENTER_STATS_RANGE)
+async def enter_stats_range(
+    message: Message,
+    state: FSMContext,
+    db_session: AsyncSession,
+) -> None:
+    # one attempt only: later messages must not be captured; /stats_range retries
+    await state.set_state()
+    date_range = parse_date_range(message.text)
+    if date_range is None:
+        await message.answer(text=texts["stats_range_invalid"])
+        return
+    start, end = date_range
+    job = ReportJob(kind=ReportKind.RANGE, start=start, end=end)
+    await send_report(message.bot, message.chat.id, job, db_session)
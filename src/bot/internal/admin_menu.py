@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from bot.controllers.game import get_active_game
-from bot.controllers.user import get_user_from_db_by_tg_id
+from bot.controllers.user_directory import get_user_directory
 from bot.internal.context import GameStatus
 from bot.internal.lexicon import texts
 from database.models import Record
@@ -43,8 +43,7 @@ async def build_admin_menu(db_session: AsyncSession) -> tuple[str, GameStatus |
     if not players_buy_in_lines:
         players_buy_in_lines = [texts["admin_menu_player_buy_in_empty"]]
 
-    host = await get_user_from_db_by_tg_id(game.host_id, db_session)
-    host_name = host.fullname if host else "Unknown"
+    host_name = await get_user_directory().fullname(game.host_id, db_session) or "Unknown"
     text = "\n".join(
         [
             texts["admin_menu_header"],
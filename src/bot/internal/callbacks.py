@@ -6,6 +6,7 @@ from bot.internal.context import (
     FinalGameAction,
     GameAction,
     KeyboardMode,
+    LeaderboardCategory,
     OperationType,
     SinglePlayerActionType,
 )
@@ -104,3 +105,9 @@ class DeletePlayerConfirmCbData(CallbackData, prefix="del_player_confirm"):
 
 class DeletePlayerCancelCbData(CallbackData, prefix="del_player_cancel"):
     page: int
+
+
+class LeaderboardCbData(CallbackData, prefix="leaderboard"):
+    category: LeaderboardCategory
+    after: int | None = None
+    before: int | None = None
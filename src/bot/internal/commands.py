@@ -4,6 +4,7 @@ private_commands = [
     types.BotCommand(command="/start", description="first things first"),
     types.BotCommand(command="/settings", description="add payment requisites"),
     types.BotCommand(command="/stats", description="statistics"),
+    types.BotCommand(command="/game", description="game report by id"),
     types.BotCommand(command="/admin", description="admin section"),
     types.BotCommand(command="/info", description="bot info"),
 ]
@@ -1,12 +1,17 @@
+import atexit
+import gzip
 import logging.config
+import shutil
 import sys
 from datetime import datetime
 from logging import Formatter
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 
 from pydantic_settings import SettingsConfigDict
 
+from bot.internal.log_context import JsonFormatter, UpdateContextFilter
+
 
 class CustomFormatter(Formatter):
     def formatTime(self, record, datefmt=None):
@@ -20,11 +25,32 @@ class CustomFormatter(Formatter):
             return super().formatTime(record, datefmt)
 
 
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that compresses rotated files (`app.log.1.gz`, ...)."""
+
+    def rotation_filename(self, default_name: str) -> str:
+        return f"{default_name}.gz"
+
+    def rotate(self, source: str, dest: str) -> None:
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        Path(source).unlink()
+
+
 def initial_setup(app_name: str):
     Path("logs").mkdir(parents=True, exist_ok=True)
     Path("photos").mkdir(parents=True, exist_ok=True)
     logging_config = get_logging_config(app_name)
     logging.config.dictConfig(logging_config)
+    start_log_listener()
+
+
+def start_log_listener() -> None:
+    """Run the real handlers on the queue listener thread instead of the event loop."""
+    queue_handler = logging.getHandlerByName("queue")
+    if isinstance(queue_handler, QueueHandler) and queue_handler.listener is not None:
+        queue_handler.listener.start()
+        atexit.register(queue_handler.listener.stop)
 
 
 main_template = {
@@ -52,6 +78,14 @@ def get_logging_config(app_name: str):
                 "format": error_template["format"],
                 "datefmt": error_template["datefmt"],
             },
+            "json": {
+                "()": JsonFormatter,
+            },
+        },
+        "filters": {
+            "update_context": {
+                "()": UpdateContextFilter,
+            },
         },
         "handlers": {
             "stdout": {
@@ -67,7 +101,7 @@ def get_logging_config(app_name: str):
                 "stream": sys.stderr,
             },
             "file": {
-                "()": RotatingFileHandler,
+                "()": GzipRotatingFileHandler,
                 "level": "INFO",
                 "formatter": "main",
                 "filename": f"logs/{app_name}.log",
@@ -75,11 +109,27 @@ def get_logging_config(app_name: str):
                 "backupCount": 3,
                 "encoding": "utf-8",
             },
+            "json_file": {
+                "()": GzipRotatingFileHandler,
+                "level": "INFO",
+                "formatter": "json",
+                "filename": f"logs/{app_name}.jsonl",
+                "maxBytes": 50000000,
+                "backupCount": 3,
+                "encoding": "utf-8",
+            },
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "level": "INFO",
+                "filters": ["update_context"],
+                "handlers": ["stdout", "stderr", "file", "json_file"],
+                "respect_handler_level": True,
+            },
         },
         "loggers": {
             "root": {
                 "level": "DEBUG",
-                "handlers": ["stdout", "stderr", "file"],
+                "handlers": ["queue"],
             },
         },
     }
@@ -42,6 +42,8 @@ class GameAction(IntEnum):
     SELECT_YEARLY_STATS = auto()
     DELETE_PLAYER = auto()
     NEXT_GAME_SETTINGS = auto()
+    LEADERBOARD = auto()
+    STATS_RANGE = auto()
 
 
 class RecordUpdateMode(IntEnum):
@@ -74,6 +76,26 @@ class DebtAction(IntEnum):
     REMIND_DEBTOR = auto()
 
 
+class DeliveryStatus(StrEnum):
+    PENDING = auto()
+    SENDING = auto()
+    SENT = auto()
+    FAILED = auto()
+
+
+class ReportKind(IntEnum):
+    ALL_TIME = auto()
+    YEARLY = auto()
+    RANGE = auto()
+
+
+class LeaderboardCategory(IntEnum):
+    NET = auto()
+    ROI = auto()
+    ATTENDANCE = auto()
+    MVP = auto()
+
+
 class DebtStatsView(IntEnum):
     I_OWE = auto()
     OWE_ME = auto()
@@ -84,3 +106,4 @@ class States(StatesGroup):
     ENTER_CUSTOM_FUNDS = State()
     ADD_ADMIN = State()
     DELETE_ADMIN = State()
+    ENTER_STATS_RANGE = State()
@@ -17,6 +17,7 @@ from bot.internal.keyboards.game_menu import (
     game_menu_kb,
     next_game_menu_kb,
 )
+from bot.internal.keyboards.leaderboard import leaderboard_kb
 from bot.internal.keyboards.next_game_settings import (
     ratio_confirm_kb,
     select_ratio_kb,
@@ -41,6 +42,7 @@ __all__ = [
     "game_menu_kb",
     "get_paid_button",
     "get_paid_button_confirmation",
+    "leaderboard_kb",
     "mode_selector_kb",
     "next_game_menu_kb",
     "ratio_confirm_kb",
@@ -40,6 +40,14 @@ def game_menu_kb(status: GameStatus | None, is_admin: bool = True) -> InlineKeyb
                     text=buttons["menu_statistics"],
                     callback_data=GameMenuCbData(action=GameAction.STATISTICS).pack(),
                 )
+                builder.button(
+                    text=buttons["menu_leaderboard"],
+                    callback_data=GameMenuCbData(action=GameAction.LEADERBOARD).pack(),
+                )
+                builder.button(
+                    text=buttons["menu_stats_range"],
+                    callback_data=GameMenuCbData(action=GameAction.STATS_RANGE).pack(),
+                )
             builder.button(
                 text=buttons["menu_extras"],
                 callback_data=GameMenuCbData(action=GameAction.NEXT_GAME_SETTINGS).pack(),
@@ -65,6 +73,14 @@ def game_menu_kb(status: GameStatus | None, is_admin: bool = True) -> InlineKeyb
                     text=buttons["menu_statistics"],
                     callback_data=GameMenuCbData(action=GameAction.STATISTICS).pack(),
                 )
+                builder.button(
+                    text=buttons["menu_leaderboard"],
+                    callback_data=GameMenuCbData(action=GameAction.LEADERBOARD).pack(),
+                )
+                builder.button(
+                    text=buttons["menu_stats_range"],
+                    callback_data=GameMenuCbData(action=GameAction.STATS_RANGE).pack(),
+                )
             builder.button(
                 text=buttons["menu_extras"],
                 callback_data=GameMenuCbData(action=GameAction.NEXT_GAME_SETTINGS).pack(),
@@ -0,0 +1,51 @@
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from bot.internal.callbacks import CancelCbData, LeaderboardCbData
+from bot.internal.context import LeaderboardCategory
+from bot.internal.lexicon import buttons
+
+CATEGORY_BUTTONS = {
+    LeaderboardCategory.NET: "leaderboard_net",
+    LeaderboardCategory.ROI: "leaderboard_roi",
+    LeaderboardCategory.ATTENDANCE: "leaderboard_attendance",
+    LeaderboardCategory.MVP: "leaderboard_mvp",
+}
+
+
+def leaderboard_kb(
+    category: LeaderboardCategory,
+    first_position: int | None,
+    last_position: int | None,
+    has_prev: bool,
+    has_next: bool,
+) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    for option, button_key in CATEGORY_BUTTONS.items():
+        label = buttons[button_key]
+        builder.button(
+            text=f"• {label}" if option == category else label,
+            callback_data=LeaderboardCbData(category=option).pack(),
+        )
+    nav_row = 0
+    if has_prev and first_position is not None:
+        builder.button(
+            text=buttons["page_prev"],
+            callback_data=LeaderboardCbData(category=category, before=first_position).pack(),
+        )
+        nav_row += 1
+    if has_next and last_position is not None:
+        builder.button(
+            text=buttons["page_next"],
+            callback_data=LeaderboardCbData(category=category, after=last_position).pack(),
+        )
+        nav_row += 1
+    builder.button(
+        text=buttons["back"],
+        callback_data=CancelCbData().pack(),
+    )
+    rows = [len(CATEGORY_BUTTONS)]
+    if nav_row:
+        rows.append(nav_row)
+    builder.adjust(*rows, 1)
+    return builder.as_markup()
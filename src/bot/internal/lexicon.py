@@ -56,6 +56,7 @@ texts = {
                     '<b>Commands</b>\n'
                     '/settings — payment requisites\n'
                     '/stats — stats\n'
+                    '/game &lt;id&gt; — game report\n'
                     '/admin — admin panel\n\n'
                     '<b>Support</b>\n'
                     'Make a contribution to the author by card transfer:\n'
@@ -143,6 +144,14 @@ texts = {
                             'Total BUY-IN: <b>{}</b>\n'
                             'Total BUY-OUT: <b>{}</b>\n'
                             'Total ROI: <b>{}</b>',
+    'player_stats_streaks': '\n\n<b>Streaks</b>\n'
+                            'Wins: <b>{}</b> (best {})\n'
+                            'Losses: <b>{}</b> (worst {})\n'
+                            'Best single game: <b>{}</b>\n'
+                            'Games in a row: <b>{}</b> (best {})',
+    'player_stats_bankroll': '\n\n<b>Bankroll</b>\n'
+                             '{}\n'
+                             'Net <b>{:+}</b> after {} games',
     'stats_debts_header': '\n\n<b>Debts</b>',
     'stats_debts_you_owe': '\n\n<b>You owe</b>',
     'stats_debts_owed_to_you': '\n\n<b>Owed to you</b>',
@@ -152,6 +161,15 @@ texts = {
     'stats_debt_detail_header': '<b>Debt details</b>',
     'stats_debt_detail_i_owe': '\n\n<b>You owe</b>',
     'stats_debt_detail_owe_me': '\n\n<b>Owed to you</b>',
+    'leaderboard_header': '<b>Leaderboard — {}</b>',
+    'leaderboard_line': '{}. {} — <b>{}</b>',
+    'leaderboard_empty': 'No finished games yet.',
+    'stat_card': '<b>{}</b>\n'
+                 'Games played: <b>{}</b>\n'
+                 'Net: <b>{:+}</b> (#{} of {})\n'
+                 'ROI: <b>{}</b>\n'
+                 'MVP awards: <b>{}</b>',
+    'stat_card_description': 'Net {:+} · {} games · #{}',
     'admin_stats_ingame': 'Not available yet.',
     'admin_stats_outgame': 'Not available yet.',
     'debt_remind_sent': 'Reminder sent to {}.',
@@ -170,6 +188,28 @@ texts = {
     'start_greeting': 'Hi, {}.',
     'admin_delete_player_done_popup': 'Deleted. Check private messages.',
     'game_not_found': 'Game {:02} not found.',
+    'game_report_usage': 'Usage: /game &lt;id&gt;',
+    'year_review': '<b>{} in review</b>\n\n'
+                   'Games played: <b>{}</b>\n'
+                   'Net: <b>{:+}</b>\n'
+                   'ROI: <b>{}</b>\n'
+                   'Rank: <b>{}</b> of {}',
+    'year_review_best_game': '\nBest game: <b>{:+}</b> (game {:02})',
+    'year_review_rival': '\nBiggest rival: <b>{}</b> ({} games together)',
+    'year_review_usage': 'Usage: /year_review &lt;year&gt;',
+    'year_review_queued': 'Year {} reviews queued: <b>{}</b> new, sending in background.',
+    'stats_range_prompt': 'Send a date range: <code>YYYY-MM-DD YYYY-MM-DD</code>',
+    'stats_range_invalid': 'Invalid range. Usage: /stats_range 2025-09-01 2026-05-31',
+    'report_building': 'Building the report, it will be posted here when ready.',
+    'report_failed': 'Failed to build the report. Please try again later.',
+    'sql_inspect_usage': 'Usage: /sql_inspect on|off',
+    'sql_inspect_status': 'SQL inspection: <b>{}</b> (warn above {} queries or {} repeats)',
+    'throttled': 'Too fast, slow down a little.',
+    'game_report_players_header': '<b>Players</b>',
+    'game_report_player_line': '• {}: {} → {} (<b>{:+}</b>)',
+    'game_report_settlement_header': '<b>Settlement</b>',
+    'game_report_settlement_line': '• {} → {}: <b>{:.2f} GEL</b>',
+    'game_report_no_settlement': 'No transfers needed.',
     'mvp_not_found': 'MVP not found. Check game data.',
 
 }
@@ -182,6 +222,8 @@ buttons = {
     'menu_abort_game': 'Abort game',
     'menu_start_game': 'Start game',
     'menu_statistics': 'Stats',
+    'menu_leaderboard': 'Leaderboard',
+    'menu_stats_range': 'Stats for dates',
     'menu_extras': 'Extras',
     'menu_select_ratio': 'Set ratio',
     'menu_select_yearly_stats': 'Yearly stats',
@@ -207,6 +249,10 @@ buttons = {
     'confirm_yes': 'Yes',
     'confirm_no': 'No',
     'ratio_option': 'x{}',
+    'leaderboard_net': 'Net',
+    'leaderboard_roi': 'ROI',
+    'leaderboard_attendance': 'Games',
+    'leaderboard_mvp': 'MVP',
     'page_prev': 'Prev',
     'page_next': 'Next',
     'back': 'Back',
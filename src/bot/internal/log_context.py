@@ -0,0 +1,121 @@
+import json
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_RECORD_FIELDS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+@dataclass(slots=True)
+class UpdateContext:
+    correlation_id: str
+    update_id: int
+    user_id: int | None
+    started: float
+    handler: str | None = None
+    db_time: float = 0.0
+    db_queries: int = 0
+    api_time: float = 0.0
+    api_calls: int = 0
+    statements: Counter[str] | None = None
+
+
+@dataclass(slots=True)
+class QueryInspection:
+    """Runtime switch for per-update statement tracking and the N+1 warnings."""
+
+    enabled: bool = False
+    max_queries: int = 20
+    repeat_threshold: int = 3
+
+
+_inspection = QueryInspection()
+
+
+def get_query_inspection() -> QueryInspection:
+    return _inspection
+
+
+def repeated_statements(context: UpdateContext, threshold: int) -> list[tuple[str, int]]:
+    """Statements run `threshold`+ times with different parameters: the N+1 signature."""
+    if not context.statements:
+        return []
+    return [
+        (statement, count)
+        for statement, count in context.statements.most_common()
+        if count >= threshold
+    ]
+
+
+_current: ContextVar[UpdateContext | None] = ContextVar("update_context", default=None)
+
+
+def current_update() -> UpdateContext | None:
+    return _current.get()
+
+
+def bind_update(context: UpdateContext):
+    return _current.set(context)
+
+
+def unbind_update(token) -> None:
+    _current.reset(token)
+
+
+class UpdateContextFilter(logging.Filter):
+    """Copies the current update context onto records in the logging thread.
+
+    Must sit on the queue handler: context variables are not visible on the
+    listener thread that formats the records.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _current.get()
+        if context is not None:
+            record.correlation_id = context.correlation_id
+            record.update_id = context.update_id
+            record.user_id = context.user_id
+            record.handler = context.handler
+            record.db_ms = round(context.db_time * 1000, 2)
+            record.api_ms = round(context.api_time * 1000, 2)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, update context and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name, value in record.__dict__.items():
+            if name not in _RECORD_FIELDS:
+                payload[name] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_started"] = perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    update = _current.get()
+    if update is not None:
+        update.db_time += perf_counter() - conn.info["query_started"]
+        update.db_queries += 1
+        if _inspection.enabled:
+            if update.statements is None:
+                update.statements = Counter()
+            update.statements[statement] += 1
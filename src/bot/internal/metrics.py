@@ -0,0 +1,139 @@
+import resource
+from bisect import bisect_left
+from collections.abc import Callable
+from pathlib import Path
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+type LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self.values[label_values] = self.values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for values, total in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, values)} {_number(total)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        # per label set: bucket counts (last slot is +Inf), sum
+        self.series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for values, (counts, total) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, None), counts, strict=True):
+                cumulative += count
+                le = 'le="+Inf"' if bound is None else f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, values, le)} {cumulative}")
+            labels = _labels(self.labels, values)
+            lines.append(f"{self.name}_sum{labels} {_number(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Process-wide metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self.handler_latency = Histogram(
+            "bot_handler_duration_seconds", "Handler latency.", ("router", "handler")
+        )
+        self.updates = Counter("bot_updates_total", "Processed updates.", ("type", "status"))
+        self.db_queries = Counter("bot_db_queries_total", "SQL statements run by updates.")
+        self.db_seconds = Counter("bot_db_seconds_total", "Time updates spent in SQL.")
+        self.api_latency = Histogram(
+            "bot_telegram_api_duration_seconds", "Bot API call latency.", ("method",)
+        )
+        self.api_errors = Counter(
+            "bot_telegram_api_errors_total", "Failed Bot API calls.", ("method", "error")
+        )
+        self.throttled = Counter(
+            "bot_throttled_total", "Updates dropped by throttling.", ("type", "rule", "reason")
+        )
+        self._gauges: list[tuple[str, str, str, Callable[[], float]]] = []
+
+    def gauge(
+        self, name: str, help_text: str, read: Callable[[], float], kind: str = "gauge"
+    ) -> None:
+        """Register a value read at scrape time; `kind="counter"` for running totals."""
+        self._gauges.append((name, help_text, kind, read))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in (
+            self.handler_latency,
+            self.updates,
+            self.db_queries,
+            self.db_seconds,
+            self.api_latency,
+            self.api_errors,
+            self.throttled,
+        ):
+            lines.extend(metric.render())
+        for name, help_text, kind, read in self._gauges:
+            lines.extend(
+                [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {_number(read())}"]
+            )
+        return "\n".join(lines) + "\n"
+
+
+def process_rss_bytes() -> int:
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        # Without procfs fall back to peak RSS, reported in kilobytes.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _metrics
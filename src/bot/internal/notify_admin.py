@@ -1,6 +1,7 @@
 import html
 import logging
 import os
+from time import monotonic
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError
@@ -9,6 +10,8 @@ from bot.config import Settings, settings
 
 logger = logging.getLogger(__name__)
 
+_last_alerts: dict[str, float] = {}
+
 
 async def on_startup(bot: Bot, settings: Settings):
     folder = os.path.basename(os.getcwd())
@@ -67,3 +70,21 @@ async def send_message_to_player(
         )
         await notify_admin_blocked_message(bot, fullname, text)
         return None
+
+
+async def send_admin_alert(
+    bot: Bot, text: str, key: str | None = None, cooldown: float = 0.0
+) -> bool:
+    """Send an alert to the admin; alerts sharing a `key` are sent at most once per `cooldown`."""
+    if key is not None:
+        now = monotonic()
+        last = _last_alerts.get(key)
+        if last is not None and now - last < cooldown:
+            return False
+        _last_alerts[key] = now
+    try:
+        await bot.send_message(settings.bot.ADMIN, text)
+    except Exception:
+        logger.exception("Failed to send alert to admin")
+        return False
+    return True
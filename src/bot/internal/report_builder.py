@@ -0,0 +1,152 @@
+import asyncio
+import re
+
+from aiogram import Bot
+from aiogram.types import Message
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+CHUNK_SEND_INTERVAL = 1.0  # seconds between chunks sent to one chat
+
+_TAG_RE = re.compile(r"<(/?)([a-zA-Z][\w-]*)[^>]*>")
+# Tags, entities and plain text runs: a line is only ever split between tokens.
+_TOKEN_RE = re.compile(r"<[^>]*>|&#?\w+;|[^<&]+|[<&]")
+
+
+class SendRateLimiter:
+    """Spaces awaited sends at least `interval` seconds apart."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        # reserve the slot before sleeping so concurrent callers queue behind each other
+        slot = max(now, self._next_at)
+        self._next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _scan_tags(fragment: str, open_tags: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    open_tags = list(open_tags)
+    for match in _TAG_RE.finditer(fragment):
+        closing, name = match.group(1), match.group(2).lower()
+        if not closing:
+            open_tags.append((name, match.group(0)))
+            continue
+        for index in range(len(open_tags) - 1, -1, -1):
+            if open_tags[index][0] == name:
+                del open_tags[index]
+                break
+    return open_tags
+
+
+def _closing(open_tags: list[tuple[str, str]]) -> str:
+    return "".join(f"</{name}>" for name, _ in reversed(open_tags))
+
+
+class ReportBuilder:
+    """Streams report lines into chunks that each fit one Telegram message.
+
+    Chunks break between lines where possible. HTML tags still open at a break are closed
+    at the end of the chunk and reopened at the start of the next one.
+    """
+
+    def __init__(self, limit: int = TELEGRAM_MESSAGE_LIMIT) -> None:
+        self.limit = limit
+        self._chunks: list[str] = []
+        self._open: list[tuple[str, str]] = []
+        self._current = ""
+        self._has_content = False
+
+    def add(self, text: str) -> "ReportBuilder":
+        for line in text.split("\n"):
+            self._add_line(line)
+        return self
+
+    def chunks(self) -> list[str]:
+        if self._has_content:
+            self._flush()
+        return list(self._chunks)
+
+    def _fits(self, text: str, open_tags: list[tuple[str, str]]) -> bool:
+        return len(text) + len(_closing(open_tags)) <= self.limit
+
+    def _add_line(self, line: str) -> None:
+        if not self._has_content and not line.strip():
+            return
+        separator = "\n" if self._has_content else ""
+        after = _scan_tags(line, self._open)
+        if self._fits(self._current + separator + line, after):
+            self._current += separator + line
+            self._open = after
+            self._has_content = True
+            return
+        if self._has_content:
+            self._flush()
+            self._add_line(line)
+            return
+        for token in _TOKEN_RE.findall(line):
+            self._add_token(token)
+
+    def _add_token(self, token: str) -> None:
+        if not token:
+            return
+        after = _scan_tags(token, self._open)
+        if self._fits(self._current + token, after):
+            self._current += token
+            self._open = after
+            self._has_content = True
+            return
+        if self._has_content:
+            self._flush()
+            self._add_token(token)
+            return
+        # A text run longer than a whole message: split it by characters.
+        room = max(self.limit - len(self._current) - len(_closing(self._open)), 1)
+        self._current += token[:room]
+        self._has_content = True
+        self._add_token(token[room:])
+
+    def _flush(self) -> None:
+        self._chunks.append(self._current.rstrip("\n") + _closing(self._open))
+        self._current = "".join(tag for _, tag in self._open)
+        self._has_content = False
+
+
+_limiters: dict[int, SendRateLimiter] = {}  # id(bot) -> limiter shared by all its reports
+
+
+def get_send_limiter(bot: Bot) -> SendRateLimiter:
+    limiter = _limiters.get(id(bot))
+    if limiter is None:
+        limiter = _limiters[id(bot)] = SendRateLimiter(CHUNK_SEND_INTERVAL)
+    return limiter
+
+
+def split_report(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    return ReportBuilder(limit).add(text).chunks()
+
+
+async def send_chunks(
+    bot: Bot,
+    chat_id: int,
+    chunks: list[str],
+    limiter: SendRateLimiter | None = None,
+    reply_markup=None,
+    **kwargs,
+) -> list[Message]:
+    """Send chunks in order; a keyboard, if any, is attached to the last one."""
+    limiter = limiter or get_send_limiter(bot)
+    messages = []
+    for index, chunk in enumerate(chunks):
+        await limiter.wait()
+        if reply_markup is not None and index == len(chunks) - 1:
+            kwargs["reply_markup"] = reply_markup
+        messages.append(await bot.send_message(chat_id=chat_id, text=chunk, **kwargs))
+    return messages
+
+
+async def send_report_text(bot: Bot, chat_id: int, text: str, **kwargs) -> list[Message]:
+    return await send_chunks(bot, chat_id, split_report(text), **kwargs)
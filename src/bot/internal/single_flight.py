@@ -0,0 +1,109 @@
+"""Coalesce concurrent identical async calls into one in-flight computation."""
+
+import asyncio
+import functools
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.session_tracking import has_pending_writes
+
+logger = logging.getLogger(__name__)
+
+# arguments that differ per request but do not change the result
+_IGNORED_ARGUMENTS = frozenset({"db_session"})
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    executions: int = 0
+    coalesced: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.stats = SingleFlightStats()
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # mark the exception retrieved even if every caller was cancelled
+            future.exception()
+
+    async def do[T](self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run factory once per key at a time; concurrent callers share its result."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(functools.partial(self._forget, key))
+            self.stats.executions += 1
+        else:
+            self.stats.coalesced += 1
+            logger.debug("Coalesced call %s", key)
+        self.stats.waiting += 1
+        self.stats.max_waiting = max(self.stats.max_waiting, self.stats.waiting)
+        try:
+            # shield: a cancelled caller must not cancel the computation others wait on
+            return await asyncio.shield(future)
+        finally:
+            self.stats.waiting -= 1
+
+
+_group = SingleFlight()
+_session_factory: Callable[[], AsyncSession] | None = None
+
+
+def configure_single_flight(session_factory: Callable[[], AsyncSession] | None) -> None:
+    """Session factory for shared computations; without one calls are not coalesced."""
+    global _session_factory
+    _session_factory = session_factory
+
+
+def get_single_flight_stats() -> SingleFlightStats:
+    return _group.stats
+
+
+def single_flight[**P, T](func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Share one computation between concurrent calls with equal arguments.
+
+    The shared computation opens its own session, so it does not depend on any caller's
+    session staying open and only sees committed data. Callers with uncommitted writes
+    run on their own session instead. Results are shared objects and must be treated as
+    read-only.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        session_factory = _session_factory
+        db_session = bound.arguments.get("db_session")
+        if session_factory is None or db_session is None or has_pending_writes(db_session):
+            return await func(*args, **kwargs)
+        key = (
+            func.__module__,
+            func.__qualname__,
+            tuple(
+                (name, value)
+                for name, value in bound.arguments.items()
+                if name not in _IGNORED_ARGUMENTS
+            ),
+        )
+
+        async def compute() -> T:
+            async with session_factory() as shared_session:
+                arguments = {**bound.arguments, "db_session": shared_session}
+                return await func(**arguments)
+
+        return await _group.do(key, compute)
+
+    return wrapper
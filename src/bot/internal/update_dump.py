@@ -0,0 +1,197 @@
+import gzip
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO
+
+from aiogram.types import Update
+
+logger = logging.getLogger(__name__)
+
+DUMP_QUEUE_SIZE = 1000
+JOURNAL_SEGMENT_UPDATES = 10_000
+JOURNAL_KEEP_SEGMENTS = 20
+JOURNAL_SUFFIX = ".ndjson.gz"
+
+
+def parse_update_types(raw: str) -> frozenset[str]:
+    return frozenset(part.strip() for part in raw.split(",") if part.strip())
+
+
+class _QueuedWriter(ABC):
+    """Bounded queue drained by a writer thread; full queues drop instead of blocking."""
+
+    thread_name = "queued-writer"
+
+    def __init__(self, queue_size: int = DUMP_QUEUE_SIZE) -> None:
+        self.dropped = 0
+        self.written = 0
+        self._queue: queue.Queue[object | None] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+
+    def _put(self, item: object) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Write what is queued and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        logger.info(
+            "%s stopped: written=%s dropped=%s", self.thread_name, self.written, self.dropped
+        )
+
+    def _items(self) -> Iterator[object]:
+        while (item := self._queue.get()) is not None:
+            yield item
+
+    @abstractmethod
+    def _run(self) -> None:
+        """Drain `_items()` on the writer thread."""
+
+
+class UpdateDumper(_QueuedWriter):
+    """Writes sampled raw updates as JSON lines from a background thread.
+
+    The update handler only does the sampling decision and a non-blocking queue put;
+    serialization and file I/O happen on the writer thread.
+    """
+
+    thread_name = "update-dumper"
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: float = 1.0,
+        update_types: frozenset[str] = frozenset(),
+        queue_size: int = DUMP_QUEUE_SIZE,
+    ) -> None:
+        super().__init__(queue_size)
+        self.path = path
+        self.sample_rate = sample_rate
+        self.update_types = update_types
+
+    def wants(self, update_type: str) -> bool:
+        if self.update_types and update_type not in self.update_types:
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def submit(self, update: Update) -> None:
+        self._put(update)
+
+    def _run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            for update in self._items():
+                try:
+                    file.write(update.model_dump_json(exclude_unset=True) + "\n")
+                    self.written += 1
+                except Exception:
+                    logger.exception("Failed to dump update %s", update.update_id)
+                if self._queue.empty():
+                    file.flush()
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    received_at: float
+    update: Update
+
+
+class UpdateJournal(_QueuedWriter):
+    """Appends every raw update to gzip-compressed NDJSON segments for later replay.
+
+    A segment is closed after `segment_updates` lines; only the newest
+    `keep_segments` segments are kept on disk.
+    """
+
+    thread_name = "update-journal"
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_updates: int = JOURNAL_SEGMENT_UPDATES,
+        keep_segments: int = JOURNAL_KEEP_SEGMENTS,
+        queue_size: int = DUMP_QUEUE_SIZE,
+    ) -> None:
+        super().__init__(queue_size)
+        self.directory = directory
+        self.segment_updates = segment_updates
+        self.keep_segments = keep_segments
+        self._segment_seq = 0
+
+    def record(self, update: Update) -> None:
+        self._put((time.time(), update))
+
+    def segments(self) -> list[Path]:
+        return sorted(self.directory.glob(f"updates-*{JOURNAL_SUFFIX}"))
+
+    def _open_segment(self) -> IO[str]:
+        self._segment_seq += 1
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        path = self.directory / f"updates-{stamp}-{self._segment_seq:04d}{JOURNAL_SUFFIX}"
+        return gzip.open(path, "at", encoding="utf-8")
+
+    def _prune(self) -> None:
+        for path in self.segments()[: -self.keep_segments]:
+            path.unlink(missing_ok=True)
+
+    def _run(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segment: IO[str] | None = None
+        lines = 0
+        try:
+            for received_at, update in self._items():
+                if segment is None:
+                    segment = self._open_segment()
+                    self._prune()
+                try:
+                    payload = update.model_dump(mode="json", exclude_unset=True)
+                    segment.write(json.dumps({"received_at": received_at, "update": payload}))
+                    segment.write("\n")
+                    self.written += 1
+                    lines += 1
+                except Exception:
+                    logger.exception("Failed to journal update %s", update.update_id)
+                if lines >= self.segment_updates:
+                    segment.close()
+                    segment, lines = None, 0
+                elif self._queue.empty():
+                    segment.flush()
+        finally:
+            if segment is not None:
+                segment.close()
+
+
+def read_journal(path: Path) -> Iterator[JournalEntry]:
+    """Yield journaled updates in order; a segment cut short by a crash ends early."""
+    with gzip.open(path, "rt", encoding="utf-8") as segment:
+        try:
+            for line in segment:
+                if not line.endswith("\n"):
+                    break
+                record = json.loads(line)
+                yield JournalEntry(
+                    received_at=record["received_at"],
+                    update=Update.model_validate(record["update"]),
+                )
+        except EOFError:
+            logger.warning("Journal segment %s is truncated", path)
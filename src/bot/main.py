@@ -1,52 +1,74 @@
 import logging
 from asyncio import run
+from pathlib import Path
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage, SimpleEventIsolation
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config import settings
+from bot.controllers.game.analytics import enable_analytics_engine, numpy_available
+from bot.controllers.game.crud import get_active_game
+from bot.controllers.game.next_game_settings import get_next_game_settings
 from bot.handlers.callbacks import router as callbacks_router
 from bot.handlers.commands_handler import router as command_router
 from bot.handlers.debt_handlers import router as debts_router
 from bot.handlers.errors_handler import router as errors_router
+from bot.handlers.inline_handler import router as inline_router
 from bot.handlers.photo_handler import router as photo_router
 from bot.handlers.states_handler import router as states_router
 from bot.internal.commands import set_bot_commands
 from bot.internal.config_dicts import initial_setup
-from bot.internal.notify_admin import on_shutdown, on_startup
+from bot.internal.log_context import get_query_inspection
+from bot.internal.metrics import get_metrics
+from bot.internal.notify_admin import on_shutdown, on_startup, send_admin_alert
 from bot.internal.poll import start_weekly_poll_loop
+from bot.internal.single_flight import configure_single_flight
+from bot.internal.update_dump import UpdateDumper, UpdateJournal, parse_update_types
 from bot.middlewares.auth_middleware import AuthMiddleware
+from bot.middlewares.group_filter_middleware import GroupChatFilterMiddleware
 from bot.middlewares.logging_middleware import LoggingMiddleware
 from bot.middlewares.session_middleware import DBSessionMiddleware
+from bot.middlewares.throttling_middleware import (
+    ThrottleRule,
+    ThrottlingMiddleware,
+    parse_throttle_rules,
+)
+from bot.middlewares.update_context_middleware import ApiTimingMiddleware, UpdateContextMiddleware
 from bot.middlewares.updates_dumper_middleware import UpdatesDumperMiddleware
-from database.database_connector import get_db
+from bot.services.loop_monitor import LAG_ALERT_COOLDOWN, LoopLagMonitor, format_stall_alert
+from bot.services.metrics_server import register_runtime_gauges, start_metrics_server
+from bot.services.profile_sync import start_profile_sync, stop_profile_sync
+from bot.services.report_worker import disable_report_worker, enable_report_worker
+from bot.services.year_review import resume_year_review_delivery
+from database.database_connector import DatabaseConnector, get_db
 
 
-async def main():
-    initial_setup("friendly_poker_bot")
-
-    bot = Bot(
-        token=settings.bot.TOKEN.get_secret_value(),
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+def build_dispatcher(
+    db: DatabaseConnector,
+    bot: Bot,
+    dumper: UpdateDumper | None = None,
+    journal: UpdateJournal | None = None,
+    throttle_rules: dict[str, ThrottleRule] | None = None,
+) -> Dispatcher:
+    """Dispatcher with all routers and per-update middlewares, shared with update replay.
 
-    storage = MemoryStorage()
+    Also installs Bot API timing on `bot`. Capture and throttling are optional so replay
+    can run without them.
+    """
     dispatcher = Dispatcher(
-        events_isolation=SimpleEventIsolation(), storage=storage, settings=settings
+        events_isolation=SimpleEventIsolation(), storage=MemoryStorage(), settings=settings, db=db
     )
-    db = get_db()
-
-    async def dispose_db(*_: object, **__: object) -> None:
-        await db.dispose()
-        logging.info("Database connection pool disposed")
-
-    dispatcher.update.outer_middleware(UpdatesDumperMiddleware())
-    dispatcher.startup.register(on_startup)
-    dispatcher.shutdown.register(on_shutdown)
-    dispatcher.shutdown.register(dispose_db)
-    dispatcher.startup.register(set_bot_commands)
+    bot.session.middleware(ApiTimingMiddleware())
+    dispatcher.update.outer_middleware(UpdateContextMiddleware())
+    dispatcher.update.outer_middleware(UpdatesDumperMiddleware(dumper, journal))
+    dispatcher.message.outer_middleware(GroupChatFilterMiddleware(settings.bot.GROUP_ID))
+    if throttle_rules:
+        throttling_middleware = ThrottlingMiddleware(throttle_rules)
+        dispatcher.message.outer_middleware(throttling_middleware)
+        dispatcher.callback_query.outer_middleware(throttling_middleware)
     db_session_middleware = DBSessionMiddleware(db)
     dispatcher.message.middleware(db_session_middleware)
     dispatcher.callback_query.middleware(db_session_middleware)
@@ -54,6 +76,7 @@ async def main():
     dispatcher.callback_query.middleware(AuthMiddleware())
     dispatcher.message.middleware.register(LoggingMiddleware())
     dispatcher.callback_query.middleware.register(LoggingMiddleware())
+    dispatcher.inline_query.middleware.register(LoggingMiddleware())
     dispatcher.include_routers(
         command_router,
         callbacks_router,
@@ -61,11 +84,149 @@ async def main():
         states_router,
         debts_router,
         photo_router,
+        inline_router,
+    )
+    return dispatcher
+
+
+async def main():
+    initial_setup("friendly_poker_bot")
+
+    bot = Bot(
+        token=settings.bot.TOKEN.get_secret_value(),
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
 
+    db = get_db()
+    dumper = None
+    if settings.bot.DUMP_UPDATES:
+        dumper = UpdateDumper(
+            Path("logs/updates.jsonl"),
+            sample_rate=settings.bot.DUMP_SAMPLE_RATE,
+            update_types=parse_update_types(settings.bot.DUMP_UPDATE_TYPES),
+        )
+    journal = UpdateJournal(Path("logs/journal")) if settings.bot.JOURNAL else None
+    dispatcher = build_dispatcher(
+        db, bot, dumper, journal, parse_throttle_rules(settings.bot.THROTTLE)
+    )
+    configure_single_flight(db.session_factory)
+    inspection = get_query_inspection()
+    inspection.enabled = settings.bot.SQL_INSPECT
+    inspection.max_queries = settings.bot.SQL_MAX_QUERIES
+    inspection.repeat_threshold = settings.bot.SQL_REPEAT_THRESHOLD
+
+    async def warmup_db(*_: object, **__: object) -> None:
+        if not settings.db.WARMUP:
+            return
+
+        async def prime(db_session: AsyncSession) -> None:
+            await get_active_game(db_session)
+            await get_next_game_settings(db_session)
+
+        try:
+            await db.warmup(settings.db.POOL_SIZE, prime)
+        except Exception:
+            logging.exception("Database warmup failed")
+
+    async def dispose_db(*_: object, **__: object) -> None:
+        stats = db.pool_stats()
+        logging.info(
+            "Database pool stats: checkouts=%s avg_wait_ms=%.2f max_wait_ms=%.2f peak=%s/%s",
+            stats.checkouts,
+            stats.avg_wait * 1000,
+            stats.max_wait * 1000,
+            stats.peak_checked_out,
+            stats.capacity,
+        )
+        await db.dispose()
+        logging.info("Database connection pool disposed")
+
+    async def load_analytics(*_: object, **__: object) -> None:
+        if not settings.bot.ANALYTICS_ENGINE:
+            return
+        if not numpy_available():
+            logging.warning("BOT_ANALYTICS_ENGINE is set but numpy is not installed, using SQL")
+            return
+        engine = enable_analytics_engine()
+        async with db.session_factory() as db_session:
+            await engine.load(db_session)
+
+    async def start_report_worker(*_: object, **__: object) -> None:
+        if settings.bot.REPORT_WORKER:
+            enable_report_worker(settings.db.db_url)
+            logging.info("Report worker process starting")
+
+    async def stop_report_worker(*_: object, **__: object) -> None:
+        await disable_report_worker()
+
+    async def start_profile_writer(*_: object, **__: object) -> None:
+        start_profile_sync(db.session_factory)
+
+    async def stop_profile_writer(*_: object, **__: object) -> None:
+        await stop_profile_sync(db.session_factory)
+
+    async def resume_year_reviews(bot: Bot, **_: object) -> None:
+        await resume_year_review_delivery(bot, db.session_factory)
+
+    if dumper is not None:
+
+        async def start_dumper(*_: object, **__: object) -> None:
+            dumper.start()
+
+        async def stop_dumper(*_: object, **__: object) -> None:
+            dumper.stop()
+
+        dispatcher.startup.register(start_dumper)
+        dispatcher.shutdown.register(stop_dumper)
+    if journal is not None:
+
+        async def start_journal(*_: object, **__: object) -> None:
+            journal.start()
+
+        async def stop_journal(*_: object, **__: object) -> None:
+            journal.stop()
+
+        dispatcher.startup.register(start_journal)
+        dispatcher.shutdown.register(stop_journal)
+    dispatcher.startup.register(on_startup)
+    dispatcher.startup.register(warmup_db)
+    dispatcher.shutdown.register(on_shutdown)
+    dispatcher.shutdown.register(stop_profile_writer)
+    dispatcher.shutdown.register(dispose_db)
+    dispatcher.startup.register(set_bot_commands)
+    dispatcher.startup.register(load_analytics)
+    dispatcher.startup.register(resume_year_reviews)
+    dispatcher.startup.register(start_report_worker)
+    dispatcher.startup.register(start_profile_writer)
+    dispatcher.shutdown.register(stop_report_worker)
+
     logging.info("friendly poker bot started")
-    start_weekly_poll_loop(bot, settings.bot.GROUP_ID)
-    await dispatcher.start_polling(bot)
+    poll_task = start_weekly_poll_loop(bot, settings.bot.GROUP_ID)
+    loop_monitor = None
+    if settings.bot.LOOP_MONITOR:
+
+        async def alert_stall(lag: float, stack: str) -> None:
+            await send_admin_alert(
+                bot, format_stall_alert(lag, stack), key="loop_lag", cooldown=LAG_ALERT_COOLDOWN
+            )
+
+        loop_monitor = LoopLagMonitor(alert_stall, threshold=settings.bot.LOOP_LAG_THRESHOLD)
+        loop_monitor.start()
+    metrics_runner = None
+    if settings.bot.METRICS_PORT:
+        register_runtime_gauges(get_metrics(), db, poll_task)
+        if loop_monitor is not None:
+            loop_monitor.register_gauges(get_metrics())
+        metrics_runner = await start_metrics_server(
+            settings.bot.METRICS_HOST, settings.bot.METRICS_PORT
+        )
+    try:
+        await dispatcher.start_polling(bot)
+    finally:
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
 
 
 def run_main():
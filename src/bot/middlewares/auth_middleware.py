@@ -5,7 +5,9 @@ from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 
 from bot.config import settings
-from bot.controllers.user import add_user_to_db, get_user_from_db_by_tg_id
+from bot.controllers.user import add_user_to_db
+from bot.controllers.user_directory import entry_from_user, get_user_directory
+from bot.services.profile_sync import get_profile_sync_buffer
 
 
 class AuthMiddleware(BaseMiddleware):
@@ -19,9 +21,11 @@ class AuthMiddleware(BaseMiddleware):
         if user_payload is None:
             return await handler(event, data)
         db_session = data["db_session"]
-        user = await get_user_from_db_by_tg_id(user_payload.id, db_session)
+        user = await get_user_directory().get(user_payload.id, db_session)
         if not user:
             is_admin = user_payload.id == settings.bot.ADMIN
-            user = await add_user_to_db(user_payload, db_session, is_admin)
+            user = entry_from_user(await add_user_to_db(user_payload, db_session, is_admin))
+        else:
+            get_profile_sync_buffer().note(user, user_payload.full_name, user_payload.username)
         data["user"] = user
         return await handler(event, data)
@@ -0,0 +1,33 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import Message, TelegramObject
+
+from bot.services.photo_reminder import is_tracked_photo_reply
+
+
+class GroupChatFilterMiddleware(BaseMiddleware):
+    """Drops group chat messages no handler wants before a DB session is opened.
+
+    Outer middleware on `message`: private chats and users in an FSM state pass through,
+    group messages only when they are game photos replying to a tracked message.
+    """
+
+    def __init__(self, group_id: int) -> None:
+        self.group_id = group_id
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Message) or event.chat.type == "private":
+            return await handler(event, data)
+        if data.get("raw_state") is not None:
+            return await handler(event, data)
+        if event.chat.id == self.group_id and is_tracked_photo_reply(event):
+            return await handler(event, data)
+        return UNHANDLED
@@ -1,26 +1,59 @@
 import functools
 import logging
 from collections.abc import Awaitable, Callable
+from time import perf_counter
 from typing import Any
 
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 
+from bot.internal.log_context import current_update
+from bot.internal.metrics import get_metrics
+
 
 class LoggingMiddleware(BaseMiddleware):
+    def __init__(self) -> None:
+        # Handler objects live as long as their routers, so their ids are stable keys.
+        self._labels: dict[int, tuple[str, str]] = {}
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
+        router, name = self._handler_labels(handler, data)
+        context = current_update()
+        if context is not None:
+            context.handler = name
+        logging.info("calling %s", name)
+        started = perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            get_metrics().handler_latency.observe(perf_counter() - started, router, name)
+
+    def _handler_name(self, handler, data: dict[str, Any]) -> str:
+        return self._handler_labels(handler, data)[1]
+
+    def _handler_labels(self, handler, data: dict[str, Any]) -> tuple[str, str]:
+        """(router module, handler name) for metrics and logs."""
+        handler_object = data.get("handler")
+        if handler_object is not None:
+            labels = self._labels.get(id(handler_object))
+            if labels is not None:
+                return labels
         try:
             name = self._get_name(handler)
         except Exception:
             logging.exception("Failed to resolve handler name")
-            name = repr(handler)
-        logging.info("calling %s", name)
-        return await handler(event, data)
+            return "unknown", repr(handler)
+        callback = getattr(handler_object, "callback", None)
+        module = getattr(callback, "__module__", None) or "unknown"
+        labels = (module.rsplit(".", 1)[-1], name)
+        if handler_object is not None:
+            self._labels[id(handler_object)] = labels
+        return labels
 
     def _get_name(self, handler):
         while isinstance(handler, functools.partial):
@@ -1,13 +1,35 @@
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 
 from database.database_connector import DatabaseConnector
+from database.session_tracking import TOUCHED, has_pending_writes
+
+
+@dataclass(slots=True)
+class SessionStats:
+    updates: int = 0
+    touched: int = 0
+    committed: int = 0
+
+
+_stats = SessionStats()
+
+
+def get_session_stats() -> SessionStats:
+    return _stats
 
 
 class DBSessionMiddleware(BaseMiddleware):
+    """Hands out a lazy session and commits only when the handler wrote something.
+
+    The session checks out a connection on its first query, so updates answered from
+    in-memory state never touch the pool; read-only transactions are just closed.
+    """
+
     def __init__(self, db: DatabaseConnector):
         self.db = db
 
@@ -17,6 +39,7 @@ class DBSessionMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
+        _stats.updates += 1
         async with self.db.session_factory() as db_session:
             data["db_session"] = db_session
             try:
@@ -25,5 +48,10 @@ class DBSessionMiddleware(BaseMiddleware):
                 await db_session.rollback()
                 raise
             else:
-                await db_session.commit()
+                if has_pending_writes(db_session):
+                    await db_session.commit()
+                    _stats.committed += 1
+            finally:
+                if db_session.info.get(TOUCHED):
+                    _stats.touched += 1
             return res
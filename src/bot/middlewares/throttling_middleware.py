@@ -0,0 +1,139 @@
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import CallbackQuery, TelegramObject
+
+from bot.internal.lexicon import texts
+from bot.internal.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_MAX_BUCKETS = 10_000  # idle full buckets are pruned above this
+THROTTLE_MERGE_WINDOW = 1.0  # seconds in which an excess identical click counts as merged
+
+
+@dataclass(slots=True)
+class ThrottleRule:
+    rate: float  # tokens refilled per second
+    burst: int  # bucket capacity
+
+
+def parse_throttle_rules(raw: str) -> dict[str, ThrottleRule]:
+    """Parse `key=rate/burst,...`; keys are update types or callback data prefixes."""
+    rules: dict[str, ThrottleRule] = {}
+    for part in raw.split(","):
+        if not part.strip():
+            continue
+        key, _, spec = part.partition("=")
+        rate, _, burst = spec.partition("/")
+        try:
+            rule = ThrottleRule(rate=float(rate), burst=int(burst or 1))
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid throttle rule {part.strip()!r}, expected key=rate/burst"
+            ) from exc
+        if rule.rate <= 0 or rule.burst < 1:
+            raise ValueError(
+                f"Invalid throttle rule {part.strip()!r}, rate and burst must be positive"
+            )
+        rules[key.strip()] = rule
+    return rules
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """Per-user token buckets that drop update floods before a DB session is opened.
+
+    Register as an outer middleware on `message` and `callback_query`. Callback rules are
+    looked up by callback data prefix first, then by update type. Only updates beyond the
+    bucket are dropped; an excess press of the same button on the same message within
+    `merge_window` is counted as merged into the previous one. Dropped callbacks are
+    answered with a short "slow down" toast, dropped messages are ignored.
+    """
+
+    def __init__(
+        self,
+        rules: dict[str, ThrottleRule],
+        merge_window: float = THROTTLE_MERGE_WINDOW,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.rules = rules
+        self.merge_window = merge_window
+        self.clock = clock
+        # (user id, rule key) -> [tokens, last refill]
+        self._buckets: dict[tuple[int, str], list[float]] = {}
+        # user id -> (message id, callback data, pressed at)
+        self._last_clicks: dict[int, tuple[int | None, str, float]] = {}
+
+    def _rule_for(self, event: TelegramObject) -> tuple[str, ThrottleRule] | None:
+        if isinstance(event, CallbackQuery):
+            prefix = (event.data or "").split(":", 1)[0]
+            rule = self.rules.get(prefix)
+            if rule is not None:
+                return prefix, rule
+            key = "callback_query"
+        else:
+            key = "message"
+        rule = self.rules.get(key)
+        return (key, rule) if rule is not None else None
+
+    def _take(self, user_id: int, key: str, rule: ThrottleRule, now: float) -> bool:
+        bucket = self._buckets.get((user_id, key))
+        if bucket is None:
+            if len(self._buckets) >= THROTTLE_MAX_BUCKETS:
+                self._prune(now)
+            bucket = self._buckets[(user_id, key)] = [float(rule.burst), now]
+        tokens = min(rule.burst, bucket[0] + (now - bucket[1]) * rule.rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    def _prune(self, now: float) -> None:
+        for (user_id, key), (tokens, updated) in list(self._buckets.items()):
+            rule = self.rules.get(key)
+            if rule is None or tokens + (now - updated) * rule.rate >= rule.burst:
+                del self._buckets[(user_id, key)]
+        for user_id, (_, _, pressed) in list(self._last_clicks.items()):
+            if now - pressed > self.merge_window:
+                del self._last_clicks[user_id]
+
+    def _is_repeat_click(self, event: CallbackQuery, now: float) -> bool:
+        message_id = event.message.message_id if event.message else None
+        click = (message_id, event.data or "")
+        last = self._last_clicks.get(event.from_user.id)
+        self._last_clicks[event.from_user.id] = (*click, now)
+        return last is not None and last[:2] == click and now - last[2] < self.merge_window
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        from_user = getattr(event, "from_user", None)
+        match = self._rule_for(event)
+        if from_user is None or match is None:
+            return await handler(event, data)
+        key, rule = match
+        now = self.clock()
+        event_type = "callback_query" if isinstance(event, CallbackQuery) else "message"
+        # check before taking a token: every click must update the last-click record
+        repeat = isinstance(event, CallbackQuery) and self._is_repeat_click(event, now)
+        if self._take(from_user.id, key, rule, now):
+            return await handler(event, data)
+        reason = "merged" if repeat else "rate_limited"
+
+        get_metrics().throttled.inc(event_type, key, reason)
+        logger.debug("Throttled %s from user %s: %s (%s)", event_type, from_user.id, key, reason)
+        if isinstance(event, CallbackQuery):
+            with suppress(TelegramAPIError):
+                await event.answer(texts["throttled"])
+        return None
@@ -0,0 +1,127 @@
+import logging
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject
+
+from bot.internal.log_context import (
+    UpdateContext,
+    bind_update,
+    current_update,
+    get_query_inspection,
+    repeated_statements,
+    unbind_update,
+)
+from bot.internal.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateContextMiddleware(BaseMiddleware):
+    """Binds a correlation id to each update and logs one summary record when it is done."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        from_user = getattr(event.event, "from_user", None)
+        context = UpdateContext(
+            correlation_id=uuid4().hex[:12],
+            update_id=event.update_id,
+            user_id=from_user.id if from_user else None,
+            started=perf_counter(),
+        )
+        token = bind_update(context)
+        status = "error"
+        try:
+            res = await handler(event, data)
+            status = "unhandled" if res is UNHANDLED else "handled"
+            return res
+        finally:
+            repeated = self._inspect_queries(context)
+            total_ms = round((perf_counter() - context.started) * 1000, 2)
+            metrics = get_metrics()
+            metrics.updates.inc(event.event_type, status)
+            metrics.db_queries.inc(amount=context.db_queries)
+            metrics.db_seconds.inc(amount=context.db_time)
+            logger.info(
+                "update %s %s %s in %.1f ms",
+                event.update_id,
+                event.event_type,
+                status,
+                total_ms,
+                extra={
+                    "summary": True,
+                    "event_type": event.event_type,
+                    "status": status,
+                    "total_ms": total_ms,
+                    "db_queries": context.db_queries,
+                    "api_calls": context.api_calls,
+                    "repeated_statements": repeated,
+                },
+            )
+            unbind_update(token)
+
+    @staticmethod
+    def _inspect_queries(context: UpdateContext) -> int:
+        inspection = get_query_inspection()
+        if not inspection.enabled:
+            return 0
+        if context.db_queries > inspection.max_queries:
+            logger.warning(
+                "Update %s ran %s queries (limit %s) in %s",
+                context.update_id,
+                context.db_queries,
+                inspection.max_queries,
+                context.handler,
+            )
+        repeated = repeated_statements(context, inspection.repeat_threshold)
+        for statement, count in repeated:
+            logger.warning(
+                "Possible N+1 in %s: statement ran %s times: %s",
+                context.handler,
+                count,
+                " ".join(statement.split())[:300],
+            )
+        return len(repeated)
+
+
+class ApiTimingMiddleware(BaseRequestMiddleware):
+    """Adds Bot API round-trip time to the update that made the request."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        api_method = method.__api_method__
+        started = perf_counter()
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter:
+            get_metrics().api_errors.inc(api_method, "retry_after")
+            raise
+        except Exception as exc:
+            get_metrics().api_errors.inc(api_method, type(exc).__name__)
+            raise
+        finally:
+            elapsed = perf_counter() - started
+            get_metrics().api_latency.observe(elapsed, api_method)
+            context = current_update()
+            if context is not None:
+                context.api_time += elapsed
+                context.api_calls += 1
@@ -6,20 +6,31 @@ from aiogram import BaseMiddleware
 from aiogram.dispatcher.event.bases import UNHANDLED
 from aiogram.types import TelegramObject
 
+from bot.internal.update_dump import UpdateDumper, UpdateJournal
+
 logger = logging.getLogger(__name__)
 
 
 class UpdatesDumperMiddleware(BaseMiddleware):
+    def __init__(
+        self, dumper: UpdateDumper | None = None, journal: UpdateJournal | None = None
+    ) -> None:
+        self.dumper = dumper
+        self.journal = journal
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        json_event = event.model_dump_json(exclude_unset=True)
+        if self.journal is not None:
+            self.journal.record(event)
+        dumper = self.dumper
+        if dumper is not None and dumper.wants(event.event_type):
+            dumper.submit(event)
 
-        logger.debug(json_event)
         res = await handler(event, data)
-        if res is UNHANDLED:
-            logger.debug("UNHANDLED")
+        if res is UNHANDLED and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("UNHANDLED %s update_id=%s", event.event_type, event.update_id)
         return res
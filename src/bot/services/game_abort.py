@@ -6,7 +6,9 @@ from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config import settings
+from bot.controllers.user_directory import mark_users_changed
 from bot.internal.context import GameStatus
+from bot.services.stats_maintenance import rebuild_derived_stats
 from database.models import Debt, Game, Record, User
 
 logger = logging.getLogger(__name__)
@@ -58,9 +60,10 @@ async def _restore_last_time_played(db_session: AsyncSession) -> int | None:
 
 async def hard_abort_game(game_id: int, bot: Bot, db_session: AsyncSession) -> HardAbortResult:
     game_result = await db_session.execute(
-        select(Game.message_id).where(Game.id == game_id)
+        select(Game.message_id, Game.status).where(Game.id == game_id)
     )
-    start_message_id = game_result.scalar_one_or_none()
+    game_row = game_result.one_or_none()
+    start_message_id, game_status = game_row if game_row else (None, None)
 
     players_result = await db_session.execute(
         select(Record.user_id).where(Record.game_id == game_id)
@@ -89,6 +92,9 @@ async def hard_abort_game(game_id: int, bot: Bot, db_session: AsyncSession) -> H
         )
 
     restored_from_game_id = await _restore_last_time_played(db_session)
+    mark_users_changed(db_session)
+    if game_status == GameStatus.FINISHED:
+        await rebuild_derived_stats(db_session)
     await db_session.commit()
 
     start_message_deleted = None
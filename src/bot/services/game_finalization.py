@@ -1,7 +1,6 @@
 import logging
 from dataclasses import dataclass
 from datetime import UTC
-from decimal import Decimal
 
 from aiogram import Bot
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,22 +11,25 @@ from bot.controllers.game import (
     commit_game_results_to_db,
     generate_yearly_stats_report,
     get_game_by_id,
-    get_group_game_report,
+    get_stats_distribution,
     get_yearly_stats,
+    render_and_store_game_report,
 )
 from bot.controllers.record import (
     check_game_balance,
     debt_calculator,
     get_mvp,
-    get_roi_from_game_by_player_id,
     update_net_profit_and_roi,
 )
-from bot.controllers.user import get_user_from_db_by_tg_id
+from bot.controllers.user_directory import get_user_directory
 from bot.internal.lexicon import texts
 from bot.internal.poll import unpin_current_poll
+from bot.internal.report_builder import send_report_text
 from bot.internal.schemas import GameBalanceData
 from bot.services.debt_notification import notify_all_debts
 from bot.services.photo_reminder import cancel_photo_reminder, clear_photo_warning
+from bot.services.stats_maintenance import apply_finished_game, record_committed_game
+from database.models import GameReport
 
 logger = logging.getLogger(__name__)
 
@@ -79,31 +81,25 @@ async def calculate_and_save_debts(
 async def determine_mvp(
     game_id: int,
     db_session: AsyncSession,
-) -> tuple[int | None, str | None, Decimal | None]:
+) -> int | None:
     mvp_id = await get_mvp(game_id, db_session)
     if mvp_id is None:
         logger.warning("No MVP found for game %s", game_id)
-        return None, None, None
+        return None
 
-    mvp_player = await get_user_from_db_by_tg_id(mvp_id, db_session)
-    if mvp_player is None:
+    if await get_user_directory().get(mvp_id, db_session) is None:
         logger.warning("MVP player not found in DB: user_id=%s", mvp_id)
-        return None, None, None
-
-    mvp_roi = await get_roi_from_game_by_player_id(game_id, mvp_id, db_session)
-    return mvp_id, mvp_player.fullname, mvp_roi
+        return None
+    return mvp_id
 
 
 async def send_game_report_to_group(
     bot: Bot,
     game_id: int,
-    mvp_fullname: str,
-    mvp_roi: Decimal,
-    db_session: AsyncSession,
+    report: GameReport,
 ) -> None:
-    """Generate and send game report to the group chat."""
-    text = await get_group_game_report(game_id, mvp_fullname, mvp_roi, db_session)
-    await bot.send_message(chat_id=settings.bot.GROUP_ID, text=text)
+    """Send the stored game report to the group chat."""
+    await bot.send_message(chat_id=settings.bot.GROUP_ID, text=report.group_report)
     logger.info("Game %s report sent to group", game_id)
 
 
@@ -125,9 +121,10 @@ async def send_yearly_stats_if_enabled(
 
     year = created_at.astimezone(settings.bot.TIMEZONE).year
     summary, players = await get_yearly_stats(year, db_session)
-    yearly_text = generate_yearly_stats_report(year, summary, players)
+    distribution = await get_stats_distribution(year, db_session)
+    yearly_text = generate_yearly_stats_report(year, summary, players, distribution)
 
-    await bot.send_message(chat_id=settings.bot.GROUP_ID, text=yearly_text)
+    await send_report_text(bot, settings.bot.GROUP_ID, yearly_text)
     logger.info("Yearly stats for %s sent to group", year)
 
 
@@ -150,7 +147,7 @@ async def finalize_game(
     await calculate_and_save_debts(game_id, db_session)
 
     # Step 3: Determine MVP
-    mvp_id, mvp_fullname, mvp_roi = await determine_mvp(game_id, db_session)
+    mvp_id = await determine_mvp(game_id, db_session)
     if mvp_id is None:
         return FinalizationResult(
             success=False,
@@ -165,7 +162,13 @@ async def finalize_game(
             error_message=texts["check_game_balance_error"],
         )
     await commit_game_results_to_db(game_id, results.total_pot, mvp_id, db_session)
+    await apply_finished_game(game_id, db_session)
+    report = await render_and_store_game_report(game_id, db_session)
     await db_session.commit()
+    try:
+        await record_committed_game(game_id, db_session)
+    except Exception:
+        logger.exception("Game %s: failed to update analytics snapshot", game_id)
 
     # Step 5: Send debt notifications
     try:
@@ -177,9 +180,9 @@ async def finalize_game(
 
     # Step 6: Send group report
     try:
-        if mvp_fullname is None or mvp_roi is None:
-            raise ValueError("MVP details missing")
-        await send_game_report_to_group(bot, game_id, mvp_fullname, mvp_roi, db_session)
+        if report is None:
+            raise ValueError("Game report missing")
+        await send_game_report_to_group(bot, game_id, report)
     except Exception:
         logger.exception("Game %s: failed to send group report", game_id)
 
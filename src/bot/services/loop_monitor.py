@@ -0,0 +1,140 @@
+import asyncio
+import html
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+from collections.abc import Awaitable, Callable
+from time import monotonic
+
+from bot.internal.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_INTERVAL = 0.1  # seconds between loop heartbeats
+LOOP_LAG_THRESHOLD = 0.25  # seconds of lag that count as a stall
+LOOP_LAG_SAMPLES = 3000  # about five minutes of heartbeats
+LAG_ALERT_COOLDOWN = 15 * 60
+
+
+class LoopLagMonitor:
+    """Measures event loop scheduling lag and captures the stack of whatever blocks it.
+
+    A task on the loop sleeps `interval` and records how late it wakes up. A watchdog
+    thread watches the task's heartbeat; once it is older than `threshold` the loop is
+    stuck, so the thread grabs the loop thread's current stack. When the loop recovers
+    the task reports the stall with that stack.
+    """
+
+    def __init__(
+        self,
+        on_stall: Callable[[float, str], Awaitable[object]] | None = None,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        threshold: float = LOOP_LAG_THRESHOLD,
+        samples: int = LOOP_LAG_SAMPLES,
+    ) -> None:
+        self.on_stall = on_stall
+        self.interval = interval
+        self.threshold = threshold
+        self.lags: deque[float] = deque(maxlen=samples)
+        self.stalls = 0
+        self._heartbeat = monotonic()
+        self._captured: str | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._alerts: set[asyncio.Task] = set()
+        self._stopped = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def percentile(self, fraction: float) -> float:
+        if not self.lags:
+            return 0.0
+        ordered = sorted(self.lags)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for alert in self._alerts:
+            alert.cancel()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self._heartbeat = monotonic()
+            self.lags.append(lag)
+            if lag >= self.threshold:
+                self._report(lag)
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if self._captured is not None:
+                continue
+            if monotonic() - self._heartbeat < self.threshold + self.interval:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._captured = "".join(traceback.format_stack(frame))
+
+    def _report(self, lag: float) -> None:
+        stack, self._captured = self._captured, None
+        stack = stack or "stack not captured (stall shorter than the watchdog interval)"
+        self.stalls += 1
+        logger.warning("Event loop blocked for %.0f ms, blocking stack:\n%s", lag * 1000, stack)
+        if self.on_stall is not None:
+            # a slow alert must not stall the heartbeat and trip the watchdog itself
+            alert = asyncio.create_task(self._send_alert(lag, stack))
+            self._alerts.add(alert)
+            alert.add_done_callback(self._alerts.discard)
+
+    async def _send_alert(self, lag: float, stack: str) -> None:
+        try:
+            await self.on_stall(lag, stack)
+        except Exception:
+            logger.exception("Failed to report event loop stall")
+
+    def register_gauges(self, registry: MetricsRegistry) -> None:
+        for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            registry.gauge(
+                f"bot_loop_lag_{name}_seconds",
+                f"Event loop lag {name} over the recent window.",
+                lambda fraction=fraction: self.percentile(fraction),
+            )
+        registry.gauge(
+            "bot_loop_lag_max_seconds",
+            "Worst event loop lag over the recent window.",
+            lambda: max(self.lags, default=0.0),
+        )
+        registry.gauge(
+            "bot_loop_stalls_total",
+            "Event loop stalls above the threshold.",
+            lambda: self.stalls,
+            kind="counter",
+        )
+
+
+def format_stall_alert(lag: float, stack: str) -> str:
+    return (
+        "<b>Event loop blocked</b>\n\n"
+        f"<b>Lag:</b> {lag * 1000:.0f} ms\n\n"
+        f"<b>Stack:</b>\n<code>{html.escape(stack[-3500:])}</code>"
+    )
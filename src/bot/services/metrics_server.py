@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+from aiohttp import web
+
+from bot.internal.metrics import MetricsRegistry, get_metrics, process_rss_bytes
+from bot.internal.single_flight import get_single_flight_stats
+from bot.middlewares.session_middleware import get_session_stats
+from bot.services.photo_reminder import pending_photo_reminders
+from bot.services.profile_sync import get_profile_sync_buffer
+from bot.services.report_worker import pending_reports
+from bot.services.year_review import year_review_delivery_running
+from database.database_connector import DatabaseConnector
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def register_runtime_gauges(
+    registry: MetricsRegistry, db: DatabaseConnector, poll_task: asyncio.Task | None = None
+) -> None:
+    registry.gauge(
+        "bot_process_rss_bytes", "Resident memory of the bot process.", process_rss_bytes
+    )
+
+    registry.gauge("bot_db_pool_size", "Pooled connections.", lambda: db.pool_stats().size)
+    registry.gauge(
+        "bot_db_pool_checked_out", "Connections in use.", lambda: db.pool_stats().checked_out
+    )
+    registry.gauge(
+        "bot_db_pool_utilization",
+        "Connections in use out of size plus overflow.",
+        lambda: db.pool_stats().utilization,
+    )
+    registry.gauge(
+        "bot_db_pool_checkouts_total",
+        "Connection checkouts.",
+        lambda: db.pool_stats().checkouts,
+        kind="counter",
+    )
+    registry.gauge(
+        "bot_db_pool_wait_seconds_total",
+        "Time spent waiting for a connection.",
+        lambda: db.pool_stats().total_wait,
+        kind="counter",
+    )
+    registry.gauge(
+        "bot_db_pool_wait_seconds_max", "Longest connection wait.", lambda: db.pool_stats().max_wait
+    )
+
+    sessions = get_session_stats()
+    registry.gauge(
+        "bot_db_sessions_touched_total",
+        "Updates that used the database.",
+        lambda: sessions.touched,
+        kind="counter",
+    )
+    registry.gauge(
+        "bot_db_sessions_committed_total",
+        "Updates that committed.",
+        lambda: sessions.committed,
+        kind="counter",
+    )
+    flights = get_single_flight_stats()
+    registry.gauge(
+        "bot_single_flight_coalesced_total",
+        "Stats queries answered by an in-flight twin.",
+        lambda: flights.coalesced,
+        kind="counter",
+    )
+
+    registry.gauge(
+        "bot_photo_reminders_pending", "Scheduled photo reminders.", pending_photo_reminders
+    )
+    registry.gauge(
+        "bot_poll_loop_running",
+        "Weekly poll loop is alive.",
+        lambda: poll_task is not None and not poll_task.done(),
+    )
+    registry.gauge("bot_reports_pending", "Reports being built by the worker.", pending_reports)
+    registry.gauge(
+        "bot_year_review_delivery_running",
+        "Year review delivery is in progress.",
+        year_review_delivery_running,
+    )
+    registry.gauge(
+        "bot_profile_changes_pending",
+        "Buffered profile name changes.",
+        lambda: len(get_profile_sync_buffer()),
+    )
+
+
+async def _serve_metrics(request: web.Request) -> web.Response:
+    return web.Response(
+        body=get_metrics().render().encode(), headers={"Content-Type": CONTENT_TYPE}
+    )
+
+
+async def start_metrics_server(host: str, port: int) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/metrics", _serve_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info("Metrics endpoint listening on http://%s:%s/metrics", host, port)
+    return runner
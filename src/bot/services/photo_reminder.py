@@ -36,6 +36,19 @@ def get_reminder_info(message_id: int) -> ReminderInfo | None:
     return _reminders.get(message_id)
 
 
+def has_image(message: Message) -> bool:
+    if message.photo:
+        return True
+    document = message.document
+    return document is not None and (document.mime_type or "").startswith("image/")
+
+
+def is_tracked_photo_reply(message: Message) -> bool:
+    """A photo or image document replying to a tracked start or reminder message."""
+    reply = message.reply_to_message
+    return reply is not None and reply.message_id in _reminders and has_image(message)
+
+
 def game_has_photo(game_id: int) -> bool:
     return any(Path("photos").glob(f"**/game{game_id}_*"))
 
@@ -77,6 +90,10 @@ def schedule_photo_reminder(
     logger.info("Photo reminder scheduled for game %s in %s seconds", game_id, PHOTO_REMINDER_DELAY)
 
 
+def pending_photo_reminders() -> int:
+    return len(_tasks)
+
+
 def cancel_photo_reminder(game_id: int) -> None:
     task = _tasks.pop(game_id, None)
     if task is not None:
@@ -9,8 +9,11 @@ from sqlalchemy.orm import selectinload
 
 from bot.config import settings
 from bot.controllers.debt import calculate_debt_amount
+from bot.controllers.game import render_and_store_game_report
 from bot.controllers.record import get_mvp, update_net_profit_and_roi
+from bot.controllers.user_directory import mark_users_changed
 from bot.internal.lexicon import texts
+from bot.services.stats_maintenance import rebuild_derived_stats
 from database.models import Debt, Game, Record, User
 
 logger = logging.getLogger(__name__)
@@ -230,6 +233,10 @@ async def delete_player_from_db(
 
     await db_session.delete(player)
     await db_session.flush()
+    mark_users_changed(db_session)
+    await rebuild_derived_stats(db_session)
+    for game_id in recalc_game_ids:
+        await render_and_store_game_report(game_id, db_session)
 
     logger.info(
         "Player deleted: admin_id=%s user_id=%s debts_removed=%s records_removed=%s "
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from contextlib import suppress
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from bot.controllers.game.stat_cards import invalidate_stat_cards
+from bot.controllers.user_directory import UserEntry, mark_users_changed
+from database.models import User
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SYNC_INTERVAL = 60.0  # seconds between batched profile writes
+
+_sync_task: asyncio.Task | None = None
+
+
+class ProfileSyncBuffer:
+    """Collects changed Telegram names in memory until the next batched write."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, dict[str, str | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def note(self, entry: UserEntry, fullname: str, username: str | None) -> None:
+        if entry.fullname == fullname and entry.username == username:
+            self._pending.pop(entry.id, None)
+            return
+        self._pending[entry.id] = {
+            "user_id": entry.id,
+            "new_fullname": fullname,
+            "new_username": username,
+        }
+
+    def take(self) -> list[dict[str, str | None]]:
+        rows = list(self._pending.values())
+        self._pending.clear()
+        return rows
+
+    def restore(self, rows: list[dict[str, str | None]]) -> None:
+        """Put back rows of a failed write unless a newer change arrived meanwhile."""
+        for row in rows:
+            self._pending.setdefault(row["user_id"], row)
+
+
+async def write_profile_changes(
+    rows: list[dict[str, str | None]], db_session: AsyncSession
+) -> None:
+    users = User.__table__
+    await db_session.execute(
+        update(users)
+        .where(users.c.id == bindparam("user_id"))
+        .values(fullname=bindparam("new_fullname"), username=bindparam("new_username")),
+        rows,
+    )
+    mark_users_changed(db_session)
+    invalidate_stat_cards()
+
+
+_buffer = ProfileSyncBuffer()
+
+
+def get_profile_sync_buffer() -> ProfileSyncBuffer:
+    return _buffer
+
+
+async def flush_profile_changes(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    """Write all buffered profile changes in one executemany."""
+    rows = _buffer.take()
+    if not rows:
+        return 0
+    try:
+        async with session_factory() as db_session:
+            await write_profile_changes(rows, db_session)
+            await db_session.commit()
+    except BaseException:
+        # includes cancellation mid-write, so taken rows are never lost
+        _buffer.restore(rows)
+        raise
+    logger.info("Profile changes written: users=%s", len(rows))
+    return len(rows)
+
+
+async def _sync_loop(session_factory: async_sessionmaker[AsyncSession], interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_profile_changes(session_factory)
+        except Exception:
+            logger.exception("Profile sync failed")
+
+
+def start_profile_sync(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float = PROFILE_SYNC_INTERVAL,
+) -> asyncio.Task:
+    global _sync_task
+    if _sync_task is None or _sync_task.done():
+        _sync_task = asyncio.create_task(_sync_loop(session_factory, interval))
+    return _sync_task
+
+
+async def stop_profile_sync(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Cancel the periodic writer and write whatever is still buffered."""
+    global _sync_task
+    task, _sync_task = _sync_task, None
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await flush_profile_changes(session_factory)
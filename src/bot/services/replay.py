@@ -0,0 +1,229 @@
+import argparse
+import asyncio
+import logging
+import time
+import types
+import typing
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+import aiogram.methods
+from aiogram import Bot
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.enums import ParseMode
+from aiogram.methods.base import TelegramMethod
+from aiogram.types import ErrorEvent, File, Message, TelegramObject, User
+from aiohttp import web
+
+from bot.internal.single_flight import configure_single_flight
+from bot.internal.update_dump import read_journal
+from bot.main import build_dispatcher
+from bot.middlewares.logging_middleware import LoggingMiddleware
+from database.database_connector import DatabaseConnector
+
+logger = logging.getLogger(__name__)
+
+REPLAY_BOT_TOKEN = "123456:REPLAY"
+
+
+@cache
+def _api_returning() -> dict[str, Any]:
+    return {
+        method.__api_method__: method.__returning__
+        for method in vars(aiogram.methods).values()
+        if isinstance(method, type)
+        and issubclass(method, TelegramMethod)
+        and hasattr(method, "__api_method__")
+    }
+
+
+def _returns(returning: Any, kind: type) -> bool:
+    if isinstance(returning, types.UnionType) or typing.get_origin(returning) is typing.Union:
+        return kind in typing.get_args(returning)
+    return returning is kind or typing.get_origin(returning) is kind
+
+
+class FakeBotAPI:
+    """Local HTTP stand-in for the Bot API that accepts every call with a plausible result."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self._message_ids = count(1)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _message(self, params: dict[str, str]) -> dict[str, Any]:
+        raw_chat_id = params.get("chat_id", "")
+        chat_id = int(raw_chat_id) if raw_chat_id.lstrip("-").isdigit() else 0
+        return {
+            "message_id": int(params.get("message_id") or next(self._message_ids)),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private" if chat_id > 0 else "supergroup"},
+            "from": self._bot_user(),
+            "text": params.get("text", ""),
+        }
+
+    @staticmethod
+    def _bot_user() -> dict[str, Any]:
+        return {"id": int(REPLAY_BOT_TOKEN.split(":")[0]), "is_bot": True, "first_name": "Replay"}
+
+    def _result(self, method: str, params: dict[str, str]) -> Any:
+        returning = _api_returning().get(method, bool)
+        if _returns(returning, Message):
+            return self._message(params)
+        if _returns(returning, User):
+            return self._bot_user()
+        if _returns(returning, File):
+            return {"file_id": params.get("file_id", "file"), "file_unique_id": "file"}
+        if _returns(returning, list):
+            return []
+        return True
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = {key: str(value) for key, value in (await request.post()).items()}
+        self.calls[method] += 1
+        return web.json_response({"ok": True, "result": self._result(method, params)})
+
+
+class HandlerTimingMiddleware(LoggingMiddleware):
+    def __init__(self, timings: dict[str, list[float]]) -> None:
+        super().__init__()
+        self.timings = timings
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        name = self._handler_name(handler, data)
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            self.timings[name].append(time.perf_counter() - started)
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    updates: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    timings: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    api_calls: Counter[str] = field(default_factory=Counter)
+
+    def summary_lines(self) -> list[str]:
+        lines = [
+            f"Replayed {self.updates} updates in {self.elapsed:.2f}s, failed: {self.failed}",
+            f"{'handler':<36} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}",
+        ]
+        for name, samples in sorted(self.timings.items(), key=lambda item: -sum(item[1])):
+            ordered = sorted(samples)
+            p50 = ordered[len(ordered) // 2] * 1000
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+            lines.append(
+                f"{name:<36} {len(ordered):>6} {p50:>8.1f} {p95:>8.1f} {ordered[-1] * 1000:>8.1f}"
+            )
+        calls = ", ".join(f"{method}={n}" for method, n in self.api_calls.most_common())
+        lines.append(f"Bot API calls: {calls or 'none'}")
+        return lines
+
+
+async def replay(segments: list[Path], db_url: str, pace: str = "max") -> ReplayReport:
+    """Feed journaled updates one by one through the real dispatcher.
+
+    Bot API calls go to a local fake server and all writes go to `db_url`, which must
+    be a disposable database. With `pace="original"` the gaps between updates are kept.
+    """
+    report = ReplayReport()
+    api = FakeBotAPI()
+    db = DatabaseConnector(url=db_url)
+    bot = Bot(
+        token=REPLAY_BOT_TOKEN,
+        session=AiohttpSession(api=TelegramAPIServer.from_base(await api.start())),
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+    dispatcher = build_dispatcher(db, bot)
+    configure_single_flight(db.session_factory)
+    timing = HandlerTimingMiddleware(report.timings)
+    for observer in (dispatcher.message, dispatcher.callback_query, dispatcher.inline_query):
+        observer.middleware.register(timing)
+    failed_updates: set[int] = set()
+
+    async def record_failure(
+        handler: Callable[[ErrorEvent, dict[str, Any]], Awaitable[Any]],
+        event: ErrorEvent,
+        data: dict[str, Any],
+    ) -> Any:
+        # errors_router handles the exception, so feed_update does not raise
+        failed_updates.add(event.update.update_id)
+        return await handler(event, data)
+
+    dispatcher.errors.outer_middleware(record_failure)
+
+    started = time.perf_counter()
+    first_received: float | None = None
+    try:
+        for segment in segments:
+            for entry in read_journal(segment):
+                if pace == "original":
+                    if first_received is None:
+                        first_received = entry.received_at
+                    delay = entry.received_at - first_received - (time.perf_counter() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                report.updates += 1
+                try:
+                    await dispatcher.feed_update(bot, entry.update)
+                except Exception:
+                    failed_updates.add(entry.update.update_id)
+                    logger.exception("Update %s failed", entry.update.update_id)
+    finally:
+        report.elapsed = time.perf_counter() - started
+        report.failed = len(failed_updates)
+        report.api_calls.update(api.calls)
+        configure_single_flight(None)
+        await bot.session.close()
+        await api.stop()
+        await db.dispose()
+    return report
+
+
+def run_main():
+    parser = argparse.ArgumentParser(description="Replay journaled updates against a test database")
+    parser.add_argument("segments", nargs="+", type=Path, help="journal segments (*.ndjson.gz)")
+    parser.add_argument("--db-url", required=True, help="disposable PostgreSQL URL to replay into")
+    parser.add_argument("--pace", choices=("max", "original"), default="max")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(replay(args.segments, args.db_url, args.pace))
+    print("\n".join(report.summary_lines()))
+
+
+if __name__ == "__main__":
+    run_main()
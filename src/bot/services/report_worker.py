@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from aiogram import Bot
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.reports import (
+    generate_all_time_stats_report,
+    generate_range_stats_report,
+    generate_yearly_stats_report,
+)
+from bot.controllers.game.rollups import get_range_stats
+from bot.controllers.game.stats import (
+    get_all_time_stats,
+    get_stats_distribution,
+    get_yearly_stats,
+)
+from bot.controllers.game.streaks import get_group_streak_records
+from bot.controllers.game.types import ReportJob
+from bot.internal.context import ReportKind
+from bot.internal.lexicon import texts
+from bot.internal.report_builder import send_report_text
+
+logger = logging.getLogger(__name__)
+
+_worker: "ReportWorker | None" = None
+_pending: set[asyncio.Task] = set()
+
+# State of the worker process itself, set up once by `_init_child`.
+_child_loop: asyncio.AbstractEventLoop | None = None
+_child_db = None
+
+
+async def build_report(job: ReportJob, db_session: AsyncSession) -> str:
+    match job.kind:
+        case ReportKind.ALL_TIME:
+            summary, players = await get_all_time_stats(db_session)
+            streaks = await get_group_streak_records(db_session)
+            distribution = await get_stats_distribution(None, db_session)
+            return generate_all_time_stats_report(summary, players, streaks, distribution)
+        case ReportKind.YEARLY:
+            summary, players = await get_yearly_stats(job.year, db_session)
+            distribution = await get_stats_distribution(job.year, db_session)
+            return generate_yearly_stats_report(job.year, summary, players, distribution)
+        case ReportKind.RANGE:
+            summary, players = await get_range_stats(job.start, job.end, db_session)
+            return generate_range_stats_report(job.start, job.end, summary, players)
+    raise ValueError(f"Unknown report kind: {job.kind}")
+
+
+def _init_child(db_url: str) -> None:
+    from database.database_connector import DatabaseConnector
+
+    global _child_loop, _child_db
+    _child_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_child_loop)
+    _child_db = DatabaseConnector(url=db_url)
+
+
+def _ready() -> None:
+    """No-op job: submitting it spawns the process and runs `_init_child` ahead of time."""
+
+
+def _run_in_child(job: ReportJob) -> str:
+    async def run() -> str:
+        async with _child_db.session_factory() as db_session:
+            return await build_report(job, db_session)
+
+    return _child_loop.run_until_complete(run())
+
+
+class ReportWorker:
+    """Builds reports in a separate process with its own engine and connection pool."""
+
+    def __init__(self, db_url: str, processes: int = 1) -> None:
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_child,
+            initargs=(db_url,),
+        )
+
+    def prestart(self) -> None:
+        self._pool.submit(_ready)
+
+    async def run(self, job: ReportJob) -> str:
+        return await asyncio.wrap_future(self._pool.submit(_run_in_child, job))
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def pending_reports() -> int:
+    return len(_pending)
+
+
+def get_report_worker() -> ReportWorker | None:
+    return _worker
+
+
+def enable_report_worker(db_url: str) -> ReportWorker:
+    global _worker
+    if _worker is None:
+        _worker = ReportWorker(db_url)
+        _worker.prestart()
+    return _worker
+
+
+async def disable_report_worker() -> None:
+    """Cancel undelivered reports while the bot session is still open, then stop the pool."""
+    global _worker
+    worker, _worker = _worker, None
+    pending = list(_pending)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    if worker is not None:
+        worker.shutdown()
+
+
+async def _deliver(bot: Bot, chat_id: int, job: ReportJob, worker: ReportWorker) -> None:
+    try:
+        text = await worker.run(job)
+    except Exception:
+        logger.exception("Report job failed: %s", job)
+        text = texts["report_failed"]
+    await send_report_text(bot, chat_id, text)
+
+
+async def send_report(bot: Bot, chat_id: int, job: ReportJob, db_session: AsyncSession) -> None:
+    """Post a report to `chat_id`, building it in the worker process when one is running.
+
+    With a worker the handler returns right away and the report is posted once ready.
+    """
+    worker = get_report_worker()
+    if worker is None:
+        await send_report_text(bot, chat_id, await build_report(job, db_session))
+        return
+    await bot.send_message(chat_id=chat_id, text=texts["report_building"])
+    task = asyncio.create_task(_deliver(bot, chat_id, job, worker))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game.analytics import get_analytics_engine
+from bot.controllers.game.bankroll import apply_game_to_bankroll, rebuild_bankroll
+from bot.controllers.game.game_reports import backfill_game_reports
+from bot.controllers.game.leaderboard import refresh_leaderboard
+from bot.controllers.game.rollups import rebuild_monthly_rollups, refresh_game_month_rollups
+from bot.controllers.game.stat_cards import invalidate_stat_cards
+from bot.controllers.game.streaks import apply_game_to_streaks, rebuild_streaks
+from database.database_connector import get_db
+
+logger = logging.getLogger(__name__)
+
+
+async def apply_finished_game(game_id: int, db_session: AsyncSession) -> None:
+    """Update derived stats with a freshly finalized game (same transaction)."""
+    await apply_game_to_streaks(game_id, db_session)
+    await apply_game_to_bankroll(game_id, db_session)
+    await refresh_leaderboard(db_session)
+    await refresh_game_month_rollups(game_id, db_session)
+
+
+async def record_committed_game(game_id: int, db_session: AsyncSession) -> None:
+    """Feed a committed finished game to in-memory analytics, if enabled."""
+    invalidate_stat_cards()
+    engine = get_analytics_engine()
+    if engine is not None:
+        await engine.append_game(game_id, db_session)
+
+
+async def rebuild_derived_stats(db_session: AsyncSession) -> None:
+    """Recompute derived stats after history was rewritten (abort, deletion, correction)."""
+    await rebuild_streaks(db_session)
+    await rebuild_bankroll(db_session)
+    await refresh_leaderboard(db_session)
+    await rebuild_monthly_rollups(db_session)
+    invalidate_stat_cards()
+    engine = get_analytics_engine()
+    if engine is not None:
+        engine.invalidate()
+
+
+async def _rebuild_all() -> None:
+    db = get_db()
+    try:
+        async with db.session_factory() as db_session:
+            await rebuild_derived_stats(db_session)
+            await backfill_game_reports(db_session)
+            await db_session.commit()
+    finally:
+        await db.dispose()
+
+
+def run_main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_rebuild_all())
+
+
+if __name__ == "__main__":
+    run_main()
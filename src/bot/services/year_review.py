@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from bot.controllers.game.reports import render_year_review
+from bot.controllers.game.year_review import build_year_reviews
+from bot.internal.context import DeliveryStatus
+from bot.internal.notify_admin import send_message_to_player
+from bot.internal.report_builder import SendRateLimiter
+from database.models import User, YearReviewDelivery
+
+logger = logging.getLogger(__name__)
+
+YEAR_REVIEW_SEND_INTERVAL = 1.0  # seconds between DMs
+
+_delivery_task: asyncio.Task | None = None
+
+
+async def enqueue_year_reviews(year: int, db_session: AsyncSession) -> int:
+    """Render every player's review into the delivery table; already queued players are kept."""
+    reviews = await build_year_reviews(year, db_session)
+    if not reviews:
+        return 0
+    result = await db_session.execute(
+        insert(YearReviewDelivery)
+        .values(
+            [
+                {
+                    "year": year,
+                    "user_id": review.user_id,
+                    "text": render_year_review(review),
+                    "status": DeliveryStatus.PENDING,
+                }
+                for review in reviews
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["year", "user_id"])
+        .returning(YearReviewDelivery.id)
+    )
+    queued = len(result.all())
+    logger.info("Year %s reviews queued: %s of %s players", year, queued, len(reviews))
+    return queued
+
+
+async def _claim_next(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> tuple[int, int, str, str] | None:
+    async with session_factory() as db_session:
+        result = await db_session.execute(
+            select(YearReviewDelivery, User.fullname)
+            .join(User, User.id == YearReviewDelivery.user_id)
+            .where(YearReviewDelivery.status == DeliveryStatus.PENDING)
+            .order_by(YearReviewDelivery.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=YearReviewDelivery)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        delivery, fullname = row
+        # committed before sending: a crash mid-send leaves SENDING, which is never retried
+        delivery.status = DeliveryStatus.SENDING
+        await db_session.commit()
+        return delivery.id, delivery.user_id, fullname, delivery.text
+
+
+async def _finish(
+    session_factory: async_sessionmaker[AsyncSession],
+    delivery_id: int,
+    status: DeliveryStatus,
+    message_id: int | None = None,
+) -> None:
+    async with session_factory() as db_session:
+        await db_session.execute(
+            update(YearReviewDelivery)
+            .where(YearReviewDelivery.id == delivery_id)
+            .values(
+                status=status,
+                message_id=message_id,
+                sent_at=datetime.now(UTC).replace(tzinfo=None),
+            )
+        )
+        await db_session.commit()
+
+
+async def _send(bot: Bot, user_id: int, fullname: str, text: str):
+    while True:
+        try:
+            return await send_message_to_player(bot, user_id=user_id, fullname=fullname, text=text)
+        except TelegramRetryAfter as error:
+            logger.warning("Year review send throttled, retrying in %ss", error.retry_after)
+            await asyncio.sleep(error.retry_after)
+
+
+async def deliver_pending_year_reviews(
+    bot: Bot,
+    session_factory: async_sessionmaker[AsyncSession],
+    limiter: SendRateLimiter | None = None,
+) -> int:
+    """Send queued reviews one at a time until none are pending; returns the number sent."""
+    limiter = limiter or SendRateLimiter(YEAR_REVIEW_SEND_INTERVAL)
+    sent = 0
+    while (claimed := await _claim_next(session_factory)) is not None:
+        delivery_id, user_id, fullname, text = claimed
+        await limiter.wait()
+        try:
+            message = await _send(bot, user_id, fullname, text)
+        except Exception:
+            logger.exception("Year review delivery %s failed for user %s", delivery_id, user_id)
+            message = None
+        if message is None:
+            await _finish(session_factory, delivery_id, DeliveryStatus.FAILED)
+            continue
+        await _finish(session_factory, delivery_id, DeliveryStatus.SENT, message.message_id)
+        sent += 1
+    logger.info("Year review delivery finished: sent=%s", sent)
+    return sent
+
+
+def year_review_delivery_running() -> bool:
+    return _delivery_task is not None and not _delivery_task.done()
+
+
+def start_year_review_delivery(
+    bot: Bot, session_factory: async_sessionmaker[AsyncSession]
+) -> asyncio.Task:
+    global _delivery_task
+    if _delivery_task is None or _delivery_task.done():
+        _delivery_task = asyncio.create_task(deliver_pending_year_reviews(bot, session_factory))
+    return _delivery_task
+
+
+async def resume_year_review_delivery(
+    bot: Bot, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    """Restart delivery after a restart; interrupted sends are reported, not repeated."""
+    async with session_factory() as db_session:
+        counts_result = await db_session.execute(
+            select(YearReviewDelivery.status, func.count())
+            .where(YearReviewDelivery.status.in_((DeliveryStatus.PENDING, DeliveryStatus.SENDING)))
+            .group_by(YearReviewDelivery.status)
+        )
+        counts = dict(counts_result.all())
+    if counts.get(DeliveryStatus.SENDING):
+        logger.warning(
+            "Year reviews interrupted mid-send, not resent: %s", counts[DeliveryStatus.SENDING]
+        )
+    if counts.get(DeliveryStatus.PENDING):
+        start_year_review_delivery(bot, session_factory)
@@ -1,11 +1,86 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from bot.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_out: int
+    peak_checked_out: int
+    checkouts: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def capacity(self) -> int:
+        return self.size + self.max_overflow
+
+    @property
+    def utilization(self) -> float:
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.checkouts if self.checkouts else 0.0
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait to check out a connection."""
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = perf_counter() - started
+            self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+
 
 class DatabaseConnector:
-    def __init__(self, url: str, echo: bool = False) -> None:
-        self.engine = create_async_engine(url=url, echo=echo)
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+    ) -> None:
+        self.engine = create_async_engine(
+            url=url,
+            echo=echo,
+            poolclass=TimedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={"statement_cache_size": statement_cache_size},
+        )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             expire_on_commit=False,
@@ -13,9 +88,64 @@ class DatabaseConnector:
             autoflush=False,
         )
 
+    def pool_stats(self) -> PoolStats:
+        pool = self.engine.pool
+        return PoolStats(
+            size=pool.size(),
+            max_overflow=pool.max_overflow,
+            checked_out=pool.checkedout(),
+            peak_checked_out=pool.peak_checked_out,
+            checkouts=pool.checkouts,
+            total_wait=pool.total_wait,
+            max_wait=pool.max_wait,
+        )
+
+    async def warmup(
+        self,
+        connections: int,
+        prime: Callable[[AsyncSession], Awaitable[object]] | None = None,
+    ) -> None:
+        """Open `connections` pooled connections at once and run `prime` on each.
+
+        Every connection keeps its own prepared statement cache, so priming them all
+        lets the first real updates skip both the connect and the PREPARE round trips.
+        """
+        connections = max(1, min(connections, self.engine.pool.size()))
+        barrier = asyncio.Barrier(connections)
+
+        async def open_one() -> None:
+            async with self.session_factory() as db_session:
+                try:
+                    await db_session.connection()
+                    if prime is not None:
+                        await prime(db_session)
+                except BaseException:
+                    await barrier.abort()
+                    raise
+                await barrier.wait()
+
+        results = await asyncio.gather(
+            *(open_one() for _ in range(connections)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, asyncio.BrokenBarrierError
+            ):
+                raise result
+        logger.info("Database pool warmed up: connections=%s", connections)
+
     async def dispose(self) -> None:
         await self.engine.dispose()
 
 
 def get_db() -> DatabaseConnector:
-    return DatabaseConnector(url=settings.db.db_url, echo=settings.db.echo)
+    return DatabaseConnector(
+        url=settings.db.db_url,
+        echo=settings.db.echo,
+        pool_size=settings.db.POOL_SIZE,
+        max_overflow=settings.db.MAX_OVERFLOW,
+        pool_timeout=settings.db.POOL_TIMEOUT,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        pool_pre_ping=settings.db.POOL_PRE_PING,
+        statement_cache_size=settings.db.STATEMENT_CACHE_SIZE,
+    )
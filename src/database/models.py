@@ -1,7 +1,8 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    ARRAY,
     BigInteger,
     CheckConstraint,
     ForeignKey,
@@ -9,11 +10,12 @@ from sqlalchemy import (
     Integer,
     Numeric,
     String,
+    Text,
     text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-from bot.internal.context import GameStatus
+from bot.internal.context import DeliveryStatus, GameStatus
 
 
 class Base(DeclarativeBase):
@@ -191,3 +193,119 @@ class NextGameSettings(Base):
     updated_by_admin_id: Mapped[int | None] = mapped_column(BigInteger)
     updated_by_admin_name: Mapped[str | None]
     updated_at: Mapped[datetime | None]
+
+
+class PlayerStreak(Base):
+    __tablename__ = "player_streaks"
+    __table_args__ = (Index("ux_player_streaks_user_id", "user_id", unique=True),)
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    last_game_id: Mapped[int | None]
+    current_win_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    longest_win_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    current_loss_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    longest_loss_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    best_profit: Mapped[int | None]
+    best_profit_game_id: Mapped[int | None]
+    current_attendance_streak: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+    longest_attendance_streak: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+
+
+class LeaderboardEntry(Base):
+    __tablename__ = "leaderboard_entries"
+    __table_args__ = (
+        Index("ux_leaderboard_entries_category_position", "category", "position", unique=True),
+    )
+
+    category: Mapped[int]
+    position: Mapped[int]
+    rank: Mapped[int]
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    value: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+
+
+class GameReport(Base):
+    __tablename__ = "game_reports"
+    __table_args__ = (Index("ux_game_reports_game_id", "game_id", unique=True),)
+
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False
+    )
+    group_report: Mapped[str] = mapped_column(Text)
+    players_report: Mapped[str] = mapped_column(Text)
+    settlement_report: Mapped[str] = mapped_column(Text)
+    chunks: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
+    updated_at: Mapped[datetime | None]
+
+
+class MonthlyPlayerRollup(Base):
+    __tablename__ = "monthly_player_rollups"
+    __table_args__ = (
+        Index("ux_monthly_player_rollups_month_user", "month", "user_id", unique=True),
+    )
+
+    month: Mapped[date]
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    games_played: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_buy_in: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    total_buy_out: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    mvp_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    games_hosted: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    best_roi: Mapped[Decimal | None] = mapped_column(Numeric(7, 2))
+
+
+class MonthlyGameRollup(Base):
+    __tablename__ = "monthly_game_rollups"
+    __table_args__ = (Index("ux_monthly_game_rollups_month", "month", unique=True),)
+
+    month: Mapped[date]
+    games_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_duration: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    biggest_pot: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    biggest_pot_game_id: Mapped[int | None]
+
+
+class BankrollPoint(Base):
+    __tablename__ = "bankroll_points"
+    __table_args__ = (
+        Index("ux_bankroll_points_user_sequence", "user_id", "sequence", unique=True),
+        Index("ix_bankroll_points_game_id", "game_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False
+    )
+    sequence: Mapped[int]
+    played_at: Mapped[datetime]
+    net: Mapped[int] = mapped_column(BigInteger)
+    cumulative_net: Mapped[int] = mapped_column(BigInteger)
+
+
+class YearReviewDelivery(Base):
+    __tablename__ = "year_review_deliveries"
+    __table_args__ = (
+        Index("ux_year_review_deliveries_year_user", "year", "user_id", unique=True),
+        Index("ix_year_review_deliveries_status", "status"),
+    )
+
+    year: Mapped[int]
+    user_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    text: Mapped[str] = mapped_column(Text)
+    status: Mapped[DeliveryStatus] = mapped_column(default=DeliveryStatus.PENDING)
+    message_id: Mapped[int | None]
+    sent_at: Mapped[datetime | None]
@@ -0,0 +1,36 @@
+"""Session event listeners that record whether a session touched the database or wrote."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+TOUCHED = "db_touched"
+WRITES = "db_writes"
+
+
+@event.listens_for(Session, "after_begin")
+def _mark_touched(session: Session, transaction, connection) -> None:
+    session.info[TOUCHED] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(WRITES, None)
+
+
+def has_pending_writes(db_session: AsyncSession) -> bool:
+    """Writes that still need a COMMIT: unflushed ORM changes or executed DML."""
+    return bool(
+        db_session.new or db_session.dirty or db_session.deleted or db_session.info.get(WRITES)
+    )
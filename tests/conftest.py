@@ -11,6 +11,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from alembic import command
+from bot.controllers.user_directory import get_user_directory
 from bot.internal.context import GameStatus
 from database.models import Debt, Game, Record, User
 
@@ -73,6 +74,7 @@ async def db_session(migrated_test_db_url: str):
 
     async with engine.begin() as conn:
         await conn.execute(_TRUNCATE_TEST_TABLES_SQL)
+    get_user_directory().invalidate()
 
     async_session_factory = async_sessionmaker(
         engine,
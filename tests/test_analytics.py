@@ -0,0 +1,141 @@
+"""Tests for the optional columnar analytics engine."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+pytest.importorskip("numpy")
+
+from bot.controllers.game.analytics import AnalyticsEngine, build_snapshot  # noqa: E402
+from bot.controllers.game.stats import _get_distribution, _get_stats  # noqa: E402
+from bot.internal.context import GameStatus  # noqa: E402
+from database.models import Game, Record, User  # noqa: E402
+
+
+def _record(game: Game, user_id: int, buy_in: int, buy_out: int, roi: str) -> Record:
+    return Record(
+        game_id=game.id,
+        user_id=user_id,
+        buy_in=buy_in,
+        buy_out=buy_out,
+        ROI=Decimal(roi),
+    )
+
+
+async def _seed_history(db_session: AsyncSession, users: list[User]) -> list[Game]:
+    games = [
+        Game(
+            admin_id=users[0].id,
+            host_id=users[1].id,
+            status=GameStatus.FINISHED,
+            total_pot=3000,
+            mvp_id=users[0].id,
+            duration=3600,
+            created_at=datetime(2025, 3, 1),
+        ),
+        Game(
+            admin_id=users[0].id,
+            host_id=users[1].id,
+            status=GameStatus.FINISHED,
+            total_pot=5000,
+            mvp_id=users[2].id,
+            duration=7200,
+            created_at=datetime(2026, 2, 1),
+        ),
+        Game(
+            admin_id=users[0].id,
+            host_id=users[2].id,
+            status=GameStatus.ACTIVE,
+            created_at=datetime(2026, 3, 1),
+        ),
+    ]
+    db_session.add_all(games)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            _record(games[0], 1, 1000, 2500, "150.00"),
+            _record(games[0], 2, 2000, 500, "-75.00"),
+            _record(games[1], 1, 2000, 1000, "-50.00"),
+            _record(games[1], 3, 3000, 4000, "33.33"),
+            Record(game_id=games[2].id, user_id=4, buy_in=1000),
+        ]
+    )
+    await db_session.flush()
+    return games
+
+
+def _normalized(stats):
+    summary, players = stats
+    summary.top_host_names = sorted(summary.top_host_names)
+    summary.top_mvp_names = sorted(summary.top_mvp_names)
+    return summary, players
+
+
+@pytest.mark.parametrize("year", [None, 2025, 2026, 2030])
+async def test_engine_matches_sql_stats(
+    db_session: AsyncSession, multiple_users: list[User], year: int | None
+):
+    await _seed_history(db_session, multiple_users)
+    engine = AnalyticsEngine()
+
+    engine_stats = await engine.get_stats(year, db_session)
+    sql_stats = await _get_stats(year, db_session)
+
+    assert _normalized(engine_stats) == _normalized(sql_stats)
+
+
+@pytest.mark.parametrize("year", [None, 2025, 2030])
+async def test_engine_distribution_matches_sql(
+    db_session: AsyncSession, multiple_users: list[User], year: int | None
+):
+    await _seed_history(db_session, multiple_users)
+    engine = AnalyticsEngine()
+
+    engine_distribution = await engine.get_distribution(year, db_session)
+    sql_distribution = await _get_distribution(year, db_session)
+
+    assert engine_distribution == sql_distribution
+
+
+async def test_append_game_extends_snapshot(
+    db_session: AsyncSession, multiple_users: list[User]
+):
+    games = await _seed_history(db_session, multiple_users)
+    engine = AnalyticsEngine()
+    await engine.load(db_session)
+    games[2].status = GameStatus.FINISHED
+    await db_session.flush()
+
+    await engine.append_game(games[2].id, db_session)
+    await engine.append_game(games[2].id, db_session)
+
+    assert engine.record_count == 5
+    assert engine.game_count == 3
+
+
+async def test_invalidate_reloads_on_next_request(
+    db_session: AsyncSession, multiple_users: list[User]
+):
+    await _seed_history(db_session, multiple_users)
+    engine = AnalyticsEngine()
+    await engine.load(db_session)
+    engine.invalidate()
+
+    await engine.append_game(999, db_session)
+    summary, _ = await engine.get_stats(None, db_session)
+
+    assert not engine.stale
+    assert summary.total_games == 2
+
+
+def test_empty_snapshot():
+    engine = build_snapshot([], [])
+
+    summary, players = engine.compute_stats(None, {})
+
+    assert summary.total_games == 0
+    assert summary.biggest_pot_game_id is None
+    assert summary.best_single_game_roi is None
+    assert players == []
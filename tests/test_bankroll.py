@@ -0,0 +1,145 @@
+"""Tests for bankroll running totals."""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import (
+    apply_game_to_bankroll,
+    format_player_bankroll,
+    get_bankroll_history,
+    rebuild_bankroll,
+    render_sparkline,
+)
+from bot.controllers.game.types import BankrollSample
+from bot.internal.context import GameStatus
+from database.models import BankrollPoint, Game, Record, User
+
+
+async def _finished_game(
+    db_session: AsyncSession, users: list[User], created_at: datetime, nets: dict[int, int]
+) -> Game:
+    game = Game(
+        admin_id=users[0].id,
+        host_id=users[1].id,
+        status=GameStatus.FINISHED,
+        created_at=created_at,
+    )
+    db_session.add(game)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Record(game_id=game.id, user_id=user_id, buy_in=1000, net_profit=net)
+            for user_id, net in nets.items()
+        ]
+    )
+    await db_session.flush()
+    return game
+
+
+def _sample(sequence: int, cumulative_net: int) -> BankrollSample:
+    return BankrollSample(
+        sequence=sequence,
+        game_id=sequence,
+        played_at=datetime(2025, 1, 1),
+        net=0,
+        cumulative_net=cumulative_net,
+    )
+
+
+class TestApplyGameToBankroll:
+    async def test_appends_running_totals(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        first = await _finished_game(
+            db_session, multiple_users, datetime(2025, 1, 5), {1: 500, 2: -500}
+        )
+        second = await _finished_game(
+            db_session, multiple_users, datetime(2025, 2, 5), {1: -200, 3: 200}
+        )
+
+        await apply_game_to_bankroll(first.id, db_session)
+        await apply_game_to_bankroll(second.id, db_session)
+        history = await get_bankroll_history(1, db_session)
+
+        assert [(sample.sequence, sample.cumulative_net) for sample in history] == [
+            (1, 500),
+            (2, 300),
+        ]
+
+    async def test_skips_already_applied_game(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        game = await _finished_game(db_session, multiple_users, datetime(2025, 1, 5), {1: 500})
+
+        await apply_game_to_bankroll(game.id, db_session)
+        await apply_game_to_bankroll(game.id, db_session)
+        count = await db_session.scalar(select(func.count()).select_from(BankrollPoint))
+
+        assert count == 1
+
+    async def test_ignores_active_game(self, db_session: AsyncSession, sample_game: Game):
+        await apply_game_to_bankroll(sample_game.id, db_session)
+
+        count = await db_session.scalar(select(func.count()).select_from(BankrollPoint))
+
+        assert count == 0
+
+
+class TestRebuildBankroll:
+    async def test_matches_incremental_totals(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        games = [
+            await _finished_game(
+                db_session, multiple_users, datetime(2025, month, 5), {1: net, 2: -net}
+            )
+            for month, net in ((1, 300), (2, -100), (3, 700))
+        ]
+        for game in games:
+            await apply_game_to_bankroll(game.id, db_session)
+        incremental = await get_bankroll_history(2, db_session)
+
+        rebuilt_count = await rebuild_bankroll(db_session)
+        rebuilt = await get_bankroll_history(2, db_session)
+
+        assert rebuilt_count == 6
+        assert [(s.sequence, s.game_id, s.cumulative_net) for s in rebuilt] == [
+            (s.sequence, s.game_id, s.cumulative_net) for s in incremental
+        ]
+        assert rebuilt[-1].cumulative_net == -900
+
+
+class TestGetBankrollHistory:
+    async def test_max_points_keeps_every_nth_and_latest(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        for day in range(1, 8):
+            await _finished_game(db_session, multiple_users, datetime(2025, 1, day), {1: 100})
+        await rebuild_bankroll(db_session)
+
+        history = await get_bankroll_history(1, db_session, max_points=3)
+
+        assert [sample.sequence for sample in history] == [3, 6, 7]
+        assert history[-1].cumulative_net == 700
+
+    async def test_empty_history(self, db_session: AsyncSession):
+        assert await get_bankroll_history(1, db_session, max_points=10) == []
+
+
+class TestSparkline:
+    def test_scales_between_min_and_max(self):
+        assert render_sparkline([0, 350, 700]) == "▁▅█"
+
+    def test_flat_series(self):
+        assert render_sparkline([5, 5]) == "▅▅"
+
+    def test_format_player_bankroll(self):
+        text = format_player_bankroll([_sample(1, -100), _sample(2, 250)])
+
+        assert "▁█" in text
+        assert "Net <b>+250</b> after 2 games" in text
+
+    def test_format_player_bankroll_empty(self):
+        assert format_player_bankroll([]) == ""
@@ -0,0 +1,120 @@
+"""Tests for stored game reports."""
+
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import (
+    backfill_game_reports,
+    format_game_report,
+    get_game_report,
+    render_and_store_game_report,
+    render_settlement_report,
+)
+from database.models import Debt, Game, GameReport, Record, User
+
+
+async def _add_records(db_session: AsyncSession, game: Game, users: list[User]) -> None:
+    db_session.add_all(
+        [
+            Record(
+                game_id=game.id,
+                user_id=users[0].id,
+                buy_in=1000,
+                buy_out=1800,
+                ROI=Decimal("80.00"),
+            ),
+            Record(game_id=game.id, user_id=users[1].id, buy_in=1000, buy_out=500),
+            Record(game_id=game.id, user_id=users[2].id, buy_in=1000, buy_out=700),
+        ]
+    )
+    await db_session.flush()
+
+
+class TestRenderAndStoreGameReport:
+    async def test_renders_all_sections(
+        self,
+        db_session: AsyncSession,
+        game_with_debts: tuple[Game, list[Debt]],
+        multiple_users: list[User],
+    ):
+        game, _ = game_with_debts
+        await _add_records(db_session, game, multiple_users)
+
+        report = await render_and_store_game_report(game.id, db_session)
+
+        assert report is not None
+        assert "Player One" in report.group_report
+        assert "80.00%" in report.group_report
+        assert report.players_report.index("Player One") < report.players_report.index(
+            "Player Two"
+        )
+        assert "(<b>+800</b>)" in report.players_report
+        assert "Player Two → Player One: <b>5.00 GEL</b>" in report.settlement_report
+        assert report.chunks == [
+            format_game_report(
+                report.group_report, report.players_report, report.settlement_report
+            )
+        ]
+
+    async def test_rerender_updates_single_row(
+        self,
+        db_session: AsyncSession,
+        finished_game: Game,
+        multiple_users: list[User],
+    ):
+        await _add_records(db_session, finished_game, multiple_users)
+        await render_and_store_game_report(finished_game.id, db_session)
+        finished_game.duration = 60
+        await db_session.flush()
+
+        report = await render_and_store_game_report(finished_game.id, db_session)
+        count = await db_session.scalar(select(func.count()).select_from(GameReport))
+
+        assert count == 1
+        assert report is not None
+        assert "Duration: <b>1m</b>" in report.group_report
+
+    async def test_skips_active_game(self, db_session: AsyncSession, sample_game: Game):
+        assert await render_and_store_game_report(sample_game.id, db_session) is None
+
+
+class TestGetGameReport:
+    async def test_serves_stored_text(self, db_session: AsyncSession, finished_game: Game):
+        db_session.add(
+            GameReport(
+                game_id=finished_game.id,
+                group_report="stored",
+                players_report="players",
+                settlement_report="settlement",
+            )
+        )
+        await db_session.flush()
+
+        report = await get_game_report(finished_game.id, db_session)
+
+        assert report is not None
+        assert report.group_report == "stored"
+
+    async def test_backfills_missing_report_once(
+        self, db_session: AsyncSession, finished_game: Game, multiple_users: list[User]
+    ):
+        await _add_records(db_session, finished_game, multiple_users)
+
+        first = await get_game_report(finished_game.id, db_session)
+        backfilled = await backfill_game_reports(db_session)
+
+        assert first is not None
+        assert backfilled == 0
+
+    async def test_returns_none_for_unknown_game(self, db_session: AsyncSession):
+        assert await get_game_report(999, db_session) is None
+
+
+def test_format_game_report_joins_sections():
+    settlement = render_settlement_report([])
+
+    text = format_game_report("group", "players", settlement)
+
+    assert text == "group\n\nplayers\n\n<b>Settlement</b>\nNo transfers needed."
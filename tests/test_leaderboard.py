@@ -0,0 +1,119 @@
+"""Tests for precomputed leaderboard ranks."""
+
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import get_leaderboard_page, refresh_leaderboard
+from bot.internal.context import GameStatus, LeaderboardCategory
+from database.models import Game, Record, User
+
+
+async def _finished_game(
+    db_session: AsyncSession,
+    users: list[User],
+    results: dict[int, tuple[int, int]],
+    mvp_id: int | None = None,
+) -> Game:
+    game = Game(
+        admin_id=users[0].id,
+        host_id=users[0].id,
+        status=GameStatus.FINISHED,
+        mvp_id=mvp_id,
+    )
+    db_session.add(game)
+    await db_session.flush()
+    for user_id, (buy_in, buy_out) in results.items():
+        db_session.add(
+            Record(
+                game_id=game.id,
+                user_id=user_id,
+                buy_in=buy_in,
+                buy_out=buy_out,
+                net_profit=buy_out - buy_in,
+            )
+        )
+    await db_session.flush()
+    return game
+
+
+class TestRefreshLeaderboard:
+    async def test_ranks_net_with_ties(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _finished_game(
+            db_session,
+            multiple_users,
+            {1: (1000, 1500), 2: (1000, 1500), 3: (1000, 0)},
+        )
+
+        await refresh_leaderboard(db_session)
+        page = await get_leaderboard_page(LeaderboardCategory.NET, db_session)
+
+        assert [(row.position, row.rank) for row in page.rows] == [(1, 1), (2, 1), (3, 3)]
+        assert [row.value for row in page.rows] == [Decimal(500), Decimal(500), Decimal(-1000)]
+        assert not page.has_prev
+        assert not page.has_next
+
+    async def test_skips_unfinished_games_and_zero_buy_in_roi(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _finished_game(db_session, multiple_users, {1: (1000, 2000), 2: (0, 0)}, mvp_id=1)
+        active_game = Game(
+            admin_id=multiple_users[0].id,
+            host_id=multiple_users[0].id,
+            status=GameStatus.ACTIVE,
+        )
+        db_session.add(active_game)
+        await db_session.flush()
+        db_session.add(Record(game_id=active_game.id, user_id=3, buy_in=1000))
+        await db_session.flush()
+
+        await refresh_leaderboard(db_session)
+        roi = await get_leaderboard_page(LeaderboardCategory.ROI, db_session)
+        attendance = await get_leaderboard_page(LeaderboardCategory.ATTENDANCE, db_session)
+        mvp = await get_leaderboard_page(LeaderboardCategory.MVP, db_session)
+
+        assert [row.fullname for row in roi.rows] == ["Player One"]
+        assert roi.rows[0].value == Decimal("100.00")
+        assert {row.fullname for row in attendance.rows} == {"Player One", "Player Two"}
+        assert [(row.fullname, row.value) for row in mvp.rows] == [("Player One", Decimal(1))]
+
+    async def test_refresh_replaces_previous_ranks(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _finished_game(db_session, multiple_users, {1: (1000, 2000), 2: (1000, 0)})
+        await refresh_leaderboard(db_session)
+        await _finished_game(db_session, multiple_users, {1: (1000, 0), 2: (1000, 3000)})
+
+        await refresh_leaderboard(db_session)
+        page = await get_leaderboard_page(LeaderboardCategory.NET, db_session)
+
+        assert [row.fullname for row in page.rows] == ["Player Two", "Player One"]
+
+
+class TestLeaderboardPagination:
+    async def test_keyset_pages_forward_and_back(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _finished_game(
+            db_session,
+            multiple_users,
+            {1: (1000, 4000), 2: (1000, 3000), 3: (1000, 2000), 4: (1000, 1000)},
+        )
+        await refresh_leaderboard(db_session)
+
+        first = await get_leaderboard_page(LeaderboardCategory.NET, db_session, page_size=3)
+        second = await get_leaderboard_page(
+            LeaderboardCategory.NET, db_session, after=first.rows[-1].position, page_size=3
+        )
+        back = await get_leaderboard_page(
+            LeaderboardCategory.NET, db_session, before=second.rows[0].position, page_size=3
+        )
+
+        assert [row.position for row in first.rows] == [1, 2, 3]
+        assert first.has_next and not first.has_prev
+        assert [row.position for row in second.rows] == [4]
+        assert second.has_prev and not second.has_next
+        assert [row.position for row in back.rows] == [1, 2, 3]
+        assert not back.has_prev and back.has_next
@@ -0,0 +1,46 @@
+"""Tests for the queued logging pipeline and handler name caching."""
+
+import gzip
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from bot.internal.config_dicts import GzipRotatingFileHandler, get_logging_config
+from bot.middlewares.logging_middleware import LoggingMiddleware
+
+
+def test_root_logs_only_through_queue():
+    config = get_logging_config("test")
+
+    assert config["loggers"]["root"]["handlers"] == ["queue"]
+    assert config["handlers"]["queue"]["handlers"] == ["stdout", "stderr", "file", "json_file"]
+    assert config["handlers"]["file"]["()"] is GzipRotatingFileHandler
+
+
+def test_rotated_files_are_compressed(tmp_path):
+    path = tmp_path / "bot.log"
+    handler = GzipRotatingFileHandler(path, maxBytes=200, backupCount=2, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        for line in range(12):
+            handler.emit(logging.makeLogRecord({"msg": f"line {line} " + "x" * 40}))
+    finally:
+        handler.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bot.log", "bot.log.1.gz", "bot.log.2.gz"]
+    assert gzip.decompress((tmp_path / "bot.log.1.gz").read_bytes()).startswith(b"line ")
+
+
+async def test_handler_name_resolved_once_per_handler():
+    middleware = LoggingMiddleware()
+    handler_object = SimpleNamespace()
+
+    async def stats_command(event, data):
+        return "ok"
+
+    with patch.object(LoggingMiddleware, "_get_name", wraps=middleware._get_name) as get_name:
+        for _ in range(3):
+            assert await middleware(stats_command, None, {"handler": handler_object}) == "ok"
+
+    assert get_name.call_count == 1
+    assert middleware._handler_name(stats_command, {"handler": handler_object}) == "stats_command"
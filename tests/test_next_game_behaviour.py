@@ -243,7 +243,7 @@ async def test_multiselect_new_game_uses_shared_settings_snapshot(monkeypatch):
     )
     user = SimpleNamespace(is_admin=True, fullname="Admin Boss")
     callback_data = SimpleNamespace(mode=KeyboardMode.NEW_GAME, game_id=0)
-    db_session = SimpleNamespace(add=Mock(), flush=AsyncMock())
+    db_session = SimpleNamespace(add=Mock(), flush=AsyncMock(), info={})
 
     await multiselect.multiselect_further_handler(
         callback=callback,
@@ -278,10 +278,11 @@ async def test_send_yearly_stats_if_enabled_uses_game_flag(monkeypatch):
 
     monkeypatch.setattr(game_finalization, "get_game_by_id", fake_get_game_by_id)
     monkeypatch.setattr(game_finalization, "get_yearly_stats", fake_get_yearly_stats)
+    monkeypatch.setattr(game_finalization, "get_stats_distribution", AsyncMock())
     monkeypatch.setattr(
         game_finalization,
         "generate_yearly_stats_report",
-        lambda year, summary, players: f"report:{year}",
+        lambda year, summary, players, distribution: f"report:{year}",
     )
 
     await game_finalization.send_yearly_stats_if_enabled(bot, 7, object())
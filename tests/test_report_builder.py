@@ -0,0 +1,106 @@
+"""Tests for splitting long reports into Telegram-sized messages."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from bot.internal.report_builder import (
+    ReportBuilder,
+    SendRateLimiter,
+    get_send_limiter,
+    send_chunks,
+    split_report,
+)
+
+
+class TestReportBuilder:
+    def test_short_report_is_one_chunk(self):
+        assert split_report("<b>Title</b>\nline one\nline two") == [
+            "<b>Title</b>\nline one\nline two"
+        ]
+
+    def test_breaks_between_lines(self):
+        lines = [f"line {index:02}" for index in range(10)]
+
+        chunks = split_report("\n".join(lines), limit=30)
+
+        assert all(len(chunk) <= 30 for chunk in chunks)
+        assert "\n".join(chunks).split("\n") == lines
+
+    def test_open_tags_are_closed_and_reopened(self):
+        text = "<b>Header</b>\n<pre>" + "\n".join(f"row {index}" for index in range(8)) + "</pre>"
+
+        chunks = split_report(text, limit=40)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        assert chunks[0].endswith("</pre>")
+        assert all(chunk.startswith("<pre>") for chunk in chunks[1:])
+        assert all(chunk.count("<pre>") == chunk.count("</pre>") for chunk in chunks)
+
+    def test_long_line_is_split_outside_tags_and_entities(self):
+        line = "start " + "<b>bold&amp;text</b> " * 10
+
+        chunks = split_report(line, limit=25)
+
+        assert all(len(chunk) <= 25 for chunk in chunks)
+        assert "".join(chunks).count("&amp;") == 10
+        for chunk in chunks:
+            assert chunk.count("<b>") == chunk.count("</b>")
+            assert "&amp" not in chunk.replace("&amp;", "")
+
+    def test_very_long_word_is_split_by_characters(self):
+        chunks = split_report("x" * 25, limit=10)
+
+        assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_blank_lines_do_not_start_a_chunk(self):
+        builder = ReportBuilder(limit=12)
+        builder.add("first line\n\nsecond line")
+
+        assert builder.chunks() == ["first line", "second line"]
+
+
+async def test_send_chunks_in_order_with_keyboard_on_last():
+    bot = SimpleNamespace(send_message=AsyncMock())
+    keyboard = object()
+
+    await send_chunks(bot, 5, ["one", "two", "three"], SendRateLimiter(0), reply_markup=keyboard)
+
+    calls = bot.send_message.await_args_list
+    assert [call.kwargs["text"] for call in calls] == ["one", "two", "three"]
+    assert "reply_markup" not in calls[0].kwargs
+    assert calls[-1].kwargs["reply_markup"] is keyboard
+
+
+async def test_concurrent_reports_share_the_bot_limiter(monkeypatch):
+    bot = SimpleNamespace(send_message=AsyncMock())
+    limiter = get_send_limiter(bot)
+    assert get_send_limiter(bot) is limiter
+    assert get_send_limiter(SimpleNamespace()) is not limiter
+    waits = 0
+
+    async def counting_wait() -> None:
+        nonlocal waits
+        waits += 1
+
+    monkeypatch.setattr(limiter, "wait", counting_wait)
+
+    await asyncio.gather(send_chunks(bot, 5, ["a", "b"]), send_chunks(bot, 6, ["c"]))
+
+    assert waits == 3
+
+
+async def test_concurrent_waiters_are_spaced_by_the_interval():
+    limiter = SendRateLimiter(0.05)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def waited() -> float:
+        await limiter.wait()
+        return loop.time() - started
+
+    delays = await asyncio.gather(*(waited() for _ in range(4)))
+
+    for index, delay in enumerate(sorted(delays)):
+        assert 0.05 * index - 0.01 <= delay < 0.05 * index + 0.04
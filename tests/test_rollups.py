@@ -0,0 +1,189 @@
+"""Tests for monthly rollups and date-range stats."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import (
+    get_range_stats,
+    parse_date_range,
+    rebuild_monthly_rollups,
+    refresh_month_rollups,
+)
+from bot.controllers.game.stats import _get_stats
+from bot.internal.context import GameStatus
+from database.models import Game, MonthlyGameRollup, MonthlyPlayerRollup, Record, User
+
+
+def _record(game: Game, user_id: int, buy_in: int, buy_out: int, roi: str) -> Record:
+    return Record(
+        game_id=game.id,
+        user_id=user_id,
+        buy_in=buy_in,
+        buy_out=buy_out,
+        ROI=Decimal(roi),
+    )
+
+
+async def _seed_history(db_session: AsyncSession, users: list[User]) -> list[Game]:
+    def finished(created_at: datetime, host: User, mvp: User, pot: int) -> Game:
+        return Game(
+            admin_id=users[0].id,
+            host_id=host.id,
+            status=GameStatus.FINISHED,
+            total_pot=pot,
+            mvp_id=mvp.id,
+            duration=3600,
+            created_at=created_at,
+        )
+
+    games = [
+        finished(datetime(2025, 9, 5, 20), users[1], users[0], 3000),
+        finished(datetime(2025, 9, 20, 20), users[1], users[2], 4000),
+        finished(datetime(2025, 11, 14, 20), users[2], users[2], 5000),
+        finished(datetime(2026, 5, 10, 20), users[1], users[1], 2000),
+        Game(
+            admin_id=users[0].id,
+            host_id=users[2].id,
+            status=GameStatus.ABORTED,
+            created_at=datetime(2025, 10, 1, 20),
+        ),
+    ]
+    db_session.add_all(games)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            _record(games[0], 1, 1000, 2500, "150.00"),
+            _record(games[0], 2, 2000, 500, "-75.00"),
+            _record(games[1], 1, 2000, 1000, "-50.00"),
+            _record(games[1], 3, 2000, 3000, "50.00"),
+            _record(games[2], 2, 2500, 3500, "40.00"),
+            _record(games[2], 3, 2500, 1500, "-40.00"),
+            _record(games[3], 1, 1000, 500, "-50.00"),
+            _record(games[3], 2, 1000, 1500, "50.00"),
+            Record(game_id=games[4].id, user_id=4, buy_in=1000),
+        ]
+    )
+    await db_session.flush()
+    await rebuild_monthly_rollups(db_session)
+    return games
+
+
+def _normalized(stats):
+    summary, players = stats
+    summary.top_host_names = sorted(summary.top_host_names)
+    summary.top_mvp_names = sorted(summary.top_mvp_names)
+    return summary, players
+
+
+class TestParseDateRange:
+    @pytest.mark.parametrize(
+        "text",
+        ["2025-09-01 2026-05-31", "2025-09-01..2026-05-31", " 2025-09-01 — 2026-05-31 "],
+    )
+    def test_accepts_separators(self, text: str):
+        assert parse_date_range(text) == (date(2025, 9, 1), date(2026, 5, 31))
+
+    @pytest.mark.parametrize(
+        "text", [None, "", "2025-09-01", "2026-05-31 2025-09-01", "2025-02-30 2025-03-01"]
+    )
+    def test_rejects_invalid(self, text: str | None):
+        assert parse_date_range(text) is None
+
+
+class TestRebuildMonthlyRollups:
+    async def test_buckets_finished_games_by_month(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _seed_history(db_session, multiple_users)
+
+        months = await db_session.scalars(
+            select(MonthlyGameRollup.month).order_by(MonthlyGameRollup.month)
+        )
+        september = await db_session.scalar(
+            select(MonthlyPlayerRollup).where(
+                MonthlyPlayerRollup.month == date(2025, 9, 1), MonthlyPlayerRollup.user_id == 1
+            )
+        )
+
+        assert list(months) == [date(2025, 9, 1), date(2025, 11, 1), date(2026, 5, 1)]
+        assert september.games_played == 2
+        assert september.total_buy_in == 3000
+        assert september.total_buy_out == 3500
+        assert september.mvp_count == 1
+        assert september.best_roi == Decimal("150.00")
+
+    async def test_refresh_month_replaces_rows(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        games = await _seed_history(db_session, multiple_users)
+        games[0].status = GameStatus.ABORTED
+        await db_session.flush()
+
+        await refresh_month_rollups(date(2025, 9, 17), db_session)
+        september = await db_session.scalar(
+            select(MonthlyGameRollup).where(MonthlyGameRollup.month == date(2025, 9, 1))
+        )
+        player_rows = await db_session.scalar(
+            select(func.count())
+            .select_from(MonthlyPlayerRollup)
+            .where(MonthlyPlayerRollup.month == date(2025, 9, 1))
+        )
+
+        assert september.games_count == 1
+        assert september.biggest_pot_game_id == games[1].id
+        assert player_rows == 3
+
+
+class TestGetRangeStats:
+    @pytest.mark.parametrize("year", [2025, 2026])
+    async def test_full_year_matches_sql_stats(
+        self, db_session: AsyncSession, multiple_users: list[User], year: int
+    ):
+        await _seed_history(db_session, multiple_users)
+
+        range_stats = await get_range_stats(date(year, 1, 1), date(year, 12, 31), db_session)
+        sql_stats = await _get_stats(year, db_session)
+
+        assert _normalized(range_stats) == _normalized(sql_stats)
+
+    async def test_partial_boundary_months_are_exact(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        games = await _seed_history(db_session, multiple_users)
+
+        summary, players = await get_range_stats(date(2025, 9, 10), date(2026, 5, 9), db_session)
+
+        assert summary.total_games == 2
+        assert summary.biggest_pot_game_id == games[2].id
+        assert summary.total_buy_in == 9000
+        assert summary.top_mvp_names == ["Player Three"]
+        assert summary.top_mvp_count == 2
+        assert [(player.user_id, player.net) for player in players] == [
+            (1, -1000),
+            (3, 0),
+            (2, 1000),
+        ]
+
+    async def test_range_inside_single_month(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _seed_history(db_session, multiple_users)
+
+        summary, players = await get_range_stats(date(2025, 9, 1), date(2025, 9, 5), db_session)
+
+        assert summary.total_games == 1
+        assert summary.best_single_game_roi == Decimal("150.00")
+        assert {player.user_id for player in players} == {1, 2}
+
+    async def test_empty_range(self, db_session: AsyncSession, multiple_users: list[User]):
+        await _seed_history(db_session, multiple_users)
+
+        summary, players = await get_range_stats(date(2024, 1, 1), date(2024, 12, 31), db_session)
+
+        assert summary.total_games == 0
+        assert summary.biggest_pot_game_id is None
+        assert players == []
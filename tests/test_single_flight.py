@@ -0,0 +1,167 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from bot.internal.single_flight import SingleFlight, configure_single_flight, single_flight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [1, 2, 3]
+
+        waiters = [asyncio.create_task(group.do("stats", compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert group.stats.waiting == 5
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert (group.stats.executions, group.stats.coalesced) == (1, 4)
+        assert (group.stats.waiting, group.stats.max_waiting) == (0, 5)
+
+    async def test_sequential_calls_recompute(self):
+        group = SingleFlight()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await group.do("stats", compute) == 1
+        assert await group.do("stats", compute) == 2
+
+    async def test_error_reaches_every_waiter(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def compute() -> None:
+            await release.wait()
+            raise RuntimeError("db down")
+
+        waiters = [asyncio.create_task(group.do("stats", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def compute() -> str:
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(group.do("stats", compute))
+        follower = asyncio.create_task(group.do("stats", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await follower == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+class FakeSession:
+    def __init__(self, name: str, writes: bool = False) -> None:
+        self.name = name
+        self.new = self.dirty = self.deleted = ()
+        self.info = {"db_writes": True} if writes else {}
+        self.closed = False
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def shared_sessions():
+    opened: list[FakeSession] = []
+
+    def factory() -> FakeSession:
+        opened.append(FakeSession(f"shared-{len(opened)}"))
+        return opened[-1]
+
+    configure_single_flight(factory)
+    yield opened
+    configure_single_flight(None)
+
+
+async def test_decorator_keys_on_arguments_but_not_session(shared_sessions):
+    release = asyncio.Event()
+    seen: list[int | None] = []
+
+    @single_flight
+    async def fake_stats(year: int | None, db_session: FakeSession) -> int | None:
+        seen.append(year)
+        await release.wait()
+        return year
+
+    waiters = [
+        asyncio.create_task(fake_stats(2025, FakeSession("a"))),
+        asyncio.create_task(fake_stats(2025, db_session=FakeSession("b"))),
+        asyncio.create_task(fake_stats(2026, FakeSession("c"))),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [2025, 2025, 2026]
+    assert sorted(seen) == [2025, 2026]
+    assert len(shared_sessions) == 2
+
+
+async def test_cancelled_leader_does_not_break_follower(shared_sessions):
+    release = asyncio.Event()
+
+    @single_flight
+    async def fake_stats(db_session: FakeSession) -> str:
+        await release.wait()
+        assert not db_session.closed
+        return db_session.name
+
+    leader_session = FakeSession("leader")
+    leader = asyncio.create_task(fake_stats(leader_session))
+    follower = asyncio.create_task(fake_stats(FakeSession("follower")))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    # the request middleware closes the cancelled caller's session
+    leader_session.closed = True
+    release.set()
+
+    assert await follower == "shared-0"
+    assert shared_sessions[0].closed
+
+
+async def test_caller_with_pending_writes_uses_its_own_session(shared_sessions):
+    @single_flight
+    async def fake_stats(db_session: FakeSession) -> str:
+        return db_session.name
+
+    assert await fake_stats(FakeSession("writer", writes=True)) == "writer"
+    assert await fake_stats(FakeSession("reader")) == "shared-0"
+
+
+async def test_calls_are_not_coalesced_without_session_factory():
+    @single_flight
+    async def fake_stats(db_session: FakeSession) -> str:
+        return db_session.name
+
+    assert await fake_stats(FakeSession("own")) == "own"
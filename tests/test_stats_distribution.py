@@ -0,0 +1,172 @@
+"""Tests for percentile and result-spread stats."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import generate_yearly_stats_report, get_stats_distribution
+from bot.controllers.game.reports import _format_distribution
+from bot.controllers.game.types import (
+    PlayerResultSpread,
+    StatsDistribution,
+    YearlySummary,
+    YearPotPercentiles,
+)
+from bot.internal.context import GameStatus
+from database.models import Game, Record, User
+
+
+async def _seed_games(db_session: AsyncSession, users: list[User]) -> None:
+    pots = [
+        (datetime(2025, 3, 1), 2000),
+        (datetime(2025, 4, 1), 4000),
+        (datetime(2024, 4, 1), 9000),
+    ]
+    games = [
+        Game(
+            admin_id=users[0].id,
+            host_id=users[1].id,
+            status=GameStatus.FINISHED,
+            total_pot=pot,
+            created_at=created_at,
+        )
+        for created_at, pot in pots
+    ]
+    db_session.add_all(games)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Record(game_id=games[0].id, user_id=1, buy_in=1000, buy_out=1500),
+            Record(game_id=games[0].id, user_id=2, buy_in=1000, buy_out=500),
+            Record(game_id=games[1].id, user_id=1, buy_in=1000, buy_out=0),
+            Record(game_id=games[1].id, user_id=2, buy_in=3000, buy_out=4000),
+            Record(game_id=games[2].id, user_id=3, buy_in=9000, buy_out=0),
+        ]
+    )
+    await db_session.flush()
+
+
+class TestGetStatsDistribution:
+    async def test_yearly_percentiles_and_spread(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _seed_games(db_session, multiple_users)
+
+        distribution = await get_stats_distribution(2025, db_session)
+
+        assert distribution.buy_in_median == Decimal("1000.00")
+        assert distribution.buy_in_p90 == Decimal("2400.00")
+        assert distribution.pot_p25 == Decimal("2500.00")
+        assert distribution.pot_median == Decimal("3000.00")
+        assert distribution.pot_p90 == Decimal("3800.00")
+        assert [
+            (spread.user_id, spread.net_stddev) for spread in distribution.result_spreads
+        ] == [(1, Decimal("1060.66")), (2, Decimal("1060.66"))]
+        assert distribution.pots_by_year == []
+
+    async def test_all_time_groups_pot_percentiles_by_year(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _seed_games(db_session, multiple_users)
+
+        distribution = await get_stats_distribution(None, db_session)
+
+        assert distribution.buy_in_median == Decimal("1000.00")
+        assert distribution.pot_median == Decimal("4000.00")
+        assert distribution.pots_by_year == [
+            YearPotPercentiles(
+                year=2024,
+                p25=Decimal("9000.00"),
+                median=Decimal("9000.00"),
+                p75=Decimal("9000.00"),
+                p90=Decimal("9000.00"),
+            ),
+            YearPotPercentiles(
+                year=2025,
+                p25=Decimal("2500.00"),
+                median=Decimal("3000.00"),
+                p75=Decimal("3500.00"),
+                p90=Decimal("3800.00"),
+            ),
+        ]
+
+    async def test_single_game_players_have_no_spread(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _seed_games(db_session, multiple_users)
+
+        distribution = await get_stats_distribution(2024, db_session)
+
+        assert distribution.pot_median == Decimal("9000.00")
+        assert distribution.result_spreads == []
+
+    async def test_empty_year(self, db_session: AsyncSession):
+        distribution = await get_stats_distribution(2030, db_session)
+
+        assert distribution.buy_in_median is None
+        assert distribution.pot_median is None
+        assert distribution.result_spreads == []
+
+
+def test_report_includes_distribution_section():
+    summary = YearlySummary(
+        total_games=2,
+        total_players=2,
+        biggest_pot=4000,
+        biggest_pot_game_id=2,
+        total_buy_in=6000,
+        total_duration_seconds=0,
+        best_single_game_roi=None,
+        best_single_game_roi_names=[],
+        top_mvp_names=[],
+        top_mvp_count=0,
+        top_host_names=[],
+        top_host_games=0,
+    )
+    distribution = StatsDistribution(
+        buy_in_median=Decimal("1000.00"),
+        buy_in_p90=Decimal("2400.00"),
+        pot_p25=Decimal("2500.00"),
+        pot_median=Decimal("3000.00"),
+        pot_p75=Decimal("3500.00"),
+        pot_p90=Decimal("3800.00"),
+        result_spreads=[
+            PlayerResultSpread(
+                user_id=2, fullname="Player Two", games_played=2, net_stddev=Decimal("1060.66")
+            ),
+            PlayerResultSpread(
+                user_id=1, fullname="Player One", games_played=2, net_stddev=Decimal("300.00")
+            ),
+        ],
+        pots_by_year=[],
+    )
+
+    report = generate_yearly_stats_report(2025, summary, [], distribution)
+
+    assert "Buy-in per player: median <b>1000</b>, p90 <b>2400</b>" in report
+    assert "p25 2500 · median <b>3000</b> · p75 3500 · p90 3800" in report
+    assert "Result spread (σ, most volatile first): Player Two 1061 · Player One 300" in report
+
+
+def test_all_time_report_lists_pot_percentiles_per_year():
+    distribution = StatsDistribution(
+        buy_in_median=None,
+        buy_in_p90=None,
+        pot_p25=Decimal("2500.00"),
+        pot_median=Decimal("4000.00"),
+        pot_p75=Decimal("6500.00"),
+        pot_p90=Decimal("8000.00"),
+        result_spreads=[],
+        pots_by_year=[
+            YearPotPercentiles(2024, *[Decimal("9000.00")] * 4),
+            YearPotPercentiles(
+                2025, Decimal("2500.00"), Decimal("3000.00"), Decimal("3500.00"), Decimal("3800.00")
+            ),
+        ],
+    )
+
+    lines = _format_distribution(distribution)
+
+    assert "  2024: p25 9000 · median <b>9000</b> · p75 9000 · p90 9000" in lines
+    assert "  2025: p25 2500 · median <b>3000</b> · p75 3500 · p90 3800" in lines
@@ -0,0 +1,162 @@
+"""Tests for incrementally maintained player streaks."""
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.controllers.game import (
+    apply_game_to_streaks,
+    get_group_streak_records,
+    get_player_streaks,
+    rebuild_streaks,
+)
+from bot.internal.context import GameStatus
+from database.models import Game, Record, User
+
+
+async def _finished_game(
+    db_session: AsyncSession, users: list[User], results: dict[int, int]
+) -> Game:
+    game = Game(admin_id=users[0].id, host_id=users[0].id, status=GameStatus.FINISHED)
+    db_session.add(game)
+    await db_session.flush()
+    for user_id, net in results.items():
+        db_session.add(
+            Record(
+                game_id=game.id,
+                user_id=user_id,
+                buy_in=1000,
+                buy_out=1000 + net,
+                net_profit=net,
+            )
+        )
+    await db_session.flush()
+    return game
+
+
+async def _play(db_session: AsyncSession, users: list[User], results: dict[int, int]) -> Game:
+    game = await _finished_game(db_session, users, results)
+    await apply_game_to_streaks(game.id, db_session)
+    return game
+
+
+class TestApplyGameToStreaks:
+    async def test_tracks_win_and_loss_streaks(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 500, 2: -500})
+        await _play(db_session, multiple_users, {1: 300, 2: -300})
+        await _play(db_session, multiple_users, {1: -200, 2: 200})
+
+        first = await get_player_streaks(1, db_session)
+        second = await get_player_streaks(2, db_session)
+
+        assert first is not None and second is not None
+        assert first.current_win_streak == 0
+        assert first.longest_win_streak == 2
+        assert first.current_loss_streak == 1
+        assert first.best_profit == 500
+        assert second.longest_loss_streak == 2
+        assert second.current_win_streak == 1
+
+    async def test_break_even_resets_both_streaks(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 100, 2: -100})
+        await _play(db_session, multiple_users, {1: 0, 2: 0})
+
+        streaks = await get_player_streaks(1, db_session)
+
+        assert streaks is not None
+        assert streaks.current_win_streak == 0
+        assert streaks.current_loss_streak == 0
+        assert streaks.longest_win_streak == 1
+
+    async def test_missed_game_resets_attendance(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 100, 2: -100})
+        await _play(db_session, multiple_users, {1: 100, 2: -100})
+        await _play(db_session, multiple_users, {2: 100, 3: -100})
+
+        first = await get_player_streaks(1, db_session)
+        second = await get_player_streaks(2, db_session)
+
+        assert first is not None and second is not None
+        assert first.current_attendance_streak == 0
+        assert first.longest_attendance_streak == 2
+        assert second.current_attendance_streak == 3
+
+    async def test_reapplying_game_is_ignored(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        game = await _play(db_session, multiple_users, {1: 100, 2: -100})
+        await apply_game_to_streaks(game.id, db_session)
+
+        streaks = await get_player_streaks(1, db_session)
+
+        assert streaks is not None
+        assert streaks.current_win_streak == 1
+
+    async def test_returns_none_for_player_without_games(
+        self, db_session: AsyncSession, sample_user: User
+    ):
+        assert await get_player_streaks(sample_user.id, db_session) is None
+
+
+class TestRebuildStreaks:
+    async def test_matches_incremental_state(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 500, 2: -500})
+        await _play(db_session, multiple_users, {1: -100, 3: 100})
+        await _play(db_session, multiple_users, {2: 50, 3: -50})
+        incremental = {
+            user.id: await get_player_streaks(user.id, db_session) for user in multiple_users
+        }
+
+        await rebuild_streaks(db_session)
+        rebuilt = {
+            user.id: await get_player_streaks(user.id, db_session) for user in multiple_users
+        }
+
+        assert rebuilt == incremental
+
+    async def test_rolls_back_removed_game(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 100, 2: -100})
+        game = await _play(db_session, multiple_users, {1: 900, 2: -900})
+
+        await db_session.execute(delete(Record).where(Record.game_id == game.id))
+        await db_session.execute(delete(Game).where(Game.id == game.id))
+        await rebuild_streaks(db_session)
+
+        streaks = await get_player_streaks(1, db_session)
+
+        assert streaks is not None
+        assert streaks.longest_win_streak == 1
+        assert streaks.best_profit == 100
+
+
+class TestGroupStreakRecords:
+    async def test_reports_holders_with_ties(
+        self, db_session: AsyncSession, multiple_users: list[User]
+    ):
+        await _play(db_session, multiple_users, {1: 300, 2: -300})
+        await _play(db_session, multiple_users, {2: 300, 1: -300})
+
+        records = await get_group_streak_records(db_session)
+
+        assert records.best_profit is not None
+        assert records.best_profit.value == 300
+        assert records.best_profit.names == sorted(
+            [multiple_users[0].fullname, multiple_users[1].fullname]
+        )
+        assert records.longest_attendance_streak is not None
+        assert records.longest_attendance_streak.value == 2
+
+    async def test_empty_history(self, db_session: AsyncSession):
+        records = await get_group_streak_records(db_session)
+
+        assert records.longest_win_streak is None
+        assert records.best_profit is None
@@ -0,0 +1,79 @@
+"""Tests for sampled, queued update dumps."""
+
+import json
+from unittest.mock import MagicMock
+
+from aiogram.types import Update
+
+from bot.internal.update_dump import UpdateDumper, parse_update_types
+from bot.middlewares.updates_dumper_middleware import UpdatesDumperMiddleware
+
+
+def _update(update_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": 1, "type": "private"},
+                "text": "/start",
+            },
+        }
+    )
+
+
+class TestUpdateDumper:
+    def test_type_filter_and_sampling(self):
+        filtered = UpdateDumper(MagicMock(), update_types=parse_update_types(" message, ,poll"))
+        muted = UpdateDumper(MagicMock(), sample_rate=0.0)
+
+        assert filtered.update_types == {"message", "poll"}
+        assert filtered.wants("message")
+        assert not filtered.wants("callback_query")
+        assert not any(muted.wants("message") for _ in range(100))
+
+    def test_writes_json_lines_from_background_thread(self, tmp_path):
+        path = tmp_path / "dumps" / "updates.jsonl"
+        dumper = UpdateDumper(path)
+        dumper.start()
+
+        dumper.submit(_update(1))
+        dumper.submit(_update(2))
+        dumper.stop()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["update_id"] for line in lines] == [1, 2]
+        assert lines[0]["message"]["text"] == "/start"
+        assert dumper.written == 2
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        dumper = UpdateDumper(tmp_path / "updates.jsonl", queue_size=1)
+
+        dumper.submit(_update(1))
+        dumper.submit(_update(2))
+
+        assert dumper.dropped == 1
+
+
+class TestUpdatesDumperMiddleware:
+    async def test_disabled_dumper_does_not_serialize(self):
+        event = MagicMock(event_type="message")
+
+        async def handler(event, data):
+            return "ok"
+
+        assert await UpdatesDumperMiddleware()(handler, event, {}) == "ok"
+        event.model_dump_json.assert_not_called()
+
+    async def test_sampled_update_is_queued(self, tmp_path):
+        dumper = UpdateDumper(tmp_path / "updates.jsonl", update_types=frozenset({"message"}))
+        middleware = UpdatesDumperMiddleware(dumper)
+
+        async def handler(event, data):
+            return None
+
+        await middleware(handler, _update(1), {})
+        await middleware(handler, MagicMock(event_type="callback_query"), {})
+
+        assert dumper._queue.qsize() == 1